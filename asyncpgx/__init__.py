@@ -1,2 +1,4 @@
 """Public interface."""
-from asyncpgx.connection import ConnectionX, connect, create_pool
+from asyncpgx.connection import ConnectionX, connect, create_pool, create_routing_pool
+from asyncpgx.pool import PoolX
+from asyncpgx.routing import RoutingPool
@@ -0,0 +1,111 @@
+"""Module with caching primitives."""
+import collections
+import typing
+
+
+KeyT = typing.TypeVar('KeyT')
+ValueT = typing.TypeVar('ValueT')
+
+_MISSING = object()
+
+
+class CacheInfo(typing.NamedTuple):
+    """Snapshot of the cache statistics."""
+
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+class LRUCache(typing.Generic[KeyT, ValueT]):
+    """Size-bounded mapping with the least recently used eviction policy.
+
+    Zero `maxsize` disables caching at all: every lookup is a miss and
+    nothing is stored.
+    """
+
+    __slots__ = ('_data', '_maxsize', '_hits', '_misses', '_evictions')
+
+    def __init__(self, maxsize: int):
+        if maxsize < 0:
+            raise ValueError(f'Cache size must be non-negative, got {maxsize}')
+        self._data: 'collections.OrderedDict[KeyT, ValueT]' = collections.OrderedDict()
+        self._maxsize = maxsize
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    @property
+    def maxsize(self) -> int:
+        """Maximum number of the cached entries."""
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, maxsize: int) -> None:
+        if maxsize < 0:
+            raise ValueError(f'Cache size must be non-negative, got {maxsize}')
+        self._maxsize = maxsize
+        self._shrink()
+
+    def get(self, key: KeyT, default: typing.Optional[ValueT] = None) -> typing.Optional[ValueT]:
+        """Return cached value (or `default`) and mark the entry as recently
+        used."""
+        value = self._data.get(key, _MISSING)
+        if value is _MISSING:
+            self._misses += 1
+            return default
+
+        self._hits += 1
+        self._data.move_to_end(key)
+        return typing.cast(ValueT, value)
+
+    def put(self, key: KeyT, value: ValueT) -> None:
+        """Store the value, evicting the least recently used entries if
+        needed."""
+        if not self._maxsize:
+            return
+
+        self._data[key] = value
+        self._data.move_to_end(key)
+        self._shrink()
+
+    def get_or_create(self, key: KeyT, factory: typing.Callable[[KeyT], ValueT]) -> ValueT:
+        """Return cached value or build it with `factory` and store it."""
+        value = self._data.get(key, _MISSING)
+        if value is not _MISSING:
+            self._hits += 1
+            self._data.move_to_end(key)
+            return typing.cast(ValueT, value)
+
+        self._misses += 1
+        new_value = factory(key)
+        self.put(key, new_value)
+        return new_value
+
+    def pop(self, key: KeyT) -> typing.Optional[ValueT]:
+        """Remove the entry from the cache and return its value."""
+        return self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all the entries and reset the statistics."""
+        self._data.clear()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def info(self) -> CacheInfo:
+        """Return the cache statistics."""
+        return CacheInfo(self._hits, self._misses, self._evictions, self._maxsize, len(self._data))
+
+    def _shrink(self) -> None:
+        while len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+            self._evictions += 1
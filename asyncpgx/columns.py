@@ -0,0 +1,138 @@
+"""Module with tools for the columnar query results."""
+import datetime
+import typing
+
+import asyncpg
+import asyncpg.prepared_stmt
+
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None  # type: ignore
+
+
+# NumPy dtypes for the PostgreSQL types which values could be stored in the NumPy arrays
+NUMPY_DTYPES = {
+    'bool': 'bool',
+    'int2': 'int16',
+    'int4': 'int32',
+    'int8': 'int64',
+    'float4': 'float32',
+    'float8': 'float64',
+    'date': 'datetime64[D]',
+    'timestamp': 'datetime64[us]',
+    'timestamptz': 'datetime64[us]',
+}
+# column name to the list or NumPy array of its values
+Columns = typing.Dict[str, typing.Any]
+
+
+class ColumnsBuilder:
+    """Accumulates rows of the query result into columns.
+
+    With `use_numpy` columns of the numeric, boolean, date and timestamp
+    types without NULL values are converted to the NumPy arrays
+    (timestamps with time zone are converted to UTC). Every batch is
+    converted when it's added, so the values of such columns are not
+    kept as Python objects.
+    """
+
+    __slots__ = ('_attributes', '_dtypes', '_columns')
+
+    def __init__(self, attributes: typing.Sequence[typing.Any], use_numpy: typing.Optional[bool] = None):
+        if use_numpy is None:
+            use_numpy = numpy is not None
+        elif use_numpy and numpy is None:
+            raise RuntimeError('NumPy is not installed')
+
+        self._attributes = attributes
+        # NumPy dtypes of the columns converted to the arrays, `None` for the columns kept in the lists
+        self._dtypes: typing.List[typing.Optional[str]] = [
+            NUMPY_DTYPES.get(attribute.type.name) if use_numpy else None for attribute in attributes
+        ]
+        # values of the list columns or arrays of the batches of the NumPy columns
+        self._columns: typing.List[typing.List] = [[] for _ in attributes]
+
+    def add_rows(self, rows: typing.Sequence[asyncpg.Record]) -> None:
+        """Append the batch of rows to the columns."""
+        if not rows:
+            return
+        for index, values in enumerate(zip(*rows)):
+            dtype = self._dtypes[index]
+            if dtype is not None and None in values:
+                # column with NULL values couldn't be stored in the array
+                self._columns[index] = self._get_values(index)
+                self._dtypes[index] = dtype = None
+
+            if dtype is None:
+                self._columns[index].extend(values)
+                continue
+            if self._attributes[index].type.name == 'timestamptz':
+                values = tuple(value.astimezone(datetime.timezone.utc).replace(tzinfo=None) for value in values)
+            self._columns[index].append(numpy.array(values, dtype=dtype))
+
+    def _get_values(self, index: int) -> typing.List:
+        """Convert arrays of the column batches back to the list of
+        values."""
+        chunks = self._columns[index]
+        if not chunks:
+            return []
+        values = numpy.concatenate(chunks).tolist()
+        if self._attributes[index].type.name == 'timestamptz':
+            values = [value.replace(tzinfo=datetime.timezone.utc) for value in values]
+        return typing.cast(typing.List, values)
+
+    def build(self) -> Columns:
+        """Return mapping of the column name to its values."""
+        columns: Columns = {}
+        for attribute, dtype, values in zip(self._attributes, self._dtypes, self._columns):
+            if dtype is None:
+                columns[attribute.name] = values
+            elif len(values) == 1:
+                columns[attribute.name] = values[0]
+            else:
+                columns[attribute.name] = numpy.concatenate(values) if values else numpy.array([], dtype=dtype)
+        return columns
+
+
+# pylint: disable=too-many-arguments
+async def fetch_columns(
+    connection: asyncpg.Connection,
+    stmt: asyncpg.prepared_stmt.PreparedStatement,
+    args: typing.Sequence,
+    *,
+    batch_size: int,
+    use_numpy: typing.Optional[bool],
+    timeout: typing.Optional[float],
+) -> Columns:
+    """Fetch result of the prepared statement into columns reading it by
+    batches with the server-side cursor.
+
+    Cursor requires transaction, so it's started if there is no one.
+    """
+    if batch_size < 1:
+        raise ValueError(f'Batch size must be positive, got {batch_size}')
+
+    builder = ColumnsBuilder(stmt.get_attributes(), use_numpy)
+    if connection.is_in_transaction():
+        await _fetch_rows(stmt, args, builder, batch_size, timeout)
+    else:
+        async with connection.transaction():
+            await _fetch_rows(stmt, args, builder, batch_size, timeout)
+    return builder.build()
+
+
+async def _fetch_rows(
+    stmt: asyncpg.prepared_stmt.PreparedStatement,
+    args: typing.Sequence,
+    builder: ColumnsBuilder,
+    batch_size: int,
+    timeout: typing.Optional[float],
+) -> None:
+    cursor = await stmt.cursor(*args, timeout=timeout)
+    while True:
+        rows = await cursor.fetch(batch_size, timeout=timeout)
+        builder.add_rows(rows)
+        if len(rows) < batch_size:
+            return
@@ -1,12 +1,29 @@
 """Module with extensions of asyncpg `Connection` class."""
+import asyncio
+import collections.abc
+import contextlib
 import functools
+import itertools
 import typing
 
 import asyncpg
 from asyncpg import cursor
 
+from asyncpgx import columns as columns_module
+from asyncpgx import cursors as cursors_module
+from asyncpgx import exceptions
+from asyncpgx import limits
+from asyncpgx import observers as observers_module
+from asyncpgx import pool as pool_module
 from asyncpgx import prepared_statement
 from asyncpgx import query as query_module
+from asyncpgx import registry as registry_module
+from asyncpgx import result_cache as result_cache_module
+from asyncpgx import routing as routing_module
+from asyncpgx import rows as rows_module
+
+
+T = typing.TypeVar('T')
 
 
 class ConnectionX(asyncpg.connection.Connection):
@@ -16,119 +33,800 @@ class ConnectionX(asyncpg.connection.Connection):
     ones
     """
 
-    def _prepare_asyncpg_parameters(
-        self, query: str, args: typing.Any, converter: query_module.QueryParamsConverter
-    ) -> typing.Tuple[str, typing.List]:
+    #: Skip the unused arguments check for the named queries (missing
+    #: arguments are reported anyway). Could be set on the subclass or
+    #: on the particular connection.
+    trusted_arguments: bool = False
+    #: Map every occurrence of the same named parameter to the single
+    #: positional one, so its value is sent only once.
+    deduplicate_params: bool = False
+    #: Mode of the list parameters like `WHERE id IN :ids`:
+    #: `query.LIST_PARAMS_ANY` passes them as arrays to `= ANY(...)`,
+    #: `query.LIST_PARAMS_EXPAND` expands them to the separate parameters
+    #: (`ANY` is used where the values aren't known beforehand, like in
+    #: `named_executemany` and `named_prepare`). Disabled by default.
+    list_params: typing.Optional[str] = None
+    #: Receivers of the named queries events (see `observers.QueryObserver`).
+    #: Events are sent by `named_execute`, `named_executemany`, `named_fetch`,
+    #: `named_fetchval`, `named_fetchrow` and the same methods of the prepared statements.
+    observers: typing.Sequence[observers_module.QueryObserver] = ()
+
+    def _parse_query(
+        self, query: str, args: typing.Optional[query_module.Arguments] = None
+    ) -> query_module.ParsedQuery:
+        """Translate high-level query according to the connection
+        options."""
+        if (
+            isinstance(query, registry_module.RegisteredQuery)
+            and query.deduplicate_params == self.deduplicate_params
+            and (self.list_params is None or not query.parsed_query.list_params)
+        ):
+            return query.parsed_query
+        if self.list_params is None:
+            return query_module.parse_query(query, self.deduplicate_params)
+        return query_module.parse_list_query(query, args, self.deduplicate_params, self.list_params)
+
+    def _prepare_asyncpg_parameters(self, query: str, args: query_module.Arguments) -> typing.Tuple[str, typing.Tuple]:
         """Prepare high-level query and arguments to underlying asyncpg
         backend."""
-        converted_query, params_order_list = query_module.construct_asyncpg_query(query)
-        return converted_query, converter.prepare_asyncpg_args(args, params_order_list)
+        parsed_query = self._parse_query(query, args)
+        if self.trusted_arguments:
+            return parsed_query.converted_query, parsed_query.binder.bind_trusted(args)
+        return parsed_query.converted_query, parsed_query.binder.bind(args)
+
+    async def _execute_observed(
+        self,
+        method: str,
+        query: str,
+        args: typing.Any,
+        execute: typing.Callable[[str, typing.Any], typing.Awaitable[T]],
+    ) -> T:
+        """Execute the named query measuring its phases and notify
+        `observers`.
 
-    async def named_execute(self, query: str, args: typing.Dict, timeout: typing.Optional[float] = None) -> str:
+        `execute` receives the converted query and bound arguments (the
+        list of them for `executemany`).
+        """
+        cache_misses = query_module.QUERY_CACHE.info().misses
+        with observers_module.ObservedQuery(
+            self.observers, method, query, None if method == 'executemany' else args
+        ) as observed_query:
+            if method == 'executemany':
+                parsed_query = self._parse_query(query)
+                observed_query.cache_hit = query_module.QUERY_CACHE.info().misses == cache_misses
+                observed_query.mark()
+                asyncpg_args = parsed_query.binder.bind_many(args, trusted=self.trusted_arguments)
+            else:
+                parsed_query = self._parse_query(query, args)
+                observed_query.cache_hit = query_module.QUERY_CACHE.info().misses == cache_misses
+                observed_query.mark()
+                binder = parsed_query.binder
+                asyncpg_args = binder.bind_trusted(args) if self.trusted_arguments else binder.bind(args)
+            observed_query.mark()
+            observed_query.result = await execute(parsed_query.converted_query, asyncpg_args)
+            return typing.cast(T, observed_query.result)
+
+    async def named_execute(
+        self, query: str, args: query_module.Arguments, timeout: typing.Optional[float] = None
+    ) -> str:
         """Extended versions of `execute` with support of the named parameters.
 
         :param query: SQL query to execute (could include named parameters).
-        :param args: Dict with the parameters values.
+        :param args: Dict (or other mapping or object) with the parameters values.
         :param timeout: Optional timeout value in seconds.
         """
-        converted_query, asyncpg_args = self._prepare_asyncpg_parameters(
-            query, args, query_module.QueryParamsDictConverter()
-        )
+        if self.observers:
+            execute = super().execute
+            return await self._execute_observed(
+                'execute',
+                query,
+                args,
+                lambda converted_query, asyncpg_args: execute(converted_query, *asyncpg_args, timeout=timeout),
+            )
+
+        converted_query, asyncpg_args = self._prepare_asyncpg_parameters(query, args)
         query_result: str = await super().execute(converted_query, *asyncpg_args, timeout=timeout)
         return query_result
 
-    async def named_executemany(self, query: str, args: typing.List, *, timeout: typing.Optional[float] = None) -> None:
+    async def named_executemany(
+        self,
+        query: str,
+        args: typing.Iterable[query_module.Arguments],
+        *,
+        timeout: typing.Optional[float] = None,
+        use_copy: bool = False,
+    ) -> None:
         """Extended versions of `executemany` with support of the named
         parameters.
 
         :param query: SQL query to execute (could include named parameters).
-        :param args: List of dicts with the parameters values.
+        :param args: List of dicts (or other mappings or objects) with the parameters values.
         :param timeout: Optional timeout value in seconds.
+        :param use_copy: Load the rows with the `COPY` protocol, which is much faster for big batches.
+            Supported only for the plain `INSERT INTO table (columns) VALUES (:params)` queries.
+        """
+        if self.observers and not use_copy:
+            executemany = super().executemany
+            return await self._execute_observed(
+                'executemany', query, args, functools.partial(executemany, timeout=timeout)
+            )
+
+        parsed_query = self._parse_query(query)
+        if use_copy:
+            insert_query = parsed_query.insert_query
+            if insert_query is None:
+                raise exceptions.UnsupportedQueryError(f'Only plain INSERT queries could be run with COPY: {query}')
+            await self._copy_bound_records(
+                insert_query.table_name,
+                args,
+                insert_query.columns,
+                insert_query.binder,
+                schema_name=insert_query.schema_name,
+                timeout=timeout,
+            )
+            return None
+
+        asyncpg_args = parsed_query.binder.bind_many(args, trusted=self.trusted_arguments)
+        query_result: None = await super().executemany(parsed_query.converted_query, asyncpg_args, timeout=timeout)
+        return query_result
+
+    async def named_executemany_returning(
+        self,
+        query: str,
+        args: typing.Iterable[query_module.Arguments],
+        *,
+        chunk_size: int = query_module.DEFAULT_BATCH_SIZE,
+        timeout: typing.Optional[float] = None,
+    ) -> typing.List[asyncpg.Record]:
+        """Version of `named_executemany` returning rows of the `RETURNING`
+        clause in the order of the input rows.
+
+        Plain single row `INSERT ... VALUES (...)` queries (without `ON
+        CONFLICT` clause and subqueries) are sent in chunks of `chunk_size`
+        rows with one statement per chunk (see `named_bulk_fetch`). Other
+        ones are executed row by row with one prepared statement: `UPDATE
+        ... RETURNING`, `INSERT ... ON CONFLICT DO UPDATE` (which fails if
+        one statement updates the same row twice) and queries with
+        subqueries (which don't see the rows inserted by the same
+        statement). All the rows are executed in one transaction.
+
+        Chunked inserts still differ from the row by row ones in the
+        statement level triggers, which are fired once per chunk, and in
+        the functions reading the target table, which see it as it was
+        before the chunk.
+
+        :param query: SQL query to execute (could include named parameters).
+        :param args: List of dicts (or other mappings or objects) with the parameters values.
+        :param chunk_size: Number of rows sent with one statement.
+        :param timeout: Optional timeout value in seconds for the every statement.
         """
-        converted_query, asyncpg_args = self._prepare_asyncpg_parameters(
-            query, args, query_module.QueryParamsListDictConverter()
+        bulk_parameters = None
+        unnest_query = query_module.parse_query(query, deduplicate_params=True).unnest_query
+        if unnest_query is not None and not unnest_query.on_conflict and not unnest_query.subquery:
+            # queries with the array parameters are executed row by row
+            with contextlib.suppress(exceptions.UnsupportedQueryError):
+                bulk_parameters = await self._prepare_bulk_parameters(query, args, chunk_size, timeout)
+
+        query_result: typing.List[asyncpg.Record] = []
+        if bulk_parameters is not None:
+            bulk_query, columns_chunks = bulk_parameters
+            async with self.transaction():
+                for columns in columns_chunks:
+                    query_result.extend(await super().fetch(bulk_query, *columns, timeout=timeout))
+            return query_result
+
+        parsed_query = self._parse_query(query)
+        asyncpg_args = parsed_query.binder.bind_many(args, trusted=self.trusted_arguments)
+        stmt = await self._prepare(parsed_query.converted_query, timeout=timeout, use_cache=True)
+        async with self.transaction():
+            for row_args in asyncpg_args:
+                query_result.extend(await stmt.fetch(*row_args, timeout=timeout))
+        return query_result
+
+    async def named_executemany_stream(
+        self,
+        query: str,
+        args: typing.Union[typing.Iterable[query_module.Arguments], typing.AsyncIterable[query_module.Arguments]],
+        *,
+        batch_size: int = query_module.DEFAULT_BATCH_SIZE,
+        timeout: typing.Optional[float] = None,
+        transaction: bool = True,
+    ) -> int:
+        """Streaming version of `named_executemany`.
+
+        Arguments are bound lazily and sent in batches of `batch_size`,
+        so memory usage doesn't depend on the number of rows.
+
+        With `transaction` all the batches are executed in one transaction,
+        so nothing is committed (and its locks are held) until the source is
+        exhausted and any failure rolls back all the rows. Otherwise every
+        batch is committed separately (it's a savepoint inside the outer
+        transaction), which suits the unbounded sources: on failure the
+        failed batch is rolled back, while the previous ones are kept.
+
+        :param query: SQL query to execute (could include named parameters).
+        :param args: Iterable or async iterable of dicts (or other mappings or objects) with the parameters values.
+        :param batch_size: Number of rows sent with one `executemany` call.
+        :param timeout: Optional timeout value in seconds for the every batch.
+        :param transaction: Execute all the batches in one transaction.
+        :return: Number of the processed rows.
+        """
+        if transaction:
+            async with self.transaction():
+                return await self._executemany_batches(query, args, batch_size, timeout)
+        return await self._executemany_batches(query, args, batch_size, timeout, batch_transaction=True)
+
+    async def _executemany_batches(
+        self,
+        query: str,
+        args: typing.Union[typing.Iterable[query_module.Arguments], typing.AsyncIterable[query_module.Arguments]],
+        batch_size: int,
+        timeout: typing.Optional[float],
+        batch_transaction: bool = False,
+    ) -> int:
+        parsed_query = self._parse_query(query)
+        bind = parsed_query.binder.bind_trusted if self.trusted_arguments else parsed_query.binder.bind
+        rows_count = 0
+        async for batch in _iterate_batches(args, batch_size):
+            asyncpg_args = [bind(row) for row in batch]
+            if batch_transaction:
+                async with self.transaction():
+                    await super().executemany(parsed_query.converted_query, asyncpg_args, timeout=timeout)
+            else:
+                await super().executemany(parsed_query.converted_query, asyncpg_args, timeout=timeout)
+            rows_count += len(batch)
+
+        return rows_count
+
+    async def named_bulk_execute(
+        self,
+        query: str,
+        args: typing.Union[typing.Iterable[query_module.Arguments], typing.Mapping[str, typing.Any]],
+        *,
+        chunk_size: int = query_module.DEFAULT_BATCH_SIZE,
+        timeout: typing.Optional[float] = None,
+    ) -> int:
+        """Execute single row `INSERT ... VALUES (...)` query with the named
+        parameters for many rows at once.
+
+        The query is rewritten to `INSERT ... SELECT ... FROM unnest(...)`,
+        so every chunk of rows is sent with one statement. `ON CONFLICT` and
+        `RETURNING` clauses are supported. All the chunks are executed in one
+        transaction.
+
+        :param query: SQL query to execute (could include named parameters).
+        :param args: Iterable of dicts (or other mappings or objects) with the parameters values
+            or dict with the lists of the parameters values.
+        :param chunk_size: Number of rows sent with one statement.
+        :param timeout: Optional timeout value in seconds for the every chunk.
+        :return: Number of the affected rows.
+        """
+        bulk_query, columns_chunks = await self._prepare_bulk_parameters(query, args, chunk_size, timeout)
+        rows_count = 0
+        async with self.transaction():
+            for columns in columns_chunks:
+                status: str = await super().execute(bulk_query, *columns, timeout=timeout)
+                rows_count += int(status.rsplit(' ', 1)[-1])
+
+        return rows_count
+
+    async def named_bulk_fetch(
+        self,
+        query: str,
+        args: typing.Union[typing.Iterable[query_module.Arguments], typing.Mapping[str, typing.Any]],
+        *,
+        chunk_size: int = query_module.DEFAULT_BATCH_SIZE,
+        timeout: typing.Optional[float] = None,
+    ) -> typing.List[asyncpg.Record]:
+        """Version of `named_bulk_execute` returning rows of the `RETURNING`
+        clause in the order of the input rows.
+
+        :param query: SQL query to execute (could include named parameters).
+        :param args: Iterable of dicts (or other mappings or objects) with the parameters values
+            or dict with the lists of the parameters values.
+        :param chunk_size: Number of rows sent with one statement.
+        :param timeout: Optional timeout value in seconds for the every chunk.
+        """
+        bulk_query, columns_chunks = await self._prepare_bulk_parameters(query, args, chunk_size, timeout)
+        query_result: typing.List[asyncpg.Record] = []
+        async with self.transaction():
+            for columns in columns_chunks:
+                query_result.extend(await super().fetch(bulk_query, *columns, timeout=timeout))
+
+        return query_result
+
+    async def _prepare_bulk_parameters(
+        self,
+        query: str,
+        args: typing.Union[typing.Iterable[query_module.Arguments], typing.Mapping[str, typing.Any]],
+        chunk_size: int,
+        timeout: typing.Optional[float],
+    ) -> typing.Tuple[str, typing.Iterator[typing.List[typing.Sequence]]]:
+        """Prepare `unnest` query and chunks of the parameters arrays."""
+        if chunk_size < 1:
+            raise ValueError(f'Chunk size must be positive, got {chunk_size}')
+        parsed_query = query_module.parse_query(query, deduplicate_params=True)
+        unnest_query = parsed_query.unnest_query
+        if unnest_query is None:
+            raise exceptions.UnsupportedQueryError(
+                f'Only single row INSERT ... VALUES queries could be run in bulk: {query}'
+            )
+
+        # types of the parameters are taken from the original query
+        stmt = await self._prepare(parsed_query.converted_query, timeout=timeout, use_cache=True)
+        params_types = []
+        for param_type in stmt.get_parameters():
+            if param_type.kind == 'array':
+                raise exceptions.UnsupportedQueryError(f'Array parameters could not be run in bulk: {query}')
+            params_types.append(
+                f'{query_module.quote_identifier(param_type.schema)}.{query_module.quote_identifier(param_type.name)}'
+            )
+
+        binder = unnest_query.binder
+        bind = binder.bind_trusted if self.trusted_arguments else binder.bind
+        return unnest_query.render(params_types), _iterate_columns_chunks(args, bind, chunk_size)
+
+    # pylint: disable=redefined-builtin
+    async def named_copy_from_query(
+        self,
+        query: str,
+        args: query_module.Arguments,
+        *,
+        output: typing.Any,
+        timeout: typing.Optional[float] = None,
+        format: typing.Optional[str] = None,
+        **copy_options: typing.Any,
+    ) -> str:
+        """Extended version of `copy_from_query` with support of the named
+        parameters.
+
+        Result of the query is exported with `COPY (query) TO STDOUT` and
+        written to the output chunk by chunk as it's received, so memory
+        usage doesn't depend on the result size. Trailing semicolons and
+        comments of the query are dropped.
+
+        :param query: SQL query to export (could include named parameters).
+        :param args: Dict (or other mapping or object) with the parameters values.
+        :param output: Path, file-like object or coroutine function receiving the chunks of data.
+        :param timeout: Optional timeout value in seconds.
+        :param format: Data format (`text`, `csv` or `binary`).
+        :param copy_options: Other `COPY` options of the asyncpg `copy_from_query` (like `header` or `delimiter`).
+        :return: Status of the `COPY` command.
+        """
+        converted_query, asyncpg_args = self._prepare_asyncpg_parameters(query, args)
+        status: str = await super().copy_from_query(
+            query_module.strip_query_end(converted_query),
+            *asyncpg_args,
+            output=output,
+            timeout=timeout,
+            format=format,
+            **copy_options,
+        )
+        return status
+
+    async def named_copy_records(
+        self,
+        table_name: str,
+        records: typing.Iterable[query_module.Arguments],
+        columns: typing.Optional[typing.Sequence[str]] = None,
+        *,
+        schema_name: typing.Optional[str] = None,
+        timeout: typing.Optional[float] = None,
+    ) -> str:
+        """Extended version of `copy_records_to_table` which binds the dict
+        records (or other mappings or objects) by the column names.
+
+        :param table_name: The name of the table to copy data to.
+        :param records: Iterable of dicts (or other mappings or objects) with the columns values.
+        :param columns: Columns to copy, keys of the first record by default (required for the objects).
+        :param schema_name: An optional schema name to qualify the table.
+        :param timeout: Optional timeout value in seconds.
+        """
+        if columns is None:
+            records_iterator = iter(records)
+            first_record = next(records_iterator, None)
+            if first_record is None:
+                return 'COPY 0'
+            if not isinstance(first_record, collections.abc.Mapping):
+                raise ValueError('Columns are required for the records which are not mappings')
+            columns = list(first_record.keys())
+            records = itertools.chain((first_record,), records_iterator)
+
+        return await self._copy_bound_records(
+            table_name,
+            records,
+            columns,
+            query_module.QueryParamsBinder(columns),
+            schema_name=schema_name,
+            timeout=timeout,
+        )
+
+    # pylint: disable=too-many-arguments
+    async def _copy_bound_records(
+        self,
+        table_name: str,
+        records: typing.Iterable[query_module.Arguments],
+        columns: typing.Sequence[str],
+        binder: query_module.QueryParamsBinder,
+        *,
+        schema_name: typing.Optional[str],
+        timeout: typing.Optional[float],
+    ) -> str:
+        """Stream records to the table with the `COPY` protocol binding them
+        lazily."""
+        bind = binder.bind_trusted if self.trusted_arguments else binder.bind
+        query_result: str = await super().copy_records_to_table(
+            table_name, records=map(bind, records), columns=list(columns), schema_name=schema_name, timeout=timeout
         )
-        query_result: None = await super().executemany(converted_query, asyncpg_args, timeout=timeout)
         return query_result
 
     async def named_fetch(
-        self, query: str, args: typing.Dict, timeout: typing.Optional[float] = None
+        self, query: str, args: query_module.Arguments, timeout: typing.Optional[float] = None
     ) -> typing.List[asyncpg.Record]:
         """Extended versions of `fetch` with support of the named parameters.
 
         :param query: SQL query to execute (could include named parameters).
-        :param args: Dict with the parameters values.
+        :param args: Dict (or other mapping or object) with the parameters values.
         :param timeout: Optional timeout value in seconds.
         """
-        converted_query, asyncpg_args = self._prepare_asyncpg_parameters(
-            query, args, query_module.QueryParamsDictConverter()
-        )
+        if self.observers:
+            fetch = super().fetch
+            return await self._execute_observed(
+                'fetch',
+                query,
+                args,
+                lambda converted_query, asyncpg_args: fetch(converted_query, *asyncpg_args, timeout=timeout),
+            )
+
+        converted_query, asyncpg_args = self._prepare_asyncpg_parameters(query, args)
         query_result: typing.List[asyncpg.Record] = await super().fetch(converted_query, *asyncpg_args, timeout=timeout)
         return query_result
 
     async def named_fetchval(
-        self, query: str, args: typing.Dict, column: int = 0, timeout: typing.Optional[float] = None
+        self, query: str, args: query_module.Arguments, column: int = 0, timeout: typing.Optional[float] = None
     ) -> typing.Optional[typing.Any]:
         """Extended versions of `fetchval` with support of the named
         parameters.
 
         :param query: SQL query to execute (could include named parameters).
-        :param args: Dict with the parameters values.
+        :param args: Dict (or other mapping or object) with the parameters values.
         :param column: Numeric index within the record of the value to return.
         :param timeout: Optional timeout value in seconds.
         """
-        converted_query, asyncpg_args = self._prepare_asyncpg_parameters(
-            query, args, query_module.QueryParamsDictConverter()
-        )
+        if self.observers:
+            fetchval = super().fetchval
+            return await self._execute_observed(
+                'fetchval',
+                query,
+                args,
+                lambda converted_query, asyncpg_args: fetchval(
+                    converted_query, *asyncpg_args, column=column, timeout=timeout
+                ),
+            )
+
+        converted_query, asyncpg_args = self._prepare_asyncpg_parameters(query, args)
         return await super().fetchval(converted_query, *asyncpg_args, column=column, timeout=timeout)
 
     async def named_fetchrow(
-        self, query: str, args: typing.Dict, timeout: typing.Optional[float] = None
+        self, query: str, args: query_module.Arguments, timeout: typing.Optional[float] = None
     ) -> typing.Optional[asyncpg.Record]:
         """Extended versions of `fetchrow` with support of the named
         parameters.
 
         :param query: SQL query to execute (could include named parameters).
-        :param args: Dict with the parameters values.
+        :param args: Dict (or other mapping or object) with the parameters values.
         :param timeout: Optional timeout value in seconds.
         """
-        converted_query, asyncpg_args = self._prepare_asyncpg_parameters(
-            query, args, query_module.QueryParamsDictConverter()
-        )
+        if self.observers:
+            fetchrow = super().fetchrow
+            return await self._execute_observed(
+                'fetchrow',
+                query,
+                args,
+                lambda converted_query, asyncpg_args: fetchrow(converted_query, *asyncpg_args, timeout=timeout),
+            )
+
+        converted_query, asyncpg_args = self._prepare_asyncpg_parameters(query, args)
         return await super().fetchrow(converted_query, *asyncpg_args, timeout=timeout)
 
+    async def named_fetch_as(
+        self,
+        model: typing.Type[rows_module.ModelT],
+        query: str,
+        args: query_module.Arguments,
+        timeout: typing.Optional[float] = None,
+    ) -> typing.List[rows_module.ModelT]:
+        """Version of `named_fetch` returning the rows as the `model`
+        instances.
+
+        :param model: Dataclass, named tuple or class with `__slots__` with the fields named as the result columns.
+        :param query: SQL query to execute (could include named parameters).
+        :param args: Dict (or other mapping or object) with the parameters values.
+        :param timeout: Optional timeout value in seconds.
+        """
+        return rows_module.map_records(model, await self.named_fetch(query, args, timeout=timeout))
+
+    async def named_fetchrow_as(
+        self,
+        model: typing.Type[rows_module.ModelT],
+        query: str,
+        args: query_module.Arguments,
+        timeout: typing.Optional[float] = None,
+    ) -> typing.Optional[rows_module.ModelT]:
+        """Version of `named_fetchrow` returning the row as the `model`
+        instance.
+
+        :param model: Dataclass, named tuple or class with `__slots__` with the fields named as the result columns.
+        :param query: SQL query to execute (could include named parameters).
+        :param args: Dict (or other mapping or object) with the parameters values.
+        :param timeout: Optional timeout value in seconds.
+        """
+        return rows_module.map_record(model, await self.named_fetchrow(query, args, timeout=timeout))
+
+    async def named_fetch_columns(
+        self,
+        query: str,
+        args: query_module.Arguments,
+        *,
+        batch_size: int = query_module.DEFAULT_BATCH_SIZE,
+        use_numpy: typing.Optional[bool] = None,
+        timeout: typing.Optional[float] = None,
+    ) -> columns_module.Columns:
+        """Version of `named_fetch` returning the result as a mapping of the
+        column name to the list of its values.
+
+        Rows are read in batches with the server-side cursor (in the
+        transaction, which is started if there is no one) and are not kept
+        after being appended to the columns.
+
+        :param query: SQL query to execute (could include named parameters).
+        :param args: Dict (or other mapping or object) with the parameters values.
+        :param batch_size: Number of rows fetched in one round trip.
+        :param use_numpy: Return numeric, boolean, date and timestamp columns without NULLs as NumPy arrays.
+            By default NumPy is used when it's installed.
+        :param timeout: Optional timeout value in seconds.
+        """
+        converted_query, asyncpg_args = self._prepare_asyncpg_parameters(query, args)
+        stmt = await self._prepare(converted_query, timeout=timeout, use_cache=True)
+        return await columns_module.fetch_columns(
+            self, stmt, asyncpg_args, batch_size=batch_size, use_numpy=use_numpy, timeout=timeout
+        )
+
+    async def named_iter_batches(
+        self,
+        query: str,
+        args: query_module.Arguments,
+        *,
+        batch_size: int = query_module.DEFAULT_BATCH_SIZE,
+        prefetch: bool = True,
+        columnar: bool = False,
+        use_numpy: typing.Optional[bool] = None,
+        timeout: typing.Optional[float] = None,
+    ) -> typing.AsyncGenerator[typing.Any, None]:
+        """Iterate over the query result by batches read with the
+        server-side cursor.
+
+        Cursor is run in the transaction, which is started if there is no
+        one and is finished when the iteration is over. The next batch is
+        fetched while the current one is being processed, so the
+        connection must not be used until the iteration is over.
+
+        :param query: SQL query to execute (could include named parameters).
+        :param args: Dict (or other mapping or object) with the parameters values.
+        :param batch_size: Number of rows in the every batch.
+        :param prefetch: Fetch the next batch while the current one is being processed.
+        :param columnar: Yield batches as mappings of the column name to its values (see `named_fetch_columns`)
+            instead of the lists of records.
+        :param use_numpy: Return numeric, boolean, date and timestamp columns without NULLs as NumPy arrays
+            in the columnar mode. By default NumPy is used when it's installed.
+        :param timeout: Optional timeout value in seconds for the every batch.
+        """
+        converted_query, asyncpg_args = self._prepare_asyncpg_parameters(query, args)
+        stmt = await self._prepare(converted_query, timeout=timeout, use_cache=True)
+        batches = cursors_module.iter_batches(
+            self,
+            stmt,
+            asyncpg_args,
+            batch_size=batch_size,
+            prefetch=prefetch,
+            columnar=columnar,
+            use_numpy=use_numpy,
+            timeout=timeout,
+        )
+        try:
+            async for batch in batches:
+                yield batch
+        finally:
+            # finish the transaction if the iteration is stopped early
+            await batches.aclose()
+
     def named_cursor(
         self,
         query: str,
-        args: typing.Dict,
+        args: query_module.Arguments,
         prefetch: typing.Optional[int] = None,
         timeout: typing.Optional[float] = None,
     ) -> cursor.CursorFactory:
         """Extended version of `cursor` with support of the named parameters.
 
         :param query: SQL query to execute (could include named parameters).
-        :param args: Dict with the parameters values.
+        :param args: Dict (or other mapping or object) with the parameters values.
         :param prefetch: The number of rows the *cursor iterator* will prefetch (defaults to ``50``.)
         :param timeout: Optional timeout value in seconds.
         """
-        converted_query, asyncpg_args = self._prepare_asyncpg_parameters(
-            query, args, query_module.QueryParamsDictConverter()
-        )
+        converted_query, asyncpg_args = self._prepare_asyncpg_parameters(query, args)
         return super().cursor(converted_query, *asyncpg_args, prefetch=prefetch, timeout=timeout)
 
     async def named_prepare(
-        self, query: str, *, timeout: typing.Optional[float] = None
+        self, query: str, *, timeout: typing.Optional[float] = None, use_cache: bool = False
     ) -> prepared_statement.PreparedStatementX:
         """Extended version of `prepare` with support of the named parameters.
 
         :param query: SQL query to execute (could include named parameters).
         :param timeout: Optional timeout value in seconds.
+        :param use_cache: Reuse the server-side statement from the connection statement cache
+            (the one used by `fetch`, `execute`, etc.) instead of preparing the new one.
+            Such statements are re-prepared after the schema changes like the cached statements of asyncpg.
         """
-        converted_query, params_order_list = query_module.construct_asyncpg_query(query)
+        parsed_query = self._parse_query(query)
         self._check_open()
-        stmt = await self._get_statement(converted_query, timeout, named=True, use_cache=False)
-        return prepared_statement.PreparedStatementX(self, converted_query, stmt, query, params_order_list)
+        stmt = await self._get_statement(parsed_query.converted_query, timeout, named=True, use_cache=use_cache)
+        return prepared_statement.PreparedStatementX(
+            self,
+            parsed_query.converted_query,
+            stmt,
+            query,
+            parsed_query.params_order_list,
+            binder=parsed_query.binder,
+            trusted_arguments=self.trusted_arguments,
+            use_cache=use_cache,
+            observers=self.observers,
+        )
+
+    async def named_warmup(self, queries: typing.Iterable[str], *, timeout: typing.Optional[float] = None) -> int:
+        """Prepare the queries in the connection statement cache, so their
+        first calls don't pay for the Parse/Describe round trip.
+
+        Queries are prepared one by one until the `timeout` expires, the
+        rest of them are prepared on the first call. Warm-up is only an
+        optimization, so the queries which couldn't be prepared (e.g. their
+        tables are not created yet) are skipped and fail on the first call.
+        Returns number of the prepared queries.
+
+        :param queries: SQL queries (could include named parameters), like `QueryRegistry`.
+        :param timeout: Optional time limit of the whole warm-up in seconds.
+        """
+        loop = asyncio.get_event_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        prepared_number = 0
+        for query in queries:
+            remaining_time = None if deadline is None else deadline - loop.time()
+            if remaining_time is not None and remaining_time <= 0:
+                break
+            try:
+                await self._get_statement(self._parse_query(query).converted_query, remaining_time)
+            except asyncio.TimeoutError:
+                break
+            except asyncpg.PostgresError:
+                continue
+            prepared_number += 1
+        return prepared_number
+
+
+async def _iterate_batches(
+    items: typing.Union[typing.Iterable[T], typing.AsyncIterable[T]], batch_size: int
+) -> typing.AsyncIterator[typing.List[T]]:
+    """Split sync or async iterable into lists of `batch_size` elements."""
+    if batch_size < 1:
+        raise ValueError(f'Batch size must be positive, got {batch_size}')
+
+    if isinstance(items, collections.abc.AsyncIterable):
+        batch = []
+        async for item in items:
+            batch.append(item)
+            if len(batch) == batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+        return
+
+    iterator = iter(items)
+    while True:
+        batch = list(itertools.islice(iterator, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def _iterate_columns_chunks(
+    args: typing.Union[typing.Iterable[query_module.Arguments], typing.Mapping[str, typing.Any]],
+    bind: typing.Callable[[query_module.Arguments], typing.Tuple],
+    chunk_size: int,
+) -> typing.Iterator[typing.List[typing.Sequence]]:
+    """Split rows or columns to the chunks of the columns values."""
+    if isinstance(args, collections.abc.Mapping):
+        columns = bind(args)
+        rows_count = len(columns[0])
+        if any(len(column) != rows_count for column in columns):
+            raise ValueError('All the columns must have the same length')
+        for start in range(0, rows_count, chunk_size):
+            yield [column[start : start + chunk_size] for column in columns]
+        return
+
+    iterator = iter(args)
+    while True:
+        rows = [bind(row) for row in itertools.islice(iterator, chunk_size)]
+        if not rows:
+            return
+        yield list(zip(*rows))
+
+
+# pylint: disable=too-many-arguments,too-many-locals
+def create_pool(
+    dsn: typing.Optional[str] = None,
+    *,
+    min_size: int = 10,
+    max_size: int = 10,
+    max_queries: int = 50000,
+    max_inactive_connection_lifetime: float = 300.0,
+    setup: typing.Optional[typing.Callable] = None,
+    init: typing.Optional[typing.Callable] = None,
+    loop: typing.Optional[asyncio.AbstractEventLoop] = None,
+    connection_class: typing.Type[asyncpg.connection.Connection] = ConnectionX,
+    record_class: type = asyncpg.Record,
+    observers: typing.Iterable[observers_module.QueryObserver] = (),
+    coalesce_reads: bool = False,
+    registry: typing.Optional[registry_module.QueryRegistry] = None,
+    warmup_timeout: typing.Optional[float] = None,
+    limiter: typing.Optional[limits.ConcurrencyLimiter] = None,
+    result_cache: typing.Optional[result_cache_module.ResultCache] = None,
+    **connect_kwargs: typing.Any,
+) -> pool_module.PoolX:
+    """Create extended connection pool.
+
+    Has the same API as asyncpg `create_pool`, `observers` are set to
+    the every pool connection (see `ConnectionX.observers`),
+    `coalesce_reads` enables coalescing of the identical concurrent
+    reads, queries of the `registry` are prepared on the every new
+    connection within the `warmup_timeout`, `limiter` limits concurrency
+    of the query classes, reads of the `result_cache` queries are cached
+    (see `PoolX`).
+    """
+    return pool_module.PoolX(
+        dsn,
+        observers=observers,
+        coalesce_reads=coalesce_reads,
+        registry=registry,
+        warmup_timeout=warmup_timeout,
+        limiter=limiter,
+        result_cache=result_cache,
+        connection_class=connection_class,
+        record_class=record_class,
+        min_size=min_size,
+        max_size=max_size,
+        max_queries=max_queries,
+        loop=loop,
+        setup=setup,
+        init=init,
+        max_inactive_connection_lifetime=max_inactive_connection_lifetime,
+        **connect_kwargs,
+    )
+
+
+def create_routing_pool(
+    primary_dsn: typing.Optional[str],
+    replicas_dsns: typing.Sequence[str] = (),
+    **pool_kwargs: typing.Any,
+) -> routing_module.RoutingPool:
+    """Create extended connection pools of the primary and the replicas
+    grouped to the routing pool (see `RoutingPool`).
+
+    `pool_kwargs` are passed to the every `create_pool` call.
+    """
+    return routing_module.RoutingPool(
+        create_pool(primary_dsn, **pool_kwargs), [create_pool(dsn, **pool_kwargs) for dsn in replicas_dsns]
+    )
 
 
-create_pool = functools.partial(asyncpg.create_pool, connection_class=ConnectionX)
 connect = functools.partial(asyncpg.connect, connection_class=ConnectionX)
@@ -0,0 +1,81 @@
+"""Module with tools for reading query results by batches."""
+import asyncio
+import typing
+
+import asyncpg
+import asyncpg.prepared_stmt
+
+from asyncpgx import columns as columns_module
+
+
+# pylint: disable=too-many-arguments
+async def iter_batches(
+    connection: asyncpg.Connection,
+    stmt: asyncpg.prepared_stmt.PreparedStatement,
+    args: typing.Sequence,
+    *,
+    batch_size: int,
+    prefetch: bool,
+    columnar: bool,
+    use_numpy: typing.Optional[bool],
+    timeout: typing.Optional[float],
+) -> typing.AsyncGenerator[typing.Any, None]:
+    """Read result of the prepared statement with the server-side cursor
+    and yield it by batches of `batch_size` rows.
+
+    Batches are lists of records or (with `columnar`) mappings of the
+    column name to its values (see `columns.ColumnsBuilder`). With
+    `prefetch` the next batch is fetched while the current one is being
+    processed, so the connection must not be used by the consumer
+    during the iteration.
+
+    Cursor requires transaction, so it's started if there is no one and
+    is finished when the iteration is over (it's rolled back if the
+    iteration fails or is stopped early).
+    """
+    if batch_size < 1:
+        raise ValueError(f'Batch size must be positive, got {batch_size}')
+
+    transaction = None
+    if not connection.is_in_transaction():
+        transaction = connection.transaction()
+        await transaction.start()
+
+    next_batch: typing.Optional[asyncio.Future] = None
+    try:
+        cursor = await stmt.cursor(*args, timeout=timeout)
+        next_batch = asyncio.ensure_future(cursor.fetch(batch_size, timeout=timeout))
+        while next_batch is not None:
+            rows = await next_batch
+            next_batch = None
+            if len(rows) == batch_size and prefetch:
+                next_batch = asyncio.ensure_future(cursor.fetch(batch_size, timeout=timeout))
+            if rows:
+                yield _build_batch(stmt, rows, columnar, use_numpy)
+            if len(rows) == batch_size and not prefetch:
+                next_batch = asyncio.ensure_future(cursor.fetch(batch_size, timeout=timeout))
+    except BaseException:
+        if next_batch is not None:
+            # the connection is busy until the prefetched batch is received
+            await asyncio.wait([next_batch])
+            if not next_batch.cancelled():
+                next_batch.exception()
+        if transaction is not None:
+            await transaction.rollback()
+        raise
+
+    if transaction is not None:
+        await transaction.commit()
+
+
+def _build_batch(
+    stmt: asyncpg.prepared_stmt.PreparedStatement,
+    rows: typing.List[asyncpg.Record],
+    columnar: bool,
+    use_numpy: typing.Optional[bool],
+) -> typing.Any:
+    if not columnar:
+        return rows
+    builder = columns_module.ColumnsBuilder(stmt.get_attributes(), use_numpy)
+    builder.add_rows(rows)
+    return builder.build()
@@ -7,3 +7,19 @@ class MissingRequiredArgumentError(Exception):
 
 class UnusedArgumentsError(Exception):
     """There are unused arguments in query."""
+
+
+class UnsupportedQueryError(Exception):
+    """Query isn't supported by the requested execution mode."""
+
+
+class RowMappingError(Exception):
+    """Query result couldn't be mapped to the model."""
+
+
+class QueryRejectedError(Exception):
+    """Query was rejected by the concurrency limiter."""
+
+
+class QueueTimeoutError(QueryRejectedError):
+    """Query waited in the concurrency limiter queue for too long."""
@@ -0,0 +1,284 @@
+"""Module with tools for limiting concurrency of the query classes."""
+import asyncio
+import bisect
+import contextlib
+import contextvars
+import itertools
+import time
+import typing
+
+from asyncpgx import exceptions
+from asyncpgx import query as query_module
+
+
+DEFAULT_CLASS = 'default'
+
+
+class QueryClass(typing.NamedTuple):
+    """Limits of the query class."""
+
+    #: unique name of the class
+    name: str
+    #: maximal number of the concurrently running queries of the class (unlimited by default)
+    max_in_flight: typing.Optional[int] = None
+    #: maximal time in seconds the query waits in the queue before `QueueTimeoutError`
+    queue_timeout: typing.Optional[float] = None
+    #: queries of the classes with higher priority are admitted first
+    priority: int = 0
+    #: queue wait in seconds after which the new queries of the class are rejected while the queue isn't empty
+    shed_wait: typing.Optional[float] = None
+
+
+class QueryClassStats(typing.NamedTuple):
+    """Statistics of the query class."""
+
+    #: number of the running queries
+    in_flight: int
+    #: number of the queries waiting in the queue
+    queued: int
+    #: number of the admitted queries
+    admitted: int
+    #: number of the queries rejected by shedding
+    rejected: int
+    #: number of the queries failed with `QueueTimeoutError`
+    timed_out: int
+    #: total and maximal time in seconds the admitted queries waited in the queue
+    wait_time: float
+    max_wait_time: float
+    #: total time in seconds the finished queries were running
+    run_time: float
+    #: number of the finished queries
+    finished: int
+
+    @property
+    def mean_wait_time(self) -> float:
+        """Mean time in seconds the admitted queries waited in the queue."""
+        return self.wait_time / self.admitted if self.admitted else 0.0
+
+    @property
+    def mean_run_time(self) -> float:
+        """Mean time in seconds the finished queries were running."""
+        return self.run_time / self.finished if self.finished else 0.0
+
+
+# pylint: disable=too-few-public-methods,too-many-instance-attributes
+class _ClassState:
+    """Current state and statistics of the query class."""
+
+    __slots__ = (
+        'config',
+        'in_flight',
+        'queued',
+        'shedding',
+        'admitted',
+        'rejected',
+        'timed_out',
+        'wait_time',
+        'max_wait_time',
+        'run_time',
+        'finished',
+    )
+
+    def __init__(self, config: QueryClass):
+        self.config = config
+        self.in_flight = 0
+        self.queued = 0
+        self.shedding = False
+        self.admitted = 0
+        self.rejected = 0
+        self.timed_out = 0
+        self.wait_time = 0.0
+        self.max_wait_time = 0.0
+        self.run_time = 0.0
+        self.finished = 0
+
+    def has_room(self) -> bool:
+        """Check whether one more query of the class could be run."""
+        return self.config.max_in_flight is None or self.in_flight < self.config.max_in_flight
+
+
+class ConcurrencyLimiter:
+    """Limiter of the number of the concurrently running queries of the
+    every query class (see `QueryClass`).
+
+    Query class is taken from the current context (see `tagged`), then
+    from the class assigned to the query fingerprint (see `assign`),
+    otherwise the `DEFAULT_CLASS` is used (it's unlimited unless it's
+    configured explicitly).
+
+    `max_in_flight` limits the total number of the running queries, it
+    should be equal to the pool size, so the queries wait for the
+    connections in the limiter queue, where the classes with higher
+    priority are admitted first (queries with the same priority are
+    admitted in the arrival order).
+
+    When the query of the class with `shed_wait` is admitted after
+    waiting longer than it, the class is overloaded and its new queries
+    are rejected with `QueryRejectedError` right away until the query
+    with the shorter wait is admitted or the class queue is drained.
+    """
+
+    __slots__ = ('max_in_flight', '_classes', '_assigned', '_tag', '_in_flight', '_waiters', '_counter')
+
+    def __init__(self, classes: typing.Iterable[QueryClass] = (), *, max_in_flight: typing.Optional[int] = None):
+        """
+        :param classes: Limits of the query classes.
+        :param max_in_flight: Maximal total number of the running queries (unlimited by default).
+        """
+        self.max_in_flight = max_in_flight
+        self._classes = {query_class.name: _ClassState(query_class) for query_class in classes}
+        self._classes.setdefault(DEFAULT_CLASS, _ClassState(QueryClass(DEFAULT_CLASS)))
+        self._assigned: typing.Dict[str, str] = {}
+        self._tag: contextvars.ContextVar[typing.Optional[str]] = contextvars.ContextVar(
+            'asyncpgx_query_class', default=None
+        )
+        self._in_flight = 0
+        self._waiters: typing.List[typing.Tuple[int, int, float, _ClassState, asyncio.Future]] = []
+        self._counter = itertools.count()
+
+    def assign(self, query: str, class_name: str) -> None:
+        """Assign the query (and all the queries with the same fingerprint,
+        see `query.get_query_fingerprint`) to the class."""
+        self._check_class(class_name)
+        self._assigned[query_module.get_query_fingerprint(query)] = class_name
+
+    @contextlib.contextmanager
+    def tagged(self, class_name: str) -> typing.Iterator[None]:
+        """Assign all the queries of the current context to the class."""
+        self._check_class(class_name)
+        token = self._tag.set(class_name)
+        try:
+            yield
+        finally:
+            self._tag.reset(token)
+
+    def classify(self, query: str) -> str:
+        """Return name of the query class in the current context."""
+        class_name = self._tag.get()
+        if class_name is not None:
+            return class_name
+        if self._assigned:
+            return self._assigned.get(query_module.get_query_fingerprint(query), DEFAULT_CLASS)
+        return DEFAULT_CLASS
+
+    def limit(self, query: str) -> '_Admission':
+        """Return async context manager which waits until the query could
+        be run and holds its place while it's running.
+
+        :param query: SQL query (could include named parameters).
+        """
+        return _Admission(self, self._classes[self.classify(query)])
+
+    def stats(self) -> typing.Dict[str, QueryClassStats]:
+        """Return statistics of the every query class."""
+        return {
+            name: QueryClassStats(
+                state.in_flight,
+                state.queued,
+                state.admitted,
+                state.rejected,
+                state.timed_out,
+                state.wait_time,
+                state.max_wait_time,
+                state.run_time,
+                state.finished,
+            )
+            for name, state in self._classes.items()
+        }
+
+    def _check_class(self, class_name: str) -> None:
+        if class_name not in self._classes:
+            raise ValueError(f'Unknown query class: {class_name!r}')
+
+    def _has_room(self) -> bool:
+        return self.max_in_flight is None or self._in_flight < self.max_in_flight
+
+    async def _acquire(self, state: _ClassState) -> None:
+        """Wait until the query of the class could be run."""
+        # waiters which could be admitted are always admitted on release, so the remaining
+        # ones don't compete with the query which could be run right away
+        if self._has_room() and state.has_room():
+            self._admit(state, 0.0)
+            return
+        if state.shedding and state.queued:
+            state.rejected += 1
+            raise exceptions.QueryRejectedError(f'Query class {state.config.name!r} is overloaded')
+
+        future = asyncio.get_event_loop().create_future()
+        waiter = (-state.config.priority, next(self._counter), time.perf_counter(), state, future)
+        bisect.insort(self._waiters, waiter)
+        state.queued += 1
+        try:
+            if state.config.queue_timeout is None:
+                await future
+            else:
+                await asyncio.wait_for(future, state.config.queue_timeout)
+        except BaseException as exc:
+            if future.done() and not future.cancelled():
+                # the query was admitted, but its caller is gone
+                self._release(state, 0.0)
+                raise
+            self._waiters.remove(waiter)
+            state.queued -= 1
+            if not state.queued:
+                state.shedding = False
+            if isinstance(exc, asyncio.TimeoutError):
+                state.timed_out += 1
+                raise exceptions.QueueTimeoutError(
+                    f'Query class {state.config.name!r} queue timeout ({state.config.queue_timeout}s) expired'
+                ) from exc
+            raise
+
+    def _admit(self, state: _ClassState, wait_time: float) -> None:
+        self._in_flight += 1
+        state.in_flight += 1
+        state.admitted += 1
+        state.wait_time += wait_time
+        state.max_wait_time = max(state.max_wait_time, wait_time)
+        shed_wait = state.config.shed_wait
+        if shed_wait is not None:
+            state.shedding = wait_time > shed_wait
+
+    def _release(self, state: _ClassState, run_time: float) -> None:
+        """Free the place of the finished query and admit the waiters."""
+        self._in_flight -= 1
+        state.in_flight -= 1
+        state.run_time += run_time
+        state.finished += 1
+        if not self._waiters:
+            return
+
+        now = time.perf_counter()
+        index = 0
+        while index < len(self._waiters) and self._has_room():
+            _, _, enqueued_at, waiter_state, future = self._waiters[index]
+            # cancelled waiters are removed by their callers
+            if future.done() or not waiter_state.has_room():
+                index += 1
+                continue
+            del self._waiters[index]
+            waiter_state.queued -= 1
+            self._admit(waiter_state, now - enqueued_at)
+            if not waiter_state.queued:
+                waiter_state.shedding = False
+            future.set_result(None)
+
+
+class _Admission:
+    """Place of the query in `ConcurrencyLimiter`."""
+
+    __slots__ = ('_limiter', '_state', '_started_at')
+
+    def __init__(self, limiter: ConcurrencyLimiter, state: _ClassState):
+        self._limiter = limiter
+        self._state = state
+        self._started_at = 0.0
+
+    async def __aenter__(self) -> None:
+        # pylint: disable=protected-access
+        await self._limiter._acquire(self._state)
+        self._started_at = time.perf_counter()
+
+    async def __aexit__(self, *exc_info: typing.Any) -> None:
+        # pylint: disable=protected-access
+        self._limiter._release(self._state, time.perf_counter() - self._started_at)
@@ -0,0 +1,204 @@
+"""Module with tools for batching of the keyed lookups."""
+import asyncio
+import typing
+
+from asyncpgx import query as query_module
+from asyncpgx import rows as rows_module
+
+
+DEFAULT_MAX_BATCH_SIZE = 1000
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    from asyncpgx import connection as connection_module
+    from asyncpgx import pool as pool_module
+
+    Executor = typing.Union[connection_module.ConnectionX, pool_module.PoolX]
+
+
+# pylint: disable=too-many-instance-attributes
+class RowLoader:
+    """Loader which collects keys requested within one event loop
+    iteration (or within the `window` seconds) and loads their rows with a
+    single query.
+
+    Query must select rows by the list of keys passed as the `keys_param`
+    parameter (like `SELECT * FROM users WHERE id = ANY(:ids)`), rows are
+    matched to the keys by the `key_column` value. Keys without rows are
+    loaded as `None`, with `model` rows are converted to its instances
+    (see `rows.compile_row_factory`).
+
+    Batches are limited by `max_batch_size` keys, the full batch is sent
+    immediately. Loaded rows are cached by the key until `clear` or
+    `clear_all` (unless `cache` is off), so the loader is supposed to live
+    as long as the data could be considered fresh, like one request.
+
+    Batches of different loaders (and batches over `max_batch_size`) are
+    executed concurrently, so with the `ConnectionX` executor they must
+    not overlap, pool is the preferred executor. Batches which are still
+    running when the loader isn't needed anymore are cancelled by
+    `close`.
+    """
+
+    __slots__ = (
+        '_executor',
+        '_query',
+        '_key_column',
+        '_keys_param',
+        '_args',
+        '_model',
+        '_max_batch_size',
+        '_window',
+        '_cache',
+        '_loaded',
+        '_batch',
+        '_batch_handle',
+        '_tasks',
+    )
+
+    # pylint: disable=too-many-arguments
+    def __init__(
+        self,
+        executor: 'Executor',
+        query: str,
+        key_column: typing.Union[str, int],
+        *,
+        keys_param: str = 'keys',
+        args: typing.Optional[typing.Mapping[str, typing.Any]] = None,
+        model: typing.Optional[type] = None,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        window: typing.Optional[float] = None,
+        cache: bool = True,
+    ):
+        """
+        :param executor: Connection or pool which executes the queries.
+        :param query: SQL query which selects rows by the list of keys.
+        :param key_column: Name or index of the column with the row key.
+        :param keys_param: Name of the query parameter with the list of keys.
+        :param args: Values of the other query parameters.
+        :param model: Class to convert rows to.
+        :param max_batch_size: Maximum number of keys in one query.
+        :param window: Time in seconds to collect keys for the batch (one event loop iteration by default).
+        :param cache: Cache loaded rows by the key.
+        """
+        if max_batch_size < 1:
+            raise ValueError(f'Max batch size must be positive, got {max_batch_size}')
+        self._executor = executor
+        self._query = query
+        self._key_column = key_column
+        self._keys_param = keys_param
+        self._args = dict(args or {})
+        self._model = model
+        self._max_batch_size = max_batch_size
+        self._window = window
+        self._cache = cache
+        self._loaded: typing.Dict[typing.Hashable, asyncio.Future] = {}
+        self._batch: typing.Dict[typing.Hashable, asyncio.Future] = {}
+        self._batch_handle: typing.Optional[asyncio.Handle] = None
+        # running batches are referenced, so they couldn't be garbage collected
+        self._tasks: typing.Set[asyncio.Future] = set()
+
+    async def load(self, key: typing.Hashable) -> typing.Any:
+        """Load row (or model instance) by the key, `None` if there is no
+        row with such key."""
+        return await asyncio.shield(self._get_future(key))
+
+    async def load_many(self, keys: typing.Iterable[typing.Hashable]) -> typing.List[typing.Any]:
+        """Load rows (or model instances) by the keys, `None` for the keys
+        without rows."""
+        futures = [self._get_future(key) for key in keys]
+        if not futures:
+            return []
+        return list(await asyncio.shield(asyncio.gather(*futures)))
+
+    def prime(self, key: typing.Hashable, value: typing.Any) -> None:
+        """Put value to the cache if the key isn't cached yet."""
+        if self._cache and key not in self._loaded:
+            future = asyncio.get_event_loop().create_future()
+            future.set_result(value)
+            self._loaded[key] = future
+
+    def clear(self, key: typing.Hashable) -> None:
+        """Drop cached value of the key."""
+        self._loaded.pop(key, None)
+
+    def clear_all(self) -> None:
+        """Drop all the cached values."""
+        self._loaded.clear()
+
+    def _get_future(self, key: typing.Hashable) -> asyncio.Future:
+        future = self._loaded.get(key) or self._batch.get(key)
+        if future is not None:
+            return future
+
+        future = self._batch[key] = asyncio.get_event_loop().create_future()
+        if self._cache:
+            self._loaded[key] = future
+        if len(self._batch) >= self._max_batch_size:
+            self._dispatch()
+        elif self._batch_handle is None:
+            loop = asyncio.get_event_loop()
+            if self._window is None:
+                self._batch_handle = loop.call_soon(self._dispatch)
+            else:
+                self._batch_handle = loop.call_later(self._window, self._dispatch)
+        return future
+
+    def _dispatch(self) -> None:
+        if self._batch_handle is not None:
+            self._batch_handle.cancel()
+            self._batch_handle = None
+        batch, self._batch = self._batch, {}
+        if batch:
+            task = asyncio.ensure_future(self._load_batch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def close(self) -> None:
+        """Cancel the pending and the running batches and wait until they
+        are finished, their callers get `asyncio.CancelledError`."""
+        if self._batch_handle is not None:
+            self._batch_handle.cancel()
+            self._batch_handle = None
+        batch, self._batch = self._batch, {}
+        self._fail_batch(batch, None)
+
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _load_batch(self, batch: typing.Dict[typing.Hashable, asyncio.Future]) -> None:
+        args: query_module.Arguments = {**self._args, self._keys_param: list(batch)}
+        try:
+            records = await self._executor.named_fetch(self._query, args)
+        except asyncio.CancelledError:
+            self._fail_batch(batch, None)
+            raise
+        except Exception as exc:  # pylint: disable=broad-except
+            self._fail_batch(batch, exc)
+            return
+
+        values: typing.List[typing.Any] = (
+            records if self._model is None else rows_module.map_records(self._model, records)
+        )
+        rows = {record[self._key_column]: value for record, value in zip(records, values)}
+        for key, future in batch.items():
+            if not future.done():
+                future.set_result(rows.get(key))
+
+    def _fail_batch(self, batch: typing.Dict[typing.Hashable, asyncio.Future], exc: typing.Optional[Exception]) -> None:
+        """Evict batch keys from the cache, so they are loaded again by the
+        next calls, and pass the exception (or cancellation) to the
+        callers."""
+        for key, future in batch.items():
+            if self._loaded.get(key) is future:
+                del self._loaded[key]
+            if future.done():
+                continue
+            if exc is None:
+                future.cancel()
+            else:
+                future.set_exception(exc)
+                # exception is retrieved by the callers, unless all of them were cancelled
+                future.exception()
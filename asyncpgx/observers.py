@@ -0,0 +1,235 @@
+"""Module with tools for the queries instrumentation."""
+import abc
+import bisect
+import time
+import typing
+
+from asyncpgx import query as query_module
+
+
+# upper bounds (in seconds) of the default histogram buckets
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+PHASES = ('parse', 'bind', 'execute')
+
+
+class QueryEvent(typing.NamedTuple):
+    """Description of the executed named query."""
+
+    #: name of the called method, like `fetch` (`prepared_fetch` for the prepared statements)
+    method: str
+    #: original query
+    query: str
+    #: query fingerprint (see `query.get_query_fingerprint`)
+    fingerprint: str
+    #: durations of the query processing phases in seconds
+    parse_time: float
+    bind_time: float
+    execute_time: float
+    #: number of the returned (or affected) rows if it's known
+    rows: typing.Optional[int]
+    #: whether the translated query was found in the cache (`None` for the prepared statements)
+    cache_hit: typing.Optional[bool]
+    #: exception class name if the query failed
+    error: typing.Optional[str]
+    #: arguments of the call (`None` for `executemany`), must not be kept or mutated by the observers
+    args: query_module.Arguments = None
+
+    @property
+    def total_time(self) -> float:
+        """Duration of the whole call in seconds."""
+        return self.parse_time + self.bind_time + self.execute_time
+
+
+# pylint: disable=too-few-public-methods
+class QueryObserver(abc.ABC):
+    """Receiver of the named queries events.
+
+    Observers are called synchronously after the every query, so they
+    should be fast and must not raise.
+    """
+
+    @abc.abstractmethod
+    def on_query(self, event: QueryEvent) -> None:
+        """Process event of the executed query."""
+
+
+class ObservedQuery:
+    """Context manager which measures durations of the query processing
+    phases (see `PHASES`) and notifies observers on exit.
+
+    `mark` is called at the end of the every phase except the last one,
+    phases which weren't reached are reported with zero duration.
+    """
+
+    __slots__ = ('_observers', '_method', '_query', '_args', '_timestamps', 'cache_hit', 'result')
+
+    def __init__(
+        self,
+        observers: typing.Iterable[QueryObserver],
+        method: str,
+        query: str,
+        args: query_module.Arguments = None,
+    ):
+        self._observers = observers
+        self._method = method
+        self._query = query
+        self._args = args
+        self._timestamps: typing.List[float] = []
+        self.cache_hit: typing.Optional[bool] = None
+        self.result: typing.Any = None
+
+    def __enter__(self) -> 'ObservedQuery':
+        self._timestamps.append(time.perf_counter())
+        return self
+
+    def __exit__(self, exc_type: typing.Optional[type], exc_value: typing.Any, traceback: typing.Any) -> None:
+        self.mark()
+        timestamps = self._timestamps
+        durations = [end - start for start, end in zip(timestamps, timestamps[1:])]
+        durations.extend([0.0] * (len(PHASES) - len(durations)))
+        parse_time, bind_time, execute_time = durations[: len(PHASES)]
+        notify(
+            self._observers,
+            QueryEvent(
+                self._method,
+                self._query,
+                query_module.get_query_fingerprint(self._query),
+                parse_time,
+                bind_time,
+                execute_time,
+                rows=None if exc_type else count_rows(self._method, self.result),
+                cache_hit=self.cache_hit,
+                error=exc_type.__name__ if exc_type else None,
+                args=self._args,
+            ),
+        )
+
+    def mark(self) -> None:
+        """Finish the current phase."""
+        self._timestamps.append(time.perf_counter())
+
+
+def count_rows(method: str, query_result: typing.Any) -> typing.Optional[int]:
+    """Return number of the rows returned or affected by the query if
+    it's known from the method result."""
+    if query_result is None:
+        return 0 if method.endswith('fetchrow') else None
+    if method.endswith('fetchrow'):
+        return 1
+    if method.endswith('fetch'):
+        return len(query_result)
+    if method.endswith('execute') and isinstance(query_result, str):
+        rows_count = query_result.rpartition(' ')[2]
+        return int(rows_count) if rows_count.isdigit() else None
+    return None
+
+
+def notify(observers: typing.Iterable[QueryObserver], event: QueryEvent) -> None:
+    """Send event to the every observer."""
+    for observer in observers:
+        observer.on_query(event)
+
+
+# pylint: disable=too-few-public-methods
+class _HistogramSeries:
+    """Statistics of the single query fingerprint and method."""
+
+    __slots__ = ('buckets_counts', 'count', 'total_time', 'phases_times', 'rows', 'cache_misses', 'errors')
+
+    def __init__(self, buckets_number: int):
+        self.buckets_counts = [0] * (buckets_number + 1)
+        self.count = 0
+        self.total_time = 0.0
+        self.phases_times = [0.0] * len(PHASES)
+        self.rows = 0
+        self.cache_misses = 0
+        self.errors: typing.Dict[str, int] = {}
+
+
+class HistogramObserver(QueryObserver):
+    """In-memory histogram of the queries durations grouped by the query
+    fingerprint and method.
+
+    Could be rendered in the Prometheus text format with
+    `render_prometheus`.
+    """
+
+    def __init__(self, buckets: typing.Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._series: typing.Dict[typing.Tuple[str, str], _HistogramSeries] = {}
+        self._queries: typing.Dict[str, str] = {}
+
+    @property
+    def queries(self) -> typing.Mapping[str, str]:
+        """Mapping of the observed query fingerprints to the queries."""
+        return self._queries
+
+    def on_query(self, event: QueryEvent) -> None:
+        series = self._series.get((event.fingerprint, event.method))
+        if series is None:
+            series = self._series[(event.fingerprint, event.method)] = _HistogramSeries(len(self.buckets))
+            self._queries[event.fingerprint] = event.query
+
+        total_time = event.total_time
+        series.buckets_counts[bisect.bisect_left(self.buckets, total_time)] += 1
+        series.count += 1
+        series.total_time += total_time
+        series.phases_times[0] += event.parse_time
+        series.phases_times[1] += event.bind_time
+        series.phases_times[2] += event.execute_time
+        series.rows += event.rows or 0
+        series.cache_misses += event.cache_hit is False
+        if event.error is not None:
+            series.errors[event.error] = series.errors.get(event.error, 0) + 1
+
+    def clear(self) -> None:
+        """Drop all the collected statistics."""
+        self._series.clear()
+        self._queries.clear()
+
+    def render_prometheus(self, prefix: str = 'asyncpgx') -> str:
+        """Render collected statistics in the Prometheus text exposition
+        format."""
+        lines = self._render_histogram(prefix)
+        lines.append(f'# HELP {prefix}_query_phase_seconds_total Time spent in the query processing phases.')
+        lines.append(f'# TYPE {prefix}_query_phase_seconds_total counter')
+        for labels, series in self._iterate_series():
+            for phase, phase_time in zip(PHASES, series.phases_times):
+                lines.append(f'{prefix}_query_phase_seconds_total{{{labels},phase="{phase}"}} {phase_time!r}')
+
+        for name, description in (
+            ('rows', 'Number of the returned or affected rows.'),
+            ('cache_misses', 'Number of the query cache misses.'),
+        ):
+            lines.append(f'# HELP {prefix}_query_{name}_total {description}')
+            lines.append(f'# TYPE {prefix}_query_{name}_total counter')
+            for labels, series in self._iterate_series():
+                lines.append(f'{prefix}_query_{name}_total{{{labels}}} {getattr(series, name)}')
+
+        lines.append(f'# HELP {prefix}_query_errors_total Number of the failed queries.')
+        lines.append(f'# TYPE {prefix}_query_errors_total counter')
+        for labels, series in self._iterate_series():
+            for error, errors_count in sorted(series.errors.items()):
+                lines.append(f'{prefix}_query_errors_total{{{labels},error="{error}"}} {errors_count}')
+        return '\n'.join(lines) + '\n'
+
+    def _render_histogram(self, prefix: str) -> typing.List[str]:
+        lines = [
+            f'# HELP {prefix}_query_duration_seconds Duration of the named queries.',
+            f'# TYPE {prefix}_query_duration_seconds histogram',
+        ]
+        upper_bounds = [repr(upper_bound) for upper_bound in self.buckets] + ['+Inf']
+        for labels, series in self._iterate_series():
+            cumulative_count = 0
+            for upper_bound, bucket_count in zip(upper_bounds, series.buckets_counts):
+                cumulative_count += bucket_count
+                lines.append(
+                    f'{prefix}_query_duration_seconds_bucket{{{labels},le="{upper_bound}"}} {cumulative_count}'
+                )
+            lines.append(f'{prefix}_query_duration_seconds_sum{{{labels}}} {series.total_time!r}')
+            lines.append(f'{prefix}_query_duration_seconds_count{{{labels}}} {series.count}')
+        return lines
+
+    def _iterate_series(self) -> typing.Iterator[typing.Tuple[str, _HistogramSeries]]:
+        for (fingerprint, method), series in sorted(self._series.items()):
+            yield f'fingerprint="{fingerprint}",method="{method}"', series
@@ -0,0 +1,317 @@
+"""Module with extensions of asyncpg `Pool` class."""
+import typing
+
+import asyncpg
+import asyncpg.pool
+
+from asyncpgx import limits
+from asyncpgx import observers as observers_module
+from asyncpgx import query as query_module
+from asyncpgx import result_cache as result_cache_module
+from asyncpgx import rows as rows_module
+from asyncpgx import singleflight
+
+
+T = typing.TypeVar('T')
+
+
+class PoolX(asyncpg.pool.Pool):
+    """Extended version of asyncpg `Pool` class.
+
+    Provides named versions of the query methods, which perform the
+    operation using one of the pool connections (see `ConnectionX` for
+    the methods description). Doesn't touch the original methods.
+
+    `observers` list is shared with all the pool connections, so
+    observers added to it receive events of the every connection.
+
+    With `coalesce_reads` concurrent identical reads (`named_fetch`,
+    `named_fetchval`, `named_fetchrow` and their typed versions with the
+    same read-only query, see `query.is_read_only_query`, and arguments
+    values) share one execution and one pool
+    connection (see `singleflight.SingleFlight`), the result is shared
+    between the callers and must not be mutated. Reads with unhashable
+    arguments values (like lists) are not coalesced.
+
+    Queries of the `registry` are prepared on the every new connection
+    before it's used (see `ConnectionX.named_warmup`), the warm-up of
+    the single connection is limited by `warmup_timeout` seconds. Pool
+    connections are created concurrently, so are their warm-ups.
+
+    With `limiter` the named methods wait for the place of the query class
+    before acquiring the connection (see `limits.ConcurrencyLimiter`), so
+    one class of queries couldn't take all the pool connections.
+
+    Reads of the queries added to the `result_cache` are served from it
+    (see `result_cache.ResultCache`), its misses are coalesced if it's
+    enabled.
+    """
+
+    __slots__ = (
+        'observers',
+        'coalesce_reads',
+        'registry',
+        'warmup_timeout',
+        'limiter',
+        'result_cache',
+        '_single_flight',
+    )
+
+    # pylint: disable=too-many-arguments
+    def __init__(
+        self,
+        *args: typing.Any,
+        observers: typing.Iterable[observers_module.QueryObserver] = (),
+        coalesce_reads: bool = False,
+        registry: typing.Optional[typing.Iterable[str]] = None,
+        warmup_timeout: typing.Optional[float] = None,
+        limiter: typing.Optional[limits.ConcurrencyLimiter] = None,
+        result_cache: typing.Optional[result_cache_module.ResultCache] = None,
+        **kwargs: typing.Any,
+    ):
+        self.observers: typing.List[observers_module.QueryObserver] = list(observers)
+        self.coalesce_reads = coalesce_reads
+        self.registry = registry
+        self.warmup_timeout = warmup_timeout
+        self.limiter = limiter
+        self.result_cache = result_cache
+        self._single_flight = singleflight.SingleFlight()
+        super().__init__(*args, **kwargs)
+
+    async def _get_new_connection(self) -> asyncpg.Connection:
+        connection = await super()._get_new_connection()
+        if hasattr(connection, 'observers'):
+            connection.observers = self.observers
+        if self.registry is not None and hasattr(connection, 'named_warmup'):
+            await connection.named_warmup(self.registry, timeout=self.warmup_timeout)
+        return connection
+
+    async def _execute_read(
+        self,
+        key: typing.Tuple,
+        query: str,
+        args: query_module.Arguments,
+        call: typing.Callable[[typing.Any], typing.Awaitable[T]],
+    ) -> T:
+        """Return the cached result of the call or run `call` with the pool
+        connection."""
+        if self.result_cache is not None and query in self.result_cache:
+            return await self.result_cache.fetch(
+                key,
+                query,
+                args,
+                lambda: self._execute_coalesced(key, query, args, call),
+                trusted=getattr(self._connection_class, 'trusted_arguments', False),
+            )
+        return await self._execute_coalesced(key, query, args, call)
+
+    async def _execute_coalesced(
+        self,
+        key: typing.Tuple,
+        query: str,
+        args: query_module.Arguments,
+        call: typing.Callable[[typing.Any], typing.Awaitable[T]],
+    ) -> T:
+        """Run `call` with the pool connection coalescing it with the
+        identical concurrent read-only calls if it's enabled."""
+        if self.coalesce_reads and query_module.parse_query(query).read_only:
+            # values in the query order define the query result regardless of the connection options,
+            # arguments are checked before joining the flight, as the leader's call checks only its own ones
+            call_key = key + (query, self._bind_arguments(query, args))
+            try:
+                hash(call_key)
+            except TypeError:
+                pass
+            else:
+                return await self._single_flight.do(call_key, lambda: self._execute(query, call))
+        return await self._execute(query, call)
+
+    def _bind_arguments(self, query: str, args: query_module.Arguments) -> typing.Tuple:
+        """Bind values of the arguments in the query order checking them
+        the same way as the pool connections do."""
+        binder = query_module.parse_query(query).binder
+        if getattr(self._connection_class, 'trusted_arguments', False):
+            return binder.bind_trusted(args)
+        return binder.bind(args)
+
+    async def _execute(self, query: str, call: typing.Callable[[typing.Any], typing.Awaitable[T]]) -> T:
+        """Run `call` with the pool connection within the `limiter` place
+        of the query class."""
+        if self.limiter is not None:
+            async with self.limiter.limit(query):
+                async with self.acquire() as connection:
+                    return await call(connection)
+        async with self.acquire() as connection:
+            return await call(connection)
+
+    async def named_execute(
+        self, query: str, args: query_module.Arguments, timeout: typing.Optional[float] = None
+    ) -> str:
+        """Extended versions of `execute` with support of the named parameters.
+
+        :param query: SQL query to execute (could include named parameters).
+        :param args: Dict (or other mapping or object) with the parameters values.
+        :param timeout: Optional timeout value in seconds.
+        """
+        return await self._execute(query, lambda connection: connection.named_execute(query, args, timeout=timeout))
+
+    async def named_executemany(
+        self,
+        query: str,
+        args: typing.Iterable[query_module.Arguments],
+        *,
+        timeout: typing.Optional[float] = None,
+        use_copy: bool = False,
+    ) -> None:
+        """Extended versions of `executemany` with support of the named
+        parameters.
+
+        :param query: SQL query to execute (could include named parameters).
+        :param args: List of dicts (or other mappings or objects) with the parameters values.
+        :param timeout: Optional timeout value in seconds.
+        :param use_copy: Load the rows with the `COPY` protocol (only for the plain `INSERT` queries).
+        """
+        await self._execute(
+            query, lambda connection: connection.named_executemany(query, args, timeout=timeout, use_copy=use_copy)
+        )
+
+    async def named_executemany_returning(
+        self,
+        query: str,
+        args: typing.Iterable[query_module.Arguments],
+        *,
+        chunk_size: int = query_module.DEFAULT_BATCH_SIZE,
+        timeout: typing.Optional[float] = None,
+    ) -> typing.List[asyncpg.Record]:
+        """Version of `named_executemany` returning rows of the `RETURNING`
+        clause in the order of the input rows.
+
+        :param query: SQL query to execute (could include named parameters).
+        :param args: List of dicts (or other mappings or objects) with the parameters values.
+        :param chunk_size: Number of rows sent with one statement.
+        :param timeout: Optional timeout value in seconds for the every statement.
+        """
+        return await self._execute(
+            query,
+            lambda connection: connection.named_executemany_returning(
+                query, args, chunk_size=chunk_size, timeout=timeout
+            ),
+        )
+
+    # pylint: disable=redefined-builtin
+    async def named_copy_from_query(
+        self,
+        query: str,
+        args: query_module.Arguments,
+        *,
+        output: typing.Any,
+        timeout: typing.Optional[float] = None,
+        format: typing.Optional[str] = None,
+        **copy_options: typing.Any,
+    ) -> str:
+        """Extended version of `copy_from_query` with support of the named
+        parameters.
+
+        :param query: SQL query to export (could include named parameters).
+        :param args: Dict (or other mapping or object) with the parameters values.
+        :param output: Path, file-like object or coroutine function receiving the chunks of data.
+        :param timeout: Optional timeout value in seconds.
+        :param format: Data format (`text`, `csv` or `binary`).
+        :param copy_options: Other `COPY` options of the asyncpg `copy_from_query` (like `header` or `delimiter`).
+        :return: Status of the `COPY` command.
+        """
+        return await self._execute(
+            query,
+            lambda connection: connection.named_copy_from_query(
+                query, args, output=output, timeout=timeout, format=format, **copy_options
+            ),
+        )
+
+    async def named_fetch(
+        self, query: str, args: query_module.Arguments, timeout: typing.Optional[float] = None
+    ) -> typing.List[asyncpg.Record]:
+        """Extended versions of `fetch` with support of the named parameters.
+
+        :param query: SQL query to execute (could include named parameters).
+        :param args: Dict (or other mapping or object) with the parameters values.
+        :param timeout: Optional timeout value in seconds.
+        """
+        return await self._execute_read(
+            ('fetch',), query, args, lambda connection: connection.named_fetch(query, args, timeout=timeout)
+        )
+
+    async def named_fetchval(
+        self, query: str, args: query_module.Arguments, column: int = 0, timeout: typing.Optional[float] = None
+    ) -> typing.Optional[typing.Any]:
+        """Extended versions of `fetchval` with support of the named
+        parameters.
+
+        :param query: SQL query to execute (could include named parameters).
+        :param args: Dict (or other mapping or object) with the parameters values.
+        :param column: Numeric index within the record of the value to return.
+        :param timeout: Optional timeout value in seconds.
+        """
+        return await self._execute_read(
+            ('fetchval', column),
+            query,
+            args,
+            lambda connection: connection.named_fetchval(query, args, column=column, timeout=timeout),
+        )
+
+    async def named_fetchrow(
+        self, query: str, args: query_module.Arguments, timeout: typing.Optional[float] = None
+    ) -> typing.Optional[asyncpg.Record]:
+        """Extended versions of `fetchrow` with support of the named
+        parameters.
+
+        :param query: SQL query to execute (could include named parameters).
+        :param args: Dict (or other mapping or object) with the parameters values.
+        :param timeout: Optional timeout value in seconds.
+        """
+        return await self._execute_read(
+            ('fetchrow',), query, args, lambda connection: connection.named_fetchrow(query, args, timeout=timeout)
+        )
+
+    async def named_fetch_as(
+        self,
+        model: typing.Type[rows_module.ModelT],
+        query: str,
+        args: query_module.Arguments,
+        timeout: typing.Optional[float] = None,
+    ) -> typing.List[rows_module.ModelT]:
+        """Version of `named_fetch` returning the rows as the `model`
+        instances.
+
+        :param model: Dataclass, named tuple or class with `__slots__` with the fields named as the result columns.
+        :param query: SQL query to execute (could include named parameters).
+        :param args: Dict (or other mapping or object) with the parameters values.
+        :param timeout: Optional timeout value in seconds.
+        """
+        return await self._execute_read(
+            ('fetch_as', model),
+            query,
+            args,
+            lambda connection: connection.named_fetch_as(model, query, args, timeout=timeout),
+        )
+
+    async def named_fetchrow_as(
+        self,
+        model: typing.Type[rows_module.ModelT],
+        query: str,
+        args: query_module.Arguments,
+        timeout: typing.Optional[float] = None,
+    ) -> typing.Optional[rows_module.ModelT]:
+        """Version of `named_fetchrow` returning the row as the `model`
+        instance.
+
+        :param model: Dataclass, named tuple or class with `__slots__` with the fields named as the result columns.
+        :param query: SQL query to execute (could include named parameters).
+        :param args: Dict (or other mapping or object) with the parameters values.
+        :param timeout: Optional timeout value in seconds.
+        """
+        return await self._execute_read(
+            ('fetchrow_as', model),
+            query,
+            args,
+            lambda connection: connection.named_fetchrow_as(model, query, args, timeout=timeout),
+        )
@@ -5,7 +5,14 @@ import asyncpg
 import asyncpg.cursor
 import asyncpg.prepared_stmt
 
+from asyncpgx import columns as columns_module
+from asyncpgx import cursors as cursors_module
+from asyncpgx import observers as observers_module
 from asyncpgx import query as query_module
+from asyncpgx import rows as rows_module
+
+
+T = typing.TypeVar('T')
 
 
 class PreparedStatementX(asyncpg.prepared_stmt.PreparedStatement):
@@ -15,7 +22,7 @@ class PreparedStatementX(asyncpg.prepared_stmt.PreparedStatement):
     ones
     """
 
-    __slots__ = ('_original_query', '_params_order_list')
+    __slots__ = ('_original_query', '_params_order_list', '_bind', '_use_cache', '_observers')
 
     # pylint: disable=too-many-arguments
     def __init__(
@@ -25,55 +32,261 @@ class PreparedStatementX(asyncpg.prepared_stmt.PreparedStatement):
         state: typing.Any,  # i couldn't import PreparedStatementState
         original_query: str,
         params_order_list: typing.List,
+        *,
+        binder: typing.Optional[query_module.QueryParamsBinder] = None,
+        trusted_arguments: bool = False,
+        use_cache: bool = False,
+        observers: typing.Sequence[observers_module.QueryObserver] = (),
     ):
         super().__init__(connection, query, state)
         self._original_query = original_query
         self._params_order_list = params_order_list
+        if binder is None:
+            binder = query_module.QueryParamsBinder(params_order_list)
+        self._bind = binder.bind_trusted if trusted_arguments else binder.bind
+        # statement state is shared with the connection statement cache
+        self._use_cache = use_cache
+        self._observers = observers
 
     def named_cursor(
         self,
-        args: typing.Dict,
+        args: query_module.Arguments,
         prefetch: typing.Optional[int] = None,
         timeout: typing.Optional[float] = None,
     ) -> asyncpg.cursor.CursorFactory:
         """Extended version of `cursor` with support of the named parameters.
 
-        :param args: Dict with the parameters values.
+        :param args: Dict (or other mapping or object) with the parameters values.
         :param prefetch: The number of rows the *cursor iterator* will prefetch (defaults to ``50``.)
         :param timeout: Optional timeout value in seconds.
         """
-        prepared_args = query_module.QueryParamsDictConverter().prepare_asyncpg_args(args, self._params_order_list)
+        prepared_args = self._bind(args)
         return super().cursor(*prepared_args, prefetch=prefetch, timeout=timeout)
 
+    def named_iter_batches(
+        self,
+        args: query_module.Arguments,
+        *,
+        batch_size: int = query_module.DEFAULT_BATCH_SIZE,
+        prefetch: bool = True,
+        columnar: bool = False,
+        use_numpy: typing.Optional[bool] = None,
+        timeout: typing.Optional[float] = None,
+    ) -> typing.AsyncGenerator[typing.Any, None]:
+        """Iterate over the statement result by batches read with the
+        server-side cursor (see `ConnectionX.named_iter_batches`).
+
+        :param args: Dict (or other mapping or object) with the parameters values.
+        :param batch_size: Number of rows in the every batch.
+        :param prefetch: Fetch the next batch while the current one is being processed.
+        :param columnar: Yield batches as mappings of the column name to its values instead of the lists of records.
+        :param use_numpy: Return numeric, boolean, date and timestamp columns without NULLs as NumPy arrays
+            in the columnar mode. By default NumPy is used when it's installed.
+        :param timeout: Optional timeout value in seconds for the every batch.
+        """
+        # pylint: disable=duplicate-code
+        return cursors_module.iter_batches(
+            self._connection,
+            self,
+            self._bind(args),
+            batch_size=batch_size,
+            prefetch=prefetch,
+            columnar=columnar,
+            use_numpy=use_numpy,
+            timeout=timeout,
+        )
+
     async def named_fetch(
-        self, args: typing.Dict, timeout: typing.Optional[float] = None
+        self, args: query_module.Arguments, timeout: typing.Optional[float] = None
     ) -> typing.List[asyncpg.Record]:
         """Extended version of `fetch` with support of the named parameters.
 
-        :param args: Dict with the parameters values.
+        :param args: Dict (or other mapping or object) with the parameters values.
         :param timeout: Optional timeout value in seconds.
         """
-        prepared_args = query_module.QueryParamsDictConverter().prepare_asyncpg_args(args, self._params_order_list)
-        query_result: typing.List[asyncpg.Record] = await super().fetch(*prepared_args, timeout=timeout)
+        if self._observers:
+            return await self._execute_observed('prepared_fetch', args, super().fetch, timeout=timeout)
+
+        prepared_args = self._bind(args)
+        query_result: typing.List[asyncpg.Record] = await self._execute(super().fetch, *prepared_args, timeout=timeout)
         return query_result
 
     async def named_fetchval(
-        self, args: typing.Dict, column: int = 0, timeout: typing.Optional[float] = None
+        self, args: query_module.Arguments, column: int = 0, timeout: typing.Optional[float] = None
     ) -> typing.Any:
         """Extended version of `fetchval` with support of the named parameters.
 
-        :param args: Dict with the parameters values.
+        :param args: Dict (or other mapping or object) with the parameters values.
         :param column: Numeric index within the record of the value to return.
         :param timeout: Optional timeout value in seconds.
         """
-        prepared_args = query_module.QueryParamsDictConverter().prepare_asyncpg_args(args, self._params_order_list)
-        return await super().fetchval(*prepared_args, column=column, timeout=timeout)
+        if self._observers:
+            return await self._execute_observed(
+                'prepared_fetchval', args, super().fetchval, column=column, timeout=timeout
+            )
+
+        prepared_args = self._bind(args)
+        return await self._execute(super().fetchval, *prepared_args, column=column, timeout=timeout)
 
-    async def named_fetchrow(self, args: typing.Dict, timeout: typing.Optional[float] = None) -> asyncpg.Record:
+    async def named_fetchrow(
+        self, args: query_module.Arguments, timeout: typing.Optional[float] = None
+    ) -> asyncpg.Record:
         """Extended version of `fetchrow` with support of the named parameters.
 
-        :param args: Dict with the parameters values.
+        :param args: Dict (or other mapping or object) with the parameters values.
+        :param timeout: Optional timeout value in seconds.
+        """
+        if self._observers:
+            return await self._execute_observed('prepared_fetchrow', args, super().fetchrow, timeout=timeout)
+
+        prepared_args = self._bind(args)
+        return await self._execute(super().fetchrow, *prepared_args, timeout=timeout)
+
+    async def named_fetch_as(
+        self,
+        model: typing.Type[rows_module.ModelT],
+        args: query_module.Arguments,
+        timeout: typing.Optional[float] = None,
+    ) -> typing.List[rows_module.ModelT]:
+        """Version of `named_fetch` returning the rows as the `model`
+        instances.
+
+        :param model: Dataclass, named tuple or class with `__slots__` with the fields named as the result columns.
+        :param args: Dict (or other mapping or object) with the parameters values.
+        :param timeout: Optional timeout value in seconds.
+        """
+        records = await self.named_fetch(args, timeout=timeout)
+        if not records:
+            return []
+        return list(map(self._get_row_factory(model), records))
+
+    async def named_fetchrow_as(
+        self,
+        model: typing.Type[rows_module.ModelT],
+        args: query_module.Arguments,
+        timeout: typing.Optional[float] = None,
+    ) -> typing.Optional[rows_module.ModelT]:
+        """Version of `named_fetchrow` returning the row as the `model`
+        instance.
+
+        :param model: Dataclass, named tuple or class with `__slots__` with the fields named as the result columns.
+        :param args: Dict (or other mapping or object) with the parameters values.
         :param timeout: Optional timeout value in seconds.
         """
-        prepared_args = query_module.QueryParamsDictConverter().prepare_asyncpg_args(args, self._params_order_list)
-        return await super().fetchrow(*prepared_args, timeout=timeout)
+        record = await self.named_fetchrow(args, timeout=timeout)
+        if record is None:
+            return None
+        instance: rows_module.ModelT = self._get_row_factory(model)(record)
+        return instance
+
+    def _get_row_factory(self, model: type) -> rows_module.RowFactory:
+        """Return row factory of the model for the statement attributes."""
+        return rows_module.get_row_factory(model, [attribute.name for attribute in self.get_attributes()])
+
+    # pylint: disable=redefined-builtin
+    async def named_copy_from_query(
+        self,
+        args: query_module.Arguments,
+        *,
+        output: typing.Any,
+        timeout: typing.Optional[float] = None,
+        format: typing.Optional[str] = None,
+        **copy_options: typing.Any,
+    ) -> str:
+        """Export the statement result with `COPY (query) TO STDOUT` (see
+        `ConnectionX.named_copy_from_query`).
+
+        `COPY` couldn't be prepared, so only the translated query is
+        reused.
+
+        :param args: Dict (or other mapping or object) with the parameters values.
+        :param output: Path, file-like object or coroutine function receiving the chunks of data.
+        :param timeout: Optional timeout value in seconds.
+        :param format: Data format (`text`, `csv` or `binary`).
+        :param copy_options: Other `COPY` options of the asyncpg `copy_from_query` (like `header` or `delimiter`).
+        :return: Status of the `COPY` command.
+        """
+        # pylint: disable=duplicate-code
+        status: str = await self._connection.copy_from_query(
+            query_module.strip_query_end(self.get_query()),
+            *self._bind(args),
+            output=output,
+            timeout=timeout,
+            format=format,
+            **copy_options,
+        )
+        return status
+
+    async def named_fetch_columns(
+        self,
+        args: query_module.Arguments,
+        *,
+        batch_size: int = query_module.DEFAULT_BATCH_SIZE,
+        use_numpy: typing.Optional[bool] = None,
+        timeout: typing.Optional[float] = None,
+    ) -> columns_module.Columns:
+        """Version of `named_fetch` returning the result as a mapping of the
+        column name to the list of its values.
+
+        :param args: Dict (or other mapping or object) with the parameters values.
+        :param batch_size: Number of rows fetched in one round trip.
+        :param use_numpy: Return numeric, boolean, date and timestamp columns without NULLs as NumPy arrays.
+            By default NumPy is used when it's installed.
+        :param timeout: Optional timeout value in seconds.
+        """
+        return await columns_module.fetch_columns(
+            self._connection, self, self._bind(args), batch_size=batch_size, use_numpy=use_numpy, timeout=timeout
+        )
+
+    async def _execute(
+        self, method: typing.Callable[..., typing.Awaitable[T]], *args: typing.Any, **kwargs: typing.Any
+    ) -> T:
+        """Call the execution method.
+
+        Statements from the connection cache are re-prepared after the
+        schema changes the same way as asyncpg does it for the cached
+        statements: the connection (or the pool) statement cache is
+        dropped and the call is retried once if there is no transaction.
+        """
+        if not self._use_cache:
+            return await method(*args, **kwargs)
+
+        if self._state.closed:
+            await self._refresh_state(kwargs.get('timeout'))
+        try:
+            return await method(*args, **kwargs)
+        except asyncpg.exceptions.InvalidCachedStatementError:
+            # pylint: disable=protected-access
+            self._connection._drop_global_statement_cache()
+            if self._connection.is_in_transaction():
+                raise
+            await self._refresh_state(kwargs.get('timeout'))
+            return await method(*args, **kwargs)
+
+    async def _execute_observed(
+        self,
+        method_name: str,
+        args: query_module.Arguments,
+        method: typing.Callable[..., typing.Awaitable[T]],
+        **kwargs: typing.Any,
+    ) -> T:
+        """Bind arguments and call the execution method measuring its
+        phases and notify observers (the query is parsed on prepare, so
+        parse time is always zero)."""
+        with observers_module.ObservedQuery(self._observers, method_name, self._original_query, args) as observed_query:
+            observed_query.mark()
+            prepared_args = self._bind(args)
+            observed_query.mark()
+            observed_query.result = await self._execute(method, *prepared_args, **kwargs)
+            return typing.cast(T, observed_query.result)
+
+    async def _refresh_state(self, timeout: typing.Optional[float]) -> None:
+        """Replace statement state with the one from the connection
+        statement cache."""
+        # pylint: disable=protected-access
+        state = await self._connection._get_statement(self._query, timeout, named=True, use_cache=True)
+        state.attach()
+        old_state: typing.Any = self._state  # type: ignore[has-type]
+        self._state = state  # type: ignore  # slot is defined in asyncpg
+        old_state.detach()
+        self._connection._maybe_gc_stmt(old_state)
@@ -1,28 +1,486 @@
 """Module with tools for queries processing."""
 import abc
+import collections.abc
+import functools
+import hashlib
+import operator
 import re
+import string
 import typing
 
+from asyncpgx import cache
 from asyncpgx import exceptions
 
 
-PARAMS_REGEXP = re.compile(r"(?<![:\w\x5c]):(\w+)(?!:)", re.UNICODE)
+DEFAULT_QUERY_CACHE_SIZE = 1024
+# default number of rows sent or fetched in one round trip by the batch methods
+DEFAULT_BATCH_SIZE = 1000
+# lists longer than this are passed as arrays instead of being expanded to the separate parameters
+MAX_EXPANDED_LIST_SIZE = 1024
+LIST_PARAMS_ANY = 'any'
+LIST_PARAMS_EXPAND = 'expand'
+_NOT_PARSED = object()
+# mapping or object (i.e. dataclass, named tuple or class with `__slots__`) with the named parameters values
+Arguments = typing.Any
 
+TOKEN_CODE = 'code'
+TOKEN_LITERAL = 'literal'
+TOKEN_COMMENT = 'comment'
+TOKEN_PARAM = 'param'
 
-def construct_asyncpg_query(query: str) -> typing.Tuple[str, typing.List]:
-    """Construct asyncpg query from high-level one."""
-    i = 1
-    params_order_list = []
+# every alternative starts with its own literal character, so the kind of the token is defined by
+# the first character of the match and `re` could skip the plain code quickly; alternatives are
+# unambiguous, so the search never backtracks more than one token; `::type` casts are never
+# matched because of the parameter lookbehind
+_TOKEN_REGEXP = re.compile(
+    r"""
+    :(?<![:\w\x5c]:)\w+
+    |'[^']*(?:''[^']*)*(?:'|\Z)
+    |"[^"]*(?:""[^"]*)*(?:"|\Z)
+    |--[^\n]*
+    |/\*
+    |\$(?<![\w$]\$)(?:[^\W\d]\w*)?\$
+    """,
+    re.VERBOSE,
+)
+_ESCAPE_STRING_REGEXP = re.compile(r"(?<![\w$])[eE]'[^'\x5c]*(?:(?:\x5c.|'')[^'\x5c]*)*(?:'|\Z)", re.DOTALL)
+_BLOCK_COMMENT_REGEXP = re.compile(r'/\*|\*/')
+_IDENTIFIER = r'(?:[^\W\d][\w$]*|"(?:[^"]|"")*")'
+_IDENTIFIER_REGEXP = re.compile(_IDENTIFIER)
+# parameters are replaced with the `_PARAM_MARKER` before matching
+_PARAM_MARKER = '\x00'
+_PLAIN_INSERT_REGEXP = re.compile(
+    rf"""
+    \s*INSERT\s+INTO\s+(?:(?P<schema>{_IDENTIFIER})\s*\.\s*)?(?P<table>{_IDENTIFIER})\s*
+    \((?P<columns>\s*{_IDENTIFIER}\s*(?:,\s*{_IDENTIFIER}\s*)*)\)\s*
+    VALUES\s*\((?P<values>\s*{_PARAM_MARKER}\s*(?:,\s*{_PARAM_MARKER}\s*)*)\)\s*;?\s*\Z
+    """,
+    re.VERBOSE | re.IGNORECASE,
+)
+# literals and comments are replaced with the `_LITERAL_MARKER` before rewriting
+_LITERAL_MARKER = '\x01'
+_LITERAL_MARKER_REGEXP = re.compile(_LITERAL_MARKER)
+_INSERT_VALUES_REGEXP = re.compile(r'\s*INSERT\s+INTO\s.*?(?P<values>\bVALUES\s*\()', re.DOTALL | re.IGNORECASE)
+_ON_CONFLICT_REGEXP = re.compile(r'(?<![\w$])ON\s+CONFLICT(?![\w$])', re.IGNORECASE)
+_DEFAULT_REGEXP = re.compile(r'(?<![\w$"])DEFAULT(?![\w$"])', re.IGNORECASE)
+_SUBQUERY_REGEXP = re.compile(r'\(\s*(?:SELECT|WITH|VALUES|TABLE)(?![\w$])', re.IGNORECASE)
+_UNNEST_ALIAS = '_asyncpgx_rows'
+_UNNEST_ORDINALITY = '_asyncpgx_ordinality'
+# `IN` operator before the list parameter
+_IN_REGEXP = re.compile(r'(?<![\w$])(?:(?P<not>NOT)\s+)?IN\s*\Z', re.IGNORECASE)
+# parentheses of the `POSITION(substring IN string)` calls, whose `IN` isn't the operator
+_PARENTHESIS_REGEXP = re.compile(r'(?<![\w$])(?P<position>POSITION)\s*\(|\(|\)', re.IGNORECASE)
+# types of the list parameters values which are expanded
+_LIST_VALUE_TYPES = (list, tuple, set, frozenset)
+_LIST_ITEM_SUFFIX_REGEXP = re.compile(r'\[\d+\]\Z')
+# statements which could be read-only and keywords (or functions) which make them write
+_READ_STATEMENT_REGEXP = re.compile(r'\s*(?:\(\s*)*(?:SELECT|WITH|VALUES|TABLE|SHOW)(?![\w$])', re.IGNORECASE)
+_WRITE_KEYWORD_REGEXP = re.compile(
+    r'(?<![\w$])(?:INSERT|UPDATE|DELETE|MERGE|INTO|SHARE|NEXTVAL|SETVAL)(?![\w$])|;\s*\S', re.IGNORECASE
+)
+_TOKEN_KINDS = {
+    "'": TOKEN_LITERAL,
+    '"': TOKEN_LITERAL,
+    '$': TOKEN_LITERAL,
+    '-': TOKEN_COMMENT,
+    '/': TOKEN_COMMENT,
+}
 
-    def _construct_replacement(match_obj: typing.Match) -> str:
-        nonlocal i
-        new_numeric_param = f'${i}'
-        params_order_list.append(match_obj.group(0)[1::])
-        i += 1
-        return new_numeric_param
 
-    query = PARAMS_REGEXP.sub(_construct_replacement, query)
-    return query, params_order_list
+def tokenize_query(query: str) -> typing.Iterator[typing.Tuple[str, str]]:
+    """Split query into `(kind, value)` tokens in a single pass.
+
+    Kinds are: `TOKEN_CODE` for the plain SQL code (including `::type`
+    casts), `TOKEN_LITERAL` for string constants (standard, `E'...'` and
+    `$tag$...$tag$` ones) and quoted identifiers, `TOKEN_COMMENT` for the
+    comments and `TOKEN_PARAM` for the named parameters (value is the
+    parameter name without colon). Joined values of all the tokens
+    except parameters give the original query back.
+    """
+    code_start = 0
+    position = 0
+    search = _TOKEN_REGEXP.search
+    while True:
+        match = search(query, position)
+        if match is None:
+            break
+
+        start, position = match.span()
+        first_char = query[start]
+        if first_char == "'" and start and query[start - 1] in 'eE':
+            escape_string_match = _ESCAPE_STRING_REGEXP.match(query, start - 1)
+            if escape_string_match is not None:
+                start, position = escape_string_match.span()
+        elif first_char == '/':
+            position = _find_block_comment_end(query, position)
+        elif first_char == '$':
+            tag = match.group()
+            tag_end = query.find(tag, position)
+            position = len(query) if tag_end == -1 else tag_end + len(tag)
+
+        if start > code_start:
+            yield TOKEN_CODE, query[code_start:start]
+        if first_char == ':':
+            yield TOKEN_PARAM, query[start + 1 : position]
+        else:
+            yield _TOKEN_KINDS[first_char], query[start:position]
+        code_start = position
+
+    if code_start < len(query):
+        yield TOKEN_CODE, query[code_start:]
+
+
+def _find_block_comment_end(query: str, position: int) -> int:
+    """Find the end of the (possibly nested) block comment."""
+    depth = 1
+    for match in _BLOCK_COMMENT_REGEXP.finditer(query, position):
+        depth += 1 if match.group() == '/*' else -1
+        if not depth:
+            return match.end()
+    return len(query)
+
+
+def construct_asyncpg_query(
+    query: str, deduplicate_params: bool = False, list_params: typing.Optional[typing.Mapping[str, int]] = None
+) -> typing.Tuple[str, typing.List]:
+    """Construct asyncpg query from high-level one.
+
+    With `deduplicate_params` every occurrence of the same named
+    parameter is mapped to the single positional one, so its value is
+    encoded and sent only once.
+
+    `list_params` maps names of the list parameters (see
+    `find_list_params`) to their expanded size: zero rewrites
+    `IN :name` to `= ANY($n)` (`NOT IN :name` to `<> ALL($n)`), positive
+    size `n` rewrites it to `IN ($n, ...)` with `n` parameters named
+    `name[0]`, `name[1]` and so on.
+    """
+    params_order_list: typing.List[str] = []
+    params_indexes: typing.Dict[str, int] = {}
+    list_params_placeholders: typing.Dict[str, str] = {}
+
+    query_parts: typing.List[str] = []
+    parentheses: typing.List[bool] = []
+    previous_kind = None
+    for kind, value in tokenize_query(query):
+        in_match = None
+        if kind == TOKEN_CODE and list_params:
+            _track_parentheses(value, parentheses)
+        elif kind == TOKEN_PARAM and list_params and value in list_params and previous_kind == TOKEN_CODE:
+            in_match = _match_in_operator(query_parts[-1], parentheses)
+
+        if kind != TOKEN_PARAM:
+            query_parts.append(value)
+        elif in_match is not None:
+            size = typing.cast(typing.Mapping[str, int], list_params)[value]
+            placeholder = list_params_placeholders.get(value) if deduplicate_params else None
+            if placeholder is None:
+                placeholder = _construct_list_placeholder(value, size, params_order_list)
+                list_params_placeholders[value] = placeholder
+            query_parts.append(_rewrite_in_operator(query_parts.pop(), in_match, placeholder, size))
+        elif deduplicate_params and value in params_indexes:
+            query_parts.append(f'${params_indexes[value]}')
+        else:
+            params_order_list.append(value)
+            params_indexes[value] = len(params_order_list)
+            query_parts.append(f'${len(params_order_list)}')
+        previous_kind = kind
+
+    return ''.join(query_parts), params_order_list
+
+
+def find_list_params(query: str) -> typing.List[str]:
+    """Find names of the list parameters, which are used as the right
+    operand of the `IN` (or `NOT IN`) operator without parentheses, like
+    `WHERE id IN :ids` (`IN` of the `POSITION` call isn't the operator)."""
+    list_params: typing.List[str] = []
+    parentheses: typing.List[bool] = []
+    previous_kind = previous_value = None
+    for kind, value in tokenize_query(query):
+        if kind == TOKEN_CODE:
+            _track_parentheses(value, parentheses)
+        elif (
+            kind == TOKEN_PARAM
+            and previous_kind == TOKEN_CODE
+            and value not in list_params
+            and _match_in_operator(typing.cast(str, previous_value), parentheses)
+        ):
+            list_params.append(value)
+        previous_kind, previous_value = kind, value
+    return list_params
+
+
+def _track_parentheses(code: str, parentheses: typing.List[bool]) -> None:
+    """Update stack of the open parentheses, which marks the ones of the
+    `POSITION` calls."""
+    for match in _PARENTHESIS_REGEXP.finditer(code):
+        if match.group() == ')':
+            if parentheses:
+                parentheses.pop()
+        else:
+            parentheses.append(match.group('position') is not None)
+
+
+def _match_in_operator(code: str, parentheses: typing.List[bool]) -> typing.Optional[typing.Match]:
+    """Match `IN` operator at the end of the code before the parameter,
+    except the `IN` of the `POSITION(substring IN string)` call."""
+    if parentheses and parentheses[-1]:
+        return None
+    return _IN_REGEXP.search(code)
+
+
+def get_list_param_size(values: typing.Sized) -> int:
+    """Return expanded size of the list parameter value: length of the
+    list rounded up to the power of two, so lists of the close lengths
+    share the same query.
+
+    Empty and too long lists (more than `MAX_EXPANDED_LIST_SIZE` items)
+    are not expanded and passed as arrays.
+    """
+    length = len(values)
+    if length > MAX_EXPANDED_LIST_SIZE:
+        return 0
+    return 1 << (length - 1).bit_length() if length else 0
+
+
+def _construct_list_placeholder(name: str, size: int, params_order_list: typing.List[str]) -> str:
+    if not size:
+        params_order_list.append(name)
+        return f'${len(params_order_list)}'
+
+    first_index = len(params_order_list) + 1
+    params_order_list.extend(f'{name}[{index}]' for index in range(size))
+    return ', '.join(f'${index}' for index in range(first_index, first_index + size))
+
+
+def _rewrite_in_operator(code: str, in_match: typing.Match, placeholder: str, size: int) -> str:
+    if size:
+        return f'{code}({placeholder})'
+    operator_code = '<> ALL' if in_match.group('not') else '= ANY'
+    return f'{code[: in_match.start()]}{operator_code}({placeholder})'
+
+
+# pylint: disable=too-few-public-methods
+class InsertQuery:
+    """Plain `INSERT INTO table (columns) VALUES (:params)` query."""
+
+    __slots__ = ('schema_name', 'table_name', 'columns', 'params_order_list', 'binder')
+
+    def __init__(
+        self,
+        schema_name: typing.Optional[str],
+        table_name: str,
+        columns: typing.List[str],
+        params_order_list: typing.List,
+    ):
+        self.schema_name = schema_name
+        self.table_name = table_name
+        self.columns = columns
+        # parameter name for the every column
+        self.params_order_list = params_order_list
+        self.binder = QueryParamsBinder(params_order_list)
+
+
+def parse_insert_query(query: str) -> typing.Optional[InsertQuery]:
+    """Parse plain `INSERT` query, where every value is a named parameter.
+
+    Returns `None` for the any other query.
+    """
+    query_parts = []
+    params = []
+    for kind, value in tokenize_query(query):
+        if kind == TOKEN_PARAM:
+            query_parts.append(_PARAM_MARKER)
+            params.append(value)
+        elif kind == TOKEN_COMMENT:
+            query_parts.append(' ')
+        elif kind == TOKEN_LITERAL and not value.startswith('"'):
+            return None
+        else:
+            query_parts.append(value)
+
+    match = _PLAIN_INSERT_REGEXP.match(''.join(query_parts))
+    if match is None:
+        return None
+
+    columns = [_unquote_identifier(column) for column in _IDENTIFIER_REGEXP.findall(match.group('columns'))]
+    if len(columns) != len(params):
+        return None
+
+    schema_name = match.group('schema')
+    return InsertQuery(
+        _unquote_identifier(schema_name) if schema_name else None,
+        _unquote_identifier(match.group('table')),
+        columns,
+        params,
+    )
+
+
+def is_read_only_query(query: str) -> bool:
+    """Check whether the query is a single read-only statement.
+
+    Read-only statements are `SELECT`, `WITH`, `VALUES`, `TABLE` and
+    `SHOW` ones without data modifications (including data-modifying
+    CTEs and `SELECT ... INTO`), row locks (`FOR UPDATE`, `FOR SHARE`,
+    etc.) and sequence functions. Literals, quoted identifiers and
+    comments are ignored. Side effects of the other called functions
+    are not detected.
+    """
+    code = ' '.join(value for kind, value in tokenize_query(query) if kind == TOKEN_CODE)
+    return bool(_READ_STATEMENT_REGEXP.match(code)) and not _WRITE_KEYWORD_REGEXP.search(code)
+
+
+def strip_query_end(query: str) -> str:
+    """Drop trailing comments, whitespaces and semicolons of the query, so
+    it could be embedded into another statement (like `COPY (query) TO
+    STDOUT`)."""
+    tokens = list(tokenize_query(query))
+    while tokens:
+        kind, value = tokens[-1]
+        if kind == TOKEN_CODE:
+            value = value.rstrip(string.whitespace + ';')
+            if value:
+                tokens[-1] = (kind, value)
+                break
+        elif kind != TOKEN_COMMENT:
+            break
+        tokens.pop()
+    return ''.join(f':{value}' if kind == TOKEN_PARAM else value for kind, value in tokens)
+
+
+def quote_identifier(name: str) -> str:
+    """Convert the name of the database object to the SQL identifier."""
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _unquote_identifier(identifier: str) -> str:
+    """Convert SQL identifier to the name of the database object."""
+    if identifier.startswith('"'):
+        return identifier[1:-1].replace('""', '"')
+    return identifier.lower()
+
+
+class UnnestQuery:
+    """Single row `INSERT ... VALUES (...)` query rewritten to insert all
+    the rows from the parameters arrays with `unnest`.
+
+    `on_conflict` is set for the queries with `ON CONFLICT` clause,
+    which could behave differently for the rows inserted by one
+    statement (e.g. `DO UPDATE` fails if the same row is affected twice).
+    `subquery` is set for the queries with subqueries, which see the
+    table as it was before the statement, not the previous rows (e.g.
+    `(SELECT max(id) + 1 FROM test)` returns the same value for all of
+    them).
+    """
+
+    __slots__ = ('params_order_list', 'binder', 'on_conflict', 'subquery', '_query_prefix', '_query_suffix', '_queries')
+
+    def __init__(
+        self,
+        params_order_list: typing.List[str],
+        query_prefix: str,
+        query_suffix: str,
+        on_conflict: bool = False,
+        subquery: bool = False,
+    ):
+        self.params_order_list = params_order_list
+        self.binder = QueryParamsBinder(params_order_list)
+        self.on_conflict = on_conflict
+        self.subquery = subquery
+        self._query_prefix = query_prefix
+        self._query_suffix = query_suffix
+        self._queries: typing.Dict[typing.Tuple[str, ...], str] = {}
+
+    def render(self, params_types: typing.Sequence[str]) -> str:
+        """Build asyncpg query for the given SQL types of the parameters."""
+        params_types = tuple(params_types)
+        unnest_query = self._queries.get(params_types)
+        if unnest_query is None:
+            arrays = ', '.join(f'${i}::{params_type}[]' for i, params_type in enumerate(params_types, 1))
+            unnest_query = self._queries[params_types] = f'{self._query_prefix}{arrays}{self._query_suffix}'
+        return unnest_query
+
+
+def construct_unnest_query(query: str) -> typing.Optional[UnnestQuery]:
+    """Rewrite `INSERT ... VALUES (...)` query with the named parameters to
+    the `INSERT ... SELECT ... FROM unnest(...)` one.
+
+    `ON CONFLICT` and `RETURNING` clauses are kept, rows are inserted
+    (and returned) in the order of the arrays. Returns `None` if the
+    query couldn't be rewritten.
+    """
+    masked_query, literals, params = _mask_query(query)
+    match = _INSERT_VALUES_REGEXP.match(masked_query)
+    if match is None or not params:
+        return None
+    values_end = _find_closing_parenthesis(masked_query, match.end())
+    if values_end is None:
+        return None
+
+    head = masked_query[: match.start('values')]
+    values = masked_query[match.end() : values_end]
+    tail = masked_query[values_end + 1 :]
+    if _PARAM_MARKER in head or _PARAM_MARKER in tail or tail.lstrip().startswith(','):
+        return None
+    # `DEFAULT` is allowed only in the `VALUES` list, not in the `SELECT` one
+    if _DEFAULT_REGEXP.search(values):
+        return None
+
+    params_order_list = list(dict.fromkeys(params))
+    params_iterator = iter(params)
+    values = re.sub(_PARAM_MARKER, lambda _: f'{_UNNEST_ALIAS}."{next(params_iterator)}"', values)
+    columns = ', '.join(f'"{param}"' for param in params_order_list)
+    query_prefix = f'{head}SELECT {values} FROM unnest('
+    query_suffix = (
+        f') WITH ORDINALITY AS {_UNNEST_ALIAS}({columns}, {_UNNEST_ORDINALITY}) '
+        f'ORDER BY {_UNNEST_ALIAS}.{_UNNEST_ORDINALITY}{tail}'
+    )
+
+    literals_iterator = iter(literals)
+    query_prefix = _LITERAL_MARKER_REGEXP.sub(lambda _: next(literals_iterator), query_prefix)
+    query_suffix = _LITERAL_MARKER_REGEXP.sub(lambda _: next(literals_iterator), query_suffix)
+    return UnnestQuery(
+        params_order_list,
+        query_prefix,
+        query_suffix,
+        on_conflict=bool(_ON_CONFLICT_REGEXP.search(tail)),
+        subquery=bool(_SUBQUERY_REGEXP.search(masked_query)),
+    )
+
+
+def _mask_query(query: str) -> typing.Tuple[str, typing.List[str], typing.List[str]]:
+    """Replace literals and comments with `_LITERAL_MARKER` and parameters
+    with `_PARAM_MARKER`.
+
+    Returns masked query, replaced literals and parameters names.
+    """
+    masked_parts = []
+    literals = []
+    params = []
+    for kind, value in tokenize_query(query):
+        if kind == TOKEN_PARAM:
+            masked_parts.append(_PARAM_MARKER)
+            params.append(value)
+        elif kind == TOKEN_CODE:
+            masked_parts.append(value)
+        else:
+            masked_parts.append(_LITERAL_MARKER)
+            literals.append(value)
+    return ''.join(masked_parts), literals, params
+
+
+def _find_closing_parenthesis(query: str, position: int) -> typing.Optional[int]:
+    """Find the parenthesis closing the one opened before `position`."""
+    depth = 1
+    for index in range(position, len(query)):
+        char = query[index]
+        if char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+            if not depth:
+                return index
+    return None
 
 
 # pylint: disable=too-few-public-methods
@@ -71,3 +529,309 @@ class QueryParamsDictConverter(QueryParamsConverter):
             raise exceptions.UnusedArgumentsError(f'Arguments: {unused_arguments} are unused')
 
         return asyncpg_args
+
+
+class QueryParamsBinder:
+    """Precompiled converter of the named parameters to the asyncpg
+    positional arguments.
+
+    Built once per query, so the per-call cost is a single `itemgetter`
+    call plus (in the strict mode) one length comparison.
+
+    Parameters values are taken either from the mapping or from the
+    attributes of the object (i.e. dataclass, named tuple or class with
+    `__slots__`). Accessor of the object attributes is compiled once per
+    object type. Unused arguments are checked only for the mappings.
+    """
+
+    __slots__ = ('_params_names', '_params_order_list', '_getter', '_object_getters')
+
+    def __init__(self, params_order_list: typing.Sequence[str]):
+        self._params_names = frozenset(params_order_list)
+        self._params_order_list = params_order_list
+        self._getter = _compile_getter(params_order_list)
+        self._object_getters: typing.Dict[type, typing.Callable[[typing.Any], typing.Tuple]] = {}
+
+    def bind(self, original_args: Arguments) -> typing.Tuple:
+        """Prepare asyncpg method arguments checking for missing and unused
+        ones."""
+        if not isinstance(original_args, (dict, collections.abc.Mapping)):
+            return self._bind_object(original_args)
+
+        asyncpg_args = self.bind_trusted(original_args)
+        if len(original_args) != len(self._params_names):
+            unused_arguments = set(original_args.keys()).difference(self._params_names)
+            raise exceptions.UnusedArgumentsError(f'Arguments: {unused_arguments} are unused')
+
+        return asyncpg_args
+
+    def bind_trusted(self, original_args: Arguments) -> typing.Tuple:
+        """Prepare asyncpg method arguments checking only for missing
+        ones."""
+        if not isinstance(original_args, (dict, collections.abc.Mapping)):
+            return self._bind_object(original_args)
+
+        try:
+            asyncpg_args: typing.Tuple = self._getter(original_args)
+        except KeyError as exc:
+            raise exceptions.MissingRequiredArgumentError(f'Missing required argument: {exc.args[0]}') from exc
+
+        return asyncpg_args
+
+    def bind_many(self, original_args: typing.Iterable[Arguments], trusted: bool = False) -> typing.List:
+        """Prepare asyncpg arguments for the every element of
+        `original_args`."""
+        bind = self.bind_trusted if trusted else self.bind
+        return [bind(args) for args in original_args]
+
+    def _bind_object(self, original_args: typing.Any) -> typing.Tuple:
+        """Take parameters values from the object attributes."""
+        object_type = type(original_args)
+        getter = self._object_getters.get(object_type)
+        if getter is None:
+            getter = self._object_getters[object_type] = _compile_object_getter(object_type, self._params_order_list)
+
+        try:
+            asyncpg_args: typing.Tuple = getter(original_args)
+        except AttributeError as exc:
+            raise exceptions.MissingRequiredArgumentError(
+                f'Missing required argument: {_find_missing_attribute(original_args, self._params_order_list)}'
+            ) from exc
+
+        return asyncpg_args
+
+
+class ListParamsBinder(QueryParamsBinder):
+    """Binder of the query with the expanded list parameters.
+
+    Values of the every list parameter are padded with its last item up
+    to the expanded size, which doesn't change the result of the `IN`
+    operator.
+    """
+
+    __slots__ = ('_list_params',)
+
+    def __init__(self, params_order_list: typing.Sequence[str], list_params: typing.Mapping[str, typing.Sequence[str]]):
+        super().__init__(params_order_list)
+        # expanded items names of the every list parameter
+        self._list_params = list_params
+        self._params_names = frozenset(_LIST_ITEM_SUFFIX_REGEXP.sub('', param_name) for param_name in params_order_list)
+
+    def bind_trusted(self, original_args: Arguments) -> typing.Tuple:
+        if not isinstance(original_args, (dict, collections.abc.Mapping)):
+            return self._bind_object(original_args)
+
+        expanded_args = dict(original_args)
+        for param_name, items_names in self._list_params.items():
+            try:
+                values = list(original_args[param_name])
+            except KeyError as exc:
+                raise exceptions.MissingRequiredArgumentError(f'Missing required argument: {param_name}') from exc
+            if not values or len(values) > len(items_names):
+                raise ValueError(
+                    f'Argument {param_name} must have from 1 to {len(items_names)} items, got {len(values)}'
+                )
+
+            values.extend(values[-1:] * (len(items_names) - len(values)))
+            expanded_args.update(zip(items_names, values))
+        return super().bind_trusted(expanded_args)
+
+    def _bind_object(self, original_args: typing.Any) -> typing.Tuple:
+        params_names = sorted(self._params_names)
+        try:
+            arguments = {param_name: getattr(original_args, param_name) for param_name in params_names}
+        except AttributeError as exc:
+            raise exceptions.MissingRequiredArgumentError(
+                f'Missing required argument: {_find_missing_attribute(original_args, params_names)}'
+            ) from exc
+        return self.bind_trusted(arguments)
+
+
+def _compile_getter(params_order_list: typing.Sequence[str]) -> typing.Callable[[typing.Mapping], typing.Tuple]:
+    """Compile function which extracts parameters values in the query
+    order."""
+    if not params_order_list:
+        return lambda original_args: ()
+    if len(params_order_list) == 1:
+        param = params_order_list[0]
+        return lambda original_args: (original_args[param],)
+    return operator.itemgetter(*params_order_list)
+
+
+def _compile_object_getter(
+    object_type: type, params_order_list: typing.Sequence[str]
+) -> typing.Callable[[typing.Any], typing.Tuple]:
+    """Compile function which extracts parameters values in the query
+    order from the object attributes (named tuples fields are taken by
+    their indexes)."""
+    if not params_order_list:
+        return lambda original_args: ()
+
+    fields = getattr(object_type, '_fields', None) if issubclass(object_type, tuple) else None
+    if fields is not None and set(params_order_list).issubset(fields):
+        indexes = [fields.index(param) for param in params_order_list]
+        if len(indexes) == 1:
+            index = indexes[0]
+            return lambda original_args: (original_args[index],)
+        return operator.itemgetter(*indexes)
+
+    if len(params_order_list) == 1:
+        param = params_order_list[0]
+        return lambda original_args: (getattr(original_args, param),)
+    return operator.attrgetter(*params_order_list)
+
+
+def _find_missing_attribute(original_args: typing.Any, params_names: typing.Iterable[str]) -> typing.Optional[str]:
+    return next((param_name for param_name in params_names if not hasattr(original_args, param_name)), None)
+
+
+# pylint: disable=too-many-instance-attributes
+class ParsedQuery:
+    """Named query translated to the asyncpg format."""
+
+    __slots__ = (
+        'original_query',
+        'converted_query',
+        'params_order_list',
+        'binder',
+        '_insert_query',
+        '_unnest_query',
+        '_list_params',
+        '_read_only',
+    )
+
+    def __init__(
+        self,
+        original_query: str,
+        converted_query: str,
+        params_order_list: typing.List,
+        binder: typing.Optional[QueryParamsBinder] = None,
+    ):
+        self.original_query = original_query
+        self.converted_query = converted_query
+        self.params_order_list = params_order_list
+        self.binder = QueryParamsBinder(params_order_list) if binder is None else binder
+        self._insert_query: typing.Any = _NOT_PARSED
+        self._unnest_query: typing.Any = _NOT_PARSED
+        self._list_params: typing.Any = _NOT_PARSED
+        self._read_only: typing.Any = _NOT_PARSED
+
+    @property
+    def list_params(self) -> typing.Tuple[str, ...]:
+        """Names of the list parameters (see `find_list_params`), found on
+        the first access."""
+        if self._list_params is _NOT_PARSED:
+            self._list_params = tuple(find_list_params(self.original_query))
+        return typing.cast(typing.Tuple[str, ...], self._list_params)
+
+    @property
+    def read_only(self) -> bool:
+        """Whether the query is read-only (see `is_read_only_query`),
+        found on the first access."""
+        if self._read_only is _NOT_PARSED:
+            self._read_only = is_read_only_query(self.original_query)
+        return typing.cast(bool, self._read_only)
+
+    @property
+    def insert_query(self) -> typing.Optional[InsertQuery]:
+        """Description of the plain `INSERT` query (see
+        `parse_insert_query`), parsed on the first access."""
+        if self._insert_query is _NOT_PARSED:
+            self._insert_query = parse_insert_query(self.original_query)
+        return typing.cast(typing.Optional[InsertQuery], self._insert_query)
+
+    @property
+    def unnest_query(self) -> typing.Optional[UnnestQuery]:
+        """The query rewritten with `unnest` (see `construct_unnest_query`),
+        built on the first access."""
+        if self._unnest_query is _NOT_PARSED:
+            self._unnest_query = construct_unnest_query(self.original_query)
+        return typing.cast(typing.Optional[UnnestQuery], self._unnest_query)
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} {self.converted_query!r} {self.params_order_list!r}>'
+
+
+def _parse_query(cache_key: typing.Tuple[str, bool, typing.Tuple[int, ...]]) -> ParsedQuery:
+    query, deduplicate_params, list_params_sizes = cache_key
+    if not list_params_sizes:
+        converted_query, params_order_list = construct_asyncpg_query(query, deduplicate_params)
+        return ParsedQuery(query, converted_query, params_order_list)
+
+    list_params = dict(zip(find_list_params(query), list_params_sizes))
+    converted_query, params_order_list = construct_asyncpg_query(query, deduplicate_params, list_params)
+    expanded_list_params = {
+        param_name: [f'{param_name}[{index}]' for index in range(size)]
+        for param_name, size in list_params.items()
+        if size
+    }
+    binder = ListParamsBinder(params_order_list, expanded_list_params) if expanded_list_params else None
+    return ParsedQuery(query, converted_query, params_order_list, binder)
+
+
+# process-wide cache of the translated queries, keyed by the original query and translation options
+QUERY_CACHE: cache.LRUCache[typing.Tuple[str, bool, typing.Tuple[int, ...]], ParsedQuery] = cache.LRUCache(
+    DEFAULT_QUERY_CACHE_SIZE
+)
+
+
+def parse_query(
+    query: str, deduplicate_params: bool = False, list_params_sizes: typing.Tuple[int, ...] = ()
+) -> ParsedQuery:
+    """Translate high-level query to the asyncpg format using
+    `QUERY_CACHE`.
+
+    `list_params_sizes` are the expanded sizes of the query list
+    parameters (see `construct_asyncpg_query`) in the order of
+    `ParsedQuery.list_params`, every combination of them is cached as a
+    separate query.
+
+    Returned object is shared between the callers and must not be
+    mutated.
+    """
+    return QUERY_CACHE.get_or_create((query, deduplicate_params, list_params_sizes), _parse_query)
+
+
+def parse_list_query(
+    query: str,
+    args: typing.Optional[Arguments],
+    deduplicate_params: bool = False,
+    list_params: str = LIST_PARAMS_ANY,
+) -> ParsedQuery:
+    """Translate query with the list parameters to the asyncpg format.
+
+    With `LIST_PARAMS_ANY` the list parameters are passed as arrays, with
+    `LIST_PARAMS_EXPAND` they are expanded to the separate parameters
+    according to the values lengths (see `get_list_param_size`), which
+    requires `args` (only lists, tuples and sets are expanded). Queries
+    without list parameters are translated as usual.
+    """
+    if list_params not in (LIST_PARAMS_ANY, LIST_PARAMS_EXPAND):
+        raise ValueError(f'Unknown list parameters mode: {list_params!r}')
+
+    parsed_query = parse_query(query, deduplicate_params)
+    if not parsed_query.list_params:
+        return parsed_query
+
+    if list_params == LIST_PARAMS_ANY or args is None:
+        list_params_sizes = (0,) * len(parsed_query.list_params)
+    else:
+        # strings and the other non-list values are passed as is
+        list_params_sizes = tuple(
+            get_list_param_size(values) if isinstance(values, _LIST_VALUE_TYPES) else 0
+            for values in (_get_argument(args, param_name) for param_name in parsed_query.list_params)
+        )
+    return parse_query(query, deduplicate_params, list_params_sizes)
+
+
+def _get_argument(args: Arguments, param_name: str) -> typing.Any:
+    if isinstance(args, collections.abc.Mapping):
+        return args.get(param_name)
+    return getattr(args, param_name, None)
+
+
+@functools.lru_cache(maxsize=DEFAULT_QUERY_CACHE_SIZE)
+def get_query_fingerprint(query: str) -> str:
+    """Return short stable identifier of the query, which doesn't depend on
+    the whitespace formatting."""
+    return hashlib.blake2b(' '.join(query.split()).encode(), digest_size=8).hexdigest()
@@ -0,0 +1,74 @@
+"""Module with tools for declaring the named queries once."""
+import typing
+
+from asyncpgx import query as query_module
+
+
+class RegisteredQuery(str):
+    """Named query from `QueryRegistry`.
+
+    It's a string, so it could be passed to any named method, while the
+    extended connections use its translation made on the definition
+    instead of looking it up in `query.QUERY_CACHE`.
+    """
+
+    name: str
+    deduplicate_params: bool
+    parsed_query: query_module.ParsedQuery
+
+    def __new__(cls, name: str, query: str, deduplicate_params: bool = False) -> 'RegisteredQuery':
+        registered_query = super().__new__(cls, query)
+        registered_query.name = name
+        registered_query.deduplicate_params = deduplicate_params
+        registered_query.parsed_query = query_module.parse_query(query, deduplicate_params)
+        return registered_query
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} {self.name!r} {str(self)!r}>'
+
+
+class QueryRegistry:
+    """Collection of the named queries defined once (usually at the import
+    time) and executed by the returned handles.
+
+    Queries are translated on the definition (they are checked by the
+    database only when they are prepared or executed). Pools
+    created with the registry prepare all its queries on the every new
+    connection (see `ConnectionX.named_warmup`), so the first calls
+    don't pay for the Parse/Describe round trip.
+    """
+
+    __slots__ = ('deduplicate_params', '_queries')
+
+    def __init__(self, deduplicate_params: bool = False):
+        """
+        :param deduplicate_params: Translate queries with the deduplicated parameters
+            (should match `ConnectionX.deduplicate_params`).
+        """
+        self.deduplicate_params = deduplicate_params
+        self._queries: typing.Dict[str, RegisteredQuery] = {}
+
+    def __len__(self) -> int:
+        return len(self._queries)
+
+    def __iter__(self) -> typing.Iterator[RegisteredQuery]:
+        return iter(self._queries.values())
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._queries
+
+    def __getitem__(self, name: str) -> RegisteredQuery:
+        return self._queries[name]
+
+    def define(self, name: str, query: str) -> RegisteredQuery:
+        """Translate the query and register it with the name.
+
+        :param name: Unique name of the query.
+        :param query: SQL query (could include named parameters).
+        """
+        if name in self._queries:
+            raise ValueError(f'Query {name!r} is already defined')
+        if not query.strip():
+            raise ValueError(f'Query {name!r} is empty')
+        registered_query = self._queries[name] = RegisteredQuery(name, query, self.deduplicate_params)
+        return registered_query
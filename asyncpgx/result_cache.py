@@ -0,0 +1,257 @@
+"""Module with tools for caching results of the read-only queries."""
+import time
+import typing
+
+import asyncpg
+
+from asyncpgx import cache
+from asyncpgx import query as query_module
+
+
+DEFAULT_RESULT_CACHE_SIZE = 1024
+DEFAULT_TTL = 60.0
+DEFAULT_CHANNEL = 'asyncpgx_invalidate'
+
+T = typing.TypeVar('T')
+
+
+class CachedQuery(typing.NamedTuple):
+    """Caching options of the query."""
+
+    #: time in seconds the result is kept
+    ttl: float
+    #: names of the tables the query reads, its results are dropped when they are invalidated
+    tables: typing.Tuple[str, ...]
+
+
+class ResultCacheInfo(typing.NamedTuple):
+    """Snapshot of the result cache statistics."""
+
+    hits: int
+    misses: int
+    #: number of the entries evicted by the size limit
+    evictions: int
+    #: number of the entries dropped after the TTL expiration
+    expirations: int
+    #: number of the entries dropped after the invalidation of their tables
+    invalidations: int
+    maxsize: int
+    currsize: int
+
+
+class _Entry(typing.NamedTuple):
+    expires_at: float
+    generations: typing.Tuple[int, ...]
+    value: typing.Any
+
+
+# pylint: disable=too-many-instance-attributes
+class ResultCache:
+    """Cache of the read-only named queries results with the LRU eviction.
+
+    Only the queries added with `cache_query` are cached, results are
+    keyed by the method, the converted query and the bound arguments
+    values (calls with unhashable values are not cached). Results are
+    shared between the callers and must not be mutated.
+
+    Entry is dropped when its TTL expires or one of its query tables is
+    invalidated (see `invalidate`). Invalidations could be received from
+    the other processes via PostgreSQL `LISTEN` (see `listen` and
+    `notify_invalidation`). When the listener connection is lost, the
+    cache is bypassed until `listen` succeeds again.
+    """
+
+    __slots__ = (
+        'default_ttl',
+        '_entries',
+        '_queries',
+        '_generations',
+        '_hits',
+        '_misses',
+        '_expirations',
+        '_invalidations',
+        '_epoch',
+        '_listener',
+        '_listener_lost',
+    )
+
+    def __init__(self, maxsize: int = DEFAULT_RESULT_CACHE_SIZE, default_ttl: float = DEFAULT_TTL):
+        """
+        :param maxsize: Maximum number of the cached results.
+        :param default_ttl: Time in seconds the result is kept by default.
+        """
+        self.default_ttl = default_ttl
+        self._entries: cache.LRUCache[typing.Hashable, _Entry] = cache.LRUCache(maxsize)
+        self._queries: typing.Dict[str, CachedQuery] = {}
+        # invalidation counters of the tables (and of all the entries), entries are valid
+        # while the counters of their tables are the same
+        self._generations: typing.Dict[str, int] = {}
+        self._hits = 0
+        self._misses = 0
+        self._expirations = 0
+        self._invalidations = 0
+        self._epoch = 0
+        self._listener: typing.Optional[typing.Tuple[asyncpg.Connection, str]] = None
+        # invalidations could be missed while the listener connection is lost, so the cache is bypassed
+        self._listener_lost = False
+
+    def __contains__(self, query: object) -> bool:
+        return query in self._queries
+
+    def cache_query(self, query: str, *, ttl: typing.Optional[float] = None, tables: typing.Iterable[str] = ()) -> None:
+        """Enable caching of the read-only query (see
+        `query.is_read_only_query`) results.
+
+        :param query: SQL query (could include named parameters).
+        :param ttl: Time in seconds the result is kept (`default_ttl` by default).
+        :param tables: Names of the tables the query reads.
+        """
+        if not query_module.parse_query(query).read_only:
+            raise ValueError(f'Query is not read-only: {query!r}')
+        self._queries[query] = CachedQuery(self.default_ttl if ttl is None else ttl, tuple(tables))
+
+    async def fetch(
+        self,
+        key: typing.Tuple,
+        query: str,
+        args: query_module.Arguments,
+        call: typing.Callable[[], typing.Awaitable[T]],
+        *,
+        trusted: bool = False,
+    ) -> T:
+        """Return cached result of the query or get it with `call` and
+        cache it.
+
+        Arguments are checked the same way as by the connections, so the
+        hit fails the same way as the miss does.
+
+        :param key: Description of the called method, like `('fetch',)`.
+        :param query: SQL query added with `cache_query`.
+        :param args: Dict (or other mapping or object) with the parameters values.
+        :param call: Function which executes the query.
+        :param trusted: Don't check for the unused arguments (see `ConnectionX.trusted_arguments`).
+        """
+        cached_query = self._queries[query]
+        parsed_query = query_module.parse_query(query)
+        binder = parsed_query.binder
+        cache_key = key + (parsed_query.converted_query, binder.bind_trusted(args) if trusted else binder.bind(args))
+        if self._listener_lost:
+            return await call()
+        try:
+            entry = self._entries.get(cache_key)
+        except TypeError:
+            return await call()
+
+        generations = self._get_generations(cached_query.tables)
+        if entry is not None:
+            if entry.generations != generations:
+                self._invalidations += 1
+                self._entries.pop(cache_key)
+            elif entry.expires_at <= time.monotonic():
+                self._expirations += 1
+                self._entries.pop(cache_key)
+            else:
+                self._hits += 1
+                return typing.cast(T, entry.value)
+
+        self._misses += 1
+        # generations are taken before the call, so the result is dropped if the tables are changed during it
+        query_result = await call()
+        self._entries.put(cache_key, _Entry(time.monotonic() + cached_query.ttl, generations, query_result))
+        return query_result
+
+    def _get_generations(self, tables: typing.Tuple[str, ...]) -> typing.Tuple[int, ...]:
+        generations = self._generations
+        return (self._epoch,) + tuple(generations.get(table, 0) for table in tables)
+
+    def invalidate(self, *tables: str) -> None:
+        """Drop cached results of the queries reading the tables (all the
+        results if no tables are passed).
+
+        Entries are dropped lazily on the next lookup or by the LRU
+        eviction.
+        """
+        if not tables:
+            self._epoch += 1
+        for table in tables:
+            self._generations[table] = self._generations.get(table, 0) + 1
+
+    async def listen(self, connection: asyncpg.Connection, channel: str = DEFAULT_CHANNEL) -> None:
+        """Invalidate tables received from the PostgreSQL notifications
+        channel.
+
+        Payload of the notification is the comma-separated list of the
+        table names, empty payload invalidates all the results. The
+        connection must not be used by the other code (as it's returned
+        to the pool, for example). When the connection is closed, the
+        cache is invalidated and bypassed until the next `listen`, as the
+        notifications could be lost.
+
+        :param connection: Dedicated connection which receives notifications.
+        :param channel: Name of the notifications channel.
+        """
+        if self._listener is not None:
+            raise RuntimeError('Result cache is already listening')
+        await connection.add_listener(channel, self._on_notification)
+        connection.add_termination_listener(self._on_termination)
+        self._listener = (connection, channel)
+        if self._listener_lost:
+            # entries cached before the connection was lost could miss the invalidations
+            self._listener_lost = False
+            self.invalidate()
+
+    async def unlisten(self) -> None:
+        """Stop receiving the notifications."""
+        if self._listener is None:
+            return
+        connection, channel = self._listener
+        self._listener = None
+        connection.remove_termination_listener(self._on_termination)
+        if not connection.is_closed():
+            await connection.remove_listener(channel, self._on_notification)
+
+    def _on_notification(self, connection: asyncpg.Connection, pid: int, channel: str, payload: str) -> None:
+        # pylint: disable=unused-argument
+        self.invalidate(*(table.strip() for table in payload.split(',') if table.strip()))
+
+    def _on_termination(self, connection: asyncpg.Connection) -> None:
+        # pylint: disable=unused-argument
+        self._listener = None
+        self._listener_lost = True
+        self.invalidate()
+
+    def clear(self) -> None:
+        """Drop all the cached results and reset the statistics."""
+        self._entries.clear()
+        self._hits = 0
+        self._misses = 0
+        self._expirations = 0
+        self._invalidations = 0
+
+    def info(self) -> ResultCacheInfo:
+        """Return the cache statistics."""
+        entries_info = self._entries.info()
+        return ResultCacheInfo(
+            self._hits,
+            self._misses,
+            entries_info.evictions,
+            self._expirations,
+            self._invalidations,
+            entries_info.maxsize,
+            entries_info.currsize,
+        )
+
+
+async def notify_invalidation(
+    connection: asyncpg.Connection, tables: typing.Iterable[str] = (), channel: str = DEFAULT_CHANNEL
+) -> None:
+    """Send notification which invalidates the tables in the result caches
+    listening the channel (see `ResultCache.listen`).
+
+    Inside the transaction the notification is delivered on commit.
+
+    :param connection: Connection to send the notification with.
+    :param tables: Names of the changed tables (all the results are invalidated if no tables are passed).
+    :param channel: Name of the notifications channel.
+    """
+    await connection.execute('SELECT pg_notify($1, $2)', channel, ','.join(tables))
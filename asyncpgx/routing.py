@@ -0,0 +1,344 @@
+"""Module with tools for routing of the queries between the primary and
+the replicas."""
+import contextlib
+import contextvars
+import typing
+
+import asyncpg
+
+from asyncpgx import pool as pool_module
+from asyncpgx import query as query_module
+from asyncpgx import rows as rows_module
+
+
+ROUTE_PRIMARY = 'primary'
+ROUTE_REPLICA = 'replica'
+
+T = typing.TypeVar('T')
+_Executor = typing.Any
+
+
+class RoutingPool:
+    """Group of the primary pool and the replica pools, which routes the
+    named queries by the statement type.
+
+    Read-only queries (see `query.is_read_only_query`) are sent to the
+    replica with the least number of the outstanding requests, all the
+    other ones (and all the queries if there are no replicas) are sent to
+    the primary. Read methods accept `route` (`ROUTE_PRIMARY` or
+    `ROUTE_REPLICA`) to override the classification, e.g. for the
+    functions with side effects.
+
+    Queries made inside `transaction` use its primary connection, queries
+    made inside `use_primary` are sent to the primary, so the caller reads
+    its own writes. Both are bound to the current context (see
+    `contextvars`), so tasks created inside them inherit the routing.
+
+    Pools are initialized on `await` (or `async with`) and closed by
+    `close`.
+    """
+
+    __slots__ = ('primary', 'replicas', '_outstanding', '_next_replica', '_pinned_connection', '_use_primary')
+
+    def __init__(self, primary: pool_module.PoolX, replicas: typing.Sequence[pool_module.PoolX] = ()):
+        self.primary = primary
+        self.replicas = list(replicas)
+        self._outstanding = [0] * len(self.replicas)
+        self._next_replica = 0
+        self._pinned_connection: contextvars.ContextVar[typing.Optional[asyncpg.Connection]] = contextvars.ContextVar(
+            'asyncpgx_pinned_connection', default=None
+        )
+        self._use_primary: contextvars.ContextVar[bool] = contextvars.ContextVar('asyncpgx_use_primary', default=False)
+
+    def __await__(self) -> typing.Generator[typing.Any, None, 'RoutingPool']:
+        return self._initialize().__await__()
+
+    async def __aenter__(self) -> 'RoutingPool':
+        return await self._initialize()
+
+    async def __aexit__(self, *exc_info: typing.Any) -> None:
+        await self.close()
+
+    async def _initialize(self) -> 'RoutingPool':
+        for pool in [self.primary, *self.replicas]:
+            await pool
+        return self
+
+    async def close(self) -> None:
+        """Close the primary and the replica pools."""
+        for pool in [self.primary, *self.replicas]:
+            await pool.close()
+
+    @contextlib.asynccontextmanager
+    async def transaction(self, **kwargs: typing.Any) -> typing.AsyncIterator[asyncpg.Connection]:
+        """Start transaction on the primary connection and route all the
+        queries of the current context to it until the transaction is
+        finished.
+
+        Nested calls start savepoints on the same connection. Connection
+        doesn't support concurrent queries, so the tasks sharing the
+        transaction must not make them.
+
+        :param kwargs: Arguments of the asyncpg `Connection.transaction`.
+        """
+        connection = self._pinned_connection.get()
+        if connection is not None:
+            async with connection.transaction(**kwargs):
+                yield connection
+            return
+
+        async with self.primary.acquire() as connection:
+            async with connection.transaction(**kwargs):
+                token = self._pinned_connection.set(connection)
+                try:
+                    yield connection
+                finally:
+                    self._pinned_connection.reset(token)
+
+    @contextlib.contextmanager
+    def use_primary(self) -> typing.Iterator[None]:
+        """Route all the queries of the current context to the primary."""
+        token = self._use_primary.set(True)
+        try:
+            yield
+        finally:
+            self._use_primary.reset(token)
+
+    def get_route(self, query: str, route: typing.Optional[str] = None) -> str:
+        """Return route (`ROUTE_PRIMARY` or `ROUTE_REPLICA`) of the query
+        in the current context.
+
+        :param query: SQL query (could include named parameters).
+        :param route: Explicit route of the query.
+        """
+        if route not in (None, ROUTE_PRIMARY, ROUTE_REPLICA):
+            raise ValueError(f'Unknown route: {route!r}')
+        if not self.replicas or self._use_primary.get() or self._pinned_connection.get() is not None:
+            return ROUTE_PRIMARY
+        if route is not None:
+            return route
+        return ROUTE_REPLICA if query_module.parse_query(query).read_only else ROUTE_PRIMARY
+
+    async def _execute(
+        self,
+        query: str,
+        route: typing.Optional[str],
+        call: typing.Callable[[_Executor], typing.Awaitable[T]],
+    ) -> T:
+        connection = self._pinned_connection.get()
+        if connection is not None:
+            return await call(connection)
+        if self.get_route(query, route) == ROUTE_PRIMARY:
+            return await call(self.primary)
+
+        index = self._choose_replica()
+        self._outstanding[index] += 1
+        try:
+            return await call(self.replicas[index])
+        finally:
+            self._outstanding[index] -= 1
+
+    def _choose_replica(self) -> int:
+        """Return index of the replica with the least number of the
+        outstanding requests, ties are resolved by the round robin."""
+        replicas_number = len(self.replicas)
+        start = self._next_replica
+        self._next_replica = (start + 1) % replicas_number
+        outstanding = self._outstanding
+        return min(
+            ((start + offset) % replicas_number for offset in range(replicas_number)),
+            key=outstanding.__getitem__,
+        )
+
+    async def named_execute(
+        self,
+        query: str,
+        args: query_module.Arguments,
+        timeout: typing.Optional[float] = None,
+        route: typing.Optional[str] = None,
+    ) -> str:
+        """Extended versions of `execute` with support of the named
+        parameters.
+
+        :param query: SQL query to execute (could include named parameters).
+        :param args: Dict (or other mapping or object) with the parameters values.
+        :param timeout: Optional timeout value in seconds.
+        :param route: Explicit route of the query (`ROUTE_PRIMARY` or `ROUTE_REPLICA`).
+        """
+        return await self._execute(query, route, lambda executor: executor.named_execute(query, args, timeout=timeout))
+
+    async def named_executemany(
+        self,
+        query: str,
+        args: typing.Iterable[query_module.Arguments],
+        *,
+        timeout: typing.Optional[float] = None,
+        use_copy: bool = False,
+    ) -> None:
+        """Extended versions of `executemany` with support of the named
+        parameters, always executed on the primary.
+
+        :param query: SQL query to execute (could include named parameters).
+        :param args: List of dicts (or other mappings or objects) with the parameters values.
+        :param timeout: Optional timeout value in seconds.
+        :param use_copy: Load the rows with the `COPY` protocol (only for the plain `INSERT` queries).
+        """
+        await self._execute(
+            query,
+            ROUTE_PRIMARY,
+            lambda executor: executor.named_executemany(query, args, timeout=timeout, use_copy=use_copy),
+        )
+
+    async def named_executemany_returning(
+        self,
+        query: str,
+        args: typing.Iterable[query_module.Arguments],
+        *,
+        chunk_size: int = query_module.DEFAULT_BATCH_SIZE,
+        timeout: typing.Optional[float] = None,
+    ) -> typing.List[asyncpg.Record]:
+        """Version of `named_executemany` returning rows of the `RETURNING`
+        clause in the order of the input rows, always executed on the
+        primary.
+
+        :param query: SQL query to execute (could include named parameters).
+        :param args: List of dicts (or other mappings or objects) with the parameters values.
+        :param chunk_size: Number of rows sent with one statement.
+        :param timeout: Optional timeout value in seconds for the every statement.
+        """
+        return await self._execute(
+            query,
+            ROUTE_PRIMARY,
+            lambda executor: executor.named_executemany_returning(query, args, chunk_size=chunk_size, timeout=timeout),
+        )
+
+    # pylint: disable=redefined-builtin,too-many-arguments
+    async def named_copy_from_query(
+        self,
+        query: str,
+        args: query_module.Arguments,
+        *,
+        output: typing.Any,
+        timeout: typing.Optional[float] = None,
+        format: typing.Optional[str] = None,
+        route: typing.Optional[str] = None,
+        **copy_options: typing.Any,
+    ) -> str:
+        """Extended version of `copy_from_query` with support of the named
+        parameters.
+
+        :param query: SQL query to export (could include named parameters).
+        :param args: Dict (or other mapping or object) with the parameters values.
+        :param output: Path, file-like object or coroutine function receiving the chunks of data.
+        :param timeout: Optional timeout value in seconds.
+        :param format: Data format (`text`, `csv` or `binary`).
+        :param route: Explicit route of the query (`ROUTE_PRIMARY` or `ROUTE_REPLICA`).
+        :param copy_options: Other `COPY` options of the asyncpg `copy_from_query` (like `header` or `delimiter`).
+        :return: Status of the `COPY` command.
+        """
+        return await self._execute(
+            query,
+            route,
+            lambda executor: executor.named_copy_from_query(
+                query, args, output=output, timeout=timeout, format=format, **copy_options
+            ),
+        )
+
+    async def named_fetch(
+        self,
+        query: str,
+        args: query_module.Arguments,
+        timeout: typing.Optional[float] = None,
+        route: typing.Optional[str] = None,
+    ) -> typing.List[asyncpg.Record]:
+        """Extended versions of `fetch` with support of the named parameters.
+
+        :param query: SQL query to execute (could include named parameters).
+        :param args: Dict (or other mapping or object) with the parameters values.
+        :param timeout: Optional timeout value in seconds.
+        :param route: Explicit route of the query (`ROUTE_PRIMARY` or `ROUTE_REPLICA`).
+        """
+        return await self._execute(query, route, lambda executor: executor.named_fetch(query, args, timeout=timeout))
+
+    # pylint: disable=too-many-arguments
+    async def named_fetchval(
+        self,
+        query: str,
+        args: query_module.Arguments,
+        column: int = 0,
+        timeout: typing.Optional[float] = None,
+        route: typing.Optional[str] = None,
+    ) -> typing.Optional[typing.Any]:
+        """Extended versions of `fetchval` with support of the named
+        parameters.
+
+        :param query: SQL query to execute (could include named parameters).
+        :param args: Dict (or other mapping or object) with the parameters values.
+        :param column: Numeric index within the record of the value to return.
+        :param timeout: Optional timeout value in seconds.
+        :param route: Explicit route of the query (`ROUTE_PRIMARY` or `ROUTE_REPLICA`).
+        """
+        return await self._execute(
+            query, route, lambda executor: executor.named_fetchval(query, args, column=column, timeout=timeout)
+        )
+
+    async def named_fetchrow(
+        self,
+        query: str,
+        args: query_module.Arguments,
+        timeout: typing.Optional[float] = None,
+        route: typing.Optional[str] = None,
+    ) -> typing.Optional[asyncpg.Record]:
+        """Extended versions of `fetchrow` with support of the named
+        parameters.
+
+        :param query: SQL query to execute (could include named parameters).
+        :param args: Dict (or other mapping or object) with the parameters values.
+        :param timeout: Optional timeout value in seconds.
+        :param route: Explicit route of the query (`ROUTE_PRIMARY` or `ROUTE_REPLICA`).
+        """
+        return await self._execute(query, route, lambda executor: executor.named_fetchrow(query, args, timeout=timeout))
+
+    # pylint: disable=too-many-arguments
+    async def named_fetch_as(
+        self,
+        model: typing.Type[rows_module.ModelT],
+        query: str,
+        args: query_module.Arguments,
+        timeout: typing.Optional[float] = None,
+        route: typing.Optional[str] = None,
+    ) -> typing.List[rows_module.ModelT]:
+        """Version of `named_fetch` returning the rows as the `model`
+        instances.
+
+        :param model: Dataclass, named tuple or class with `__slots__` with the fields named as the result columns.
+        :param query: SQL query to execute (could include named parameters).
+        :param args: Dict (or other mapping or object) with the parameters values.
+        :param timeout: Optional timeout value in seconds.
+        :param route: Explicit route of the query (`ROUTE_PRIMARY` or `ROUTE_REPLICA`).
+        """
+        return await self._execute(
+            query, route, lambda executor: executor.named_fetch_as(model, query, args, timeout=timeout)
+        )
+
+    # pylint: disable=too-many-arguments
+    async def named_fetchrow_as(
+        self,
+        model: typing.Type[rows_module.ModelT],
+        query: str,
+        args: query_module.Arguments,
+        timeout: typing.Optional[float] = None,
+        route: typing.Optional[str] = None,
+    ) -> typing.Optional[rows_module.ModelT]:
+        """Version of `named_fetchrow` returning the row as the `model`
+        instance.
+
+        :param model: Dataclass, named tuple or class with `__slots__` with the fields named as the result columns.
+        :param query: SQL query to execute (could include named parameters).
+        :param args: Dict (or other mapping or object) with the parameters values.
+        :param timeout: Optional timeout value in seconds.
+        :param route: Explicit route of the query (`ROUTE_PRIMARY` or `ROUTE_REPLICA`).
+        """
+        return await self._execute(
+            query, route, lambda executor: executor.named_fetchrow_as(model, query, args, timeout=timeout)
+        )
@@ -0,0 +1,155 @@
+"""Module with tools for mapping query results to the user classes."""
+import dataclasses
+import operator
+import typing
+
+import asyncpg
+
+from asyncpgx import cache
+from asyncpgx import exceptions
+
+
+DEFAULT_ROW_FACTORIES_CACHE_SIZE = 1024
+
+ModelT = typing.TypeVar('ModelT')
+RowFactory = typing.Callable[[asyncpg.Record], typing.Any]
+
+
+def compile_row_factory(model: typing.Type[ModelT], columns: typing.Sequence[str]) -> RowFactory:
+    """Compile function which converts record with the `columns` to the
+    `model` instance.
+
+    Supported models are dataclasses, named tuples and classes with
+    `__slots__`. Every column must match the model field, fields without
+    columns must have the default value (except the `__slots__` classes,
+    where all the slots must be filled). Values are taken by the column
+    indexes, so records are not accessed by name, and passed to the
+    constructor with one call per row.
+    """
+    if dataclasses.is_dataclass(model):
+        init_fields = [field for field in dataclasses.fields(model) if field.init]
+        optional_fields = {
+            field.name
+            for field in init_fields
+            if field.default is not dataclasses.MISSING or field.default_factory is not dataclasses.MISSING
+        }
+        # `kw_only` is available since Python 3.10
+        positional = not any(getattr(field, 'kw_only', False) is True for field in init_fields)
+        fields = [field.name for field in init_fields]
+        return _compile_constructor_factory(model, fields, optional_fields, columns, positional)
+    if issubclass(model, tuple) and hasattr(model, '_fields'):
+        optional_fields = set(getattr(model, '_field_defaults', {}))
+        return _compile_constructor_factory(model, list(getattr(model, '_fields')), optional_fields, columns)
+    if any('__slots__' in vars(klass) for klass in model.__mro__[:-1]):
+        return _compile_slots_factory(model, columns)
+    raise exceptions.RowMappingError(f'Model {model!r} is not a dataclass, named tuple or class with __slots__')
+
+
+def _compile_constructor_factory(
+    model: typing.Type[ModelT],
+    fields: typing.List[str],
+    optional_fields: typing.Set[str],
+    columns: typing.Sequence[str],
+    positional: bool = True,
+) -> RowFactory:
+    """Compile factory which passes values to the model constructor
+    (by position if all the `fields` are `positional` and filled,
+    otherwise by keyword)."""
+    _check_columns(model, fields, columns)
+    missing_fields = set(fields).difference(columns).difference(optional_fields)
+    if missing_fields:
+        raise exceptions.RowMappingError(f'Fields {missing_fields} of {model!r} are missing in the query result')
+
+    if not positional or len(columns) < len(fields):
+        return _compile_keywords_factory(model, columns)
+    if list(columns) == fields:
+        return lambda record: model(*record)
+
+    getter = _compile_record_getter([columns.index(field) for field in fields])
+    return lambda record: model(*getter(record))
+
+
+def _compile_keywords_factory(model: typing.Type[ModelT], columns: typing.Sequence[str]) -> RowFactory:
+    """Generate factory which passes values to the model constructor by
+    the keywords, like `model(id=record[0], name=record[1])`, so no dict is
+    built per row."""
+    # columns are checked to be the model fields, so they are valid identifiers
+    arguments = ', '.join(f'{column}=record[{index}]' for index, column in enumerate(columns))
+    namespace: typing.Dict[str, typing.Any] = {'model': model}
+    exec(f'def row_factory(record):\n    return model({arguments})\n', namespace)  # pylint: disable=exec-used
+    return typing.cast(RowFactory, namespace['row_factory'])
+
+
+def _compile_slots_factory(model: typing.Type[ModelT], columns: typing.Sequence[str]) -> RowFactory:
+    """Compile factory which creates the model instance without constructor
+    and sets its slots."""
+    slots = [
+        slot
+        for klass in reversed(model.__mro__[:-1])
+        for slot in _get_class_slots(klass)
+        if slot not in ('__dict__', '__weakref__')
+    ]
+    _check_columns(model, slots, columns)
+    missing_slots = set(slots).difference(columns)
+    if missing_slots:
+        raise exceptions.RowMappingError(f'Slots {missing_slots} of {model!r} are missing in the query result')
+
+    setters = [(getattr(model, column).__set__, index) for index, column in enumerate(columns)]
+    create = object.__new__
+
+    def _create_instance(record: asyncpg.Record) -> typing.Any:
+        instance = create(model)
+        for setter, index in setters:
+            setter(instance, record[index])
+        return instance
+
+    return _create_instance
+
+
+def _get_class_slots(klass: type) -> typing.Tuple[str, ...]:
+    slots = vars(klass).get('__slots__', ())
+    return (slots,) if isinstance(slots, str) else tuple(slots)
+
+
+def _check_columns(model: type, fields: typing.Sequence[str], columns: typing.Sequence[str]) -> None:
+    if len(set(columns)) != len(columns):
+        raise exceptions.RowMappingError(f'Query result has duplicate columns: {list(columns)}')
+    unknown_columns = set(columns).difference(fields)
+    if unknown_columns:
+        raise exceptions.RowMappingError(f'Columns {unknown_columns} have no matching fields in {model!r}')
+
+
+def _compile_record_getter(indexes: typing.Sequence[int]) -> typing.Callable[[asyncpg.Record], typing.Tuple]:
+    if len(indexes) == 1:
+        index = indexes[0]
+        return lambda record: (record[index],)
+    return operator.itemgetter(*indexes)
+
+
+# process-wide cache of the compiled row factories, keyed by the model and the result columns
+ROW_FACTORIES: cache.LRUCache[typing.Tuple[type, typing.Tuple[str, ...]], RowFactory] = cache.LRUCache(
+    DEFAULT_ROW_FACTORIES_CACHE_SIZE
+)
+
+
+def get_row_factory(model: typing.Type[ModelT], columns: typing.Sequence[str]) -> RowFactory:
+    """Return row factory (see `compile_row_factory`) from
+    `ROW_FACTORIES` cache."""
+    return ROW_FACTORIES.get_or_create(
+        (model, tuple(columns)), lambda cache_key: compile_row_factory(cache_key[0], cache_key[1])
+    )
+
+
+def map_records(model: typing.Type[ModelT], records: typing.List[asyncpg.Record]) -> typing.List[ModelT]:
+    """Convert records to the `model` instances."""
+    if not records:
+        return []
+    return list(map(get_row_factory(model, tuple(records[0].keys())), records))
+
+
+def map_record(model: typing.Type[ModelT], record: typing.Optional[asyncpg.Record]) -> typing.Optional[ModelT]:
+    """Convert record to the `model` instance."""
+    if record is None:
+        return None
+    instance: ModelT = get_row_factory(model, tuple(record.keys()))(record)
+    return instance
@@ -0,0 +1,62 @@
+"""Module with tools for coalescing of the concurrent identical calls."""
+import asyncio
+import functools
+import typing
+
+
+T = typing.TypeVar('T')
+
+
+# pylint: disable=too-few-public-methods
+class _Call:
+    """In-flight call shared by the waiters."""
+
+    __slots__ = ('task', 'waiters')
+
+    def __init__(self, task: asyncio.Future):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Group of the in-flight calls, where concurrent calls with the same
+    key share one execution.
+
+    Every waiter receives the result (or the exception) of the shared
+    execution, the result object is the same for all of them, so it must
+    not be mutated. Cancellation of the waiter doesn't affect the other
+    ones, execution is cancelled only when all its waiters are cancelled.
+    """
+
+    __slots__ = ('_calls',)
+
+    def __init__(self) -> None:
+        self._calls: typing.Dict[typing.Hashable, _Call] = {}
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    async def do(self, key: typing.Hashable, function: typing.Callable[[], typing.Awaitable[T]]) -> T:
+        """Call `function` or join its in-flight call with the same key."""
+        call = self._calls.get(key)
+        if call is None:
+            call = self._calls[key] = _Call(asyncio.ensure_future(function()))
+            call.task.add_done_callback(functools.partial(self._forget, key, call))
+
+        call.waiters += 1
+        try:
+            query_result: T = await asyncio.shield(call.task)
+            return query_result
+        finally:
+            call.waiters -= 1
+            if not call.waiters and not call.task.done():
+                # new callers must not join the cancelled call
+                self._forget(key, call)
+                call.task.cancel()
+
+    def _forget(self, key: typing.Hashable, call: _Call, task: typing.Optional[asyncio.Future] = None) -> None:
+        if self._calls.get(key) is call:
+            del self._calls[key]
+        if task is not None and not task.cancelled():
+            # exception is retrieved by the waiters, unless all of them were cancelled
+            task.exception()
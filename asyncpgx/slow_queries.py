@@ -0,0 +1,168 @@
+"""Module with tools for sampling of the slow queries."""
+import asyncio
+import collections
+import collections.abc
+import json
+import random
+import time
+import typing
+
+from asyncpgx import observers as observers_module
+from asyncpgx import query as query_module
+
+
+DEFAULT_CAPACITY = 100
+DEFAULT_EXPLAIN_INTERVAL = 60.0
+DEFAULT_EXPLAIN_TIMEOUT = 5.0
+_EXPLAIN_PREFIX = 'EXPLAIN (FORMAT JSON) '
+
+
+# pylint: disable=too-few-public-methods,too-many-instance-attributes
+class SlowQuery:
+    """Sample of the slow query.
+
+    `plan` and `explain_error` are filled when the `EXPLAIN` is finished,
+    both are `None` if it wasn't sampled.
+    """
+
+    __slots__ = ('method', 'query', 'fingerprint', 'duration', 'params', 'created_at', 'plan', 'explain_error')
+
+    def __init__(self, event: observers_module.QueryEvent, params: typing.Dict[str, str], created_at: float):
+        #: name of the called method (see `QueryEvent.method`)
+        self.method = event.method
+        #: original named query
+        self.query = event.query
+        #: query fingerprint (see `query.get_query_fingerprint`)
+        self.fingerprint = event.fingerprint
+        #: duration of the call in seconds
+        self.duration = event.total_time
+        #: types of the parameters values (with the lengths of the sized ones), values are not kept
+        self.params = params
+        #: unix timestamp of the call end
+        self.created_at = created_at
+        #: decoded `EXPLAIN (FORMAT JSON)` output
+        self.plan: typing.Any = None
+        #: exception class name and message if the `EXPLAIN` failed
+        self.explain_error: typing.Optional[str] = None
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} {self.method} {self.query!r} {self.duration:.3f}s>'
+
+
+class SlowQueriesSampler(observers_module.QueryObserver):
+    """Observer which keeps the queries running longer than `threshold`
+    seconds in the ring buffer of the `capacity` last samples.
+
+    Samples keep the original named query and the shapes of the
+    parameters (see `get_params_shapes`), not their values. The plan of
+    the query is captured with `EXPLAIN (FORMAT JSON)` (without
+    `ANALYZE`, so the query isn't executed again) using `executor`,
+    asynchronously, so the caller isn't blocked. The executor should be
+    a pool (its connection is acquired for the every `EXPLAIN`), which
+    could be the observed pool itself.
+
+    `EXPLAIN` is rate limited, so the sampler doesn't add load during the
+    incidents: only `sample_rate` part of the slow queries are explained,
+    the same query is explained at most once per `explain_interval`
+    seconds and only one `EXPLAIN` runs at a time (queries which became
+    slow during it are not explained).
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(
+        self,
+        executor: typing.Any = None,
+        *,
+        threshold: float,
+        capacity: int = DEFAULT_CAPACITY,
+        sample_rate: float = 1.0,
+        explain_interval: float = DEFAULT_EXPLAIN_INTERVAL,
+        explain_timeout: float = DEFAULT_EXPLAIN_TIMEOUT,
+    ):
+        """
+        :param executor: Pool (or another object with `named_fetchval`) which runs `EXPLAIN`,
+            plans are not captured without it.
+        :param threshold: Minimal duration of the sampled query in seconds.
+        :param capacity: Maximal number of the kept samples.
+        :param sample_rate: Part of the slow queries which are explained.
+        :param explain_interval: Minimal interval between `EXPLAIN` of the same query in seconds.
+        :param explain_timeout: Timeout of `EXPLAIN` in seconds.
+        """
+        self.executor = executor
+        self.threshold = threshold
+        self.sample_rate = sample_rate
+        self.explain_interval = explain_interval
+        self.explain_timeout = explain_timeout
+        self._samples: typing.Deque[SlowQuery] = collections.deque(maxlen=capacity)
+        self._explained_at: typing.Dict[str, float] = {}
+        self._explain_task: typing.Optional[asyncio.Future] = None
+
+    def on_query(self, event: observers_module.QueryEvent) -> None:
+        if event.total_time < self.threshold or event.query.startswith(_EXPLAIN_PREFIX):
+            return
+
+        sample = SlowQuery(event, get_params_shapes(event.query, event.args), time.time())
+        self._samples.append(sample)
+        if self._should_explain(event):
+            self._explained_at[event.fingerprint] = time.monotonic()
+            self._explain_task = asyncio.ensure_future(self._explain(sample, event.args))
+
+    def _should_explain(self, event: observers_module.QueryEvent) -> bool:
+        if self.executor is None or event.args is None or event.error is not None:
+            return False
+        if self._explain_task is not None and not self._explain_task.done():
+            return False
+        explained_at = self._explained_at.get(event.fingerprint)
+        if explained_at is not None and time.monotonic() - explained_at < self.explain_interval:
+            return False
+        return random.random() < self.sample_rate
+
+    async def _explain(self, sample: SlowQuery, args: query_module.Arguments) -> None:
+        try:
+            plan = await self.executor.named_fetchval(
+                _EXPLAIN_PREFIX + sample.query, args, timeout=self.explain_timeout
+            )
+        except Exception as exc:  # pylint: disable=broad-except
+            sample.explain_error = f'{exc.__class__.__name__}: {exc}'
+        else:
+            sample.plan = json.loads(plan) if isinstance(plan, str) else plan
+
+    def samples(self, fingerprint: typing.Optional[str] = None) -> typing.List[SlowQuery]:
+        """Return kept samples (of the query with the `fingerprint`) from
+        the oldest to the newest."""
+        if fingerprint is None:
+            return list(self._samples)
+        return [sample for sample in self._samples if sample.fingerprint == fingerprint]
+
+    def clear(self) -> None:
+        """Drop all the kept samples."""
+        self._samples.clear()
+        self._explained_at.clear()
+
+    async def wait_explain(self) -> None:
+        """Wait until the running `EXPLAIN` is finished."""
+        if self._explain_task is not None:
+            await asyncio.shield(self._explain_task)
+
+
+def get_params_shapes(query: str, args: query_module.Arguments) -> typing.Dict[str, str]:
+    """Describe the parameters values of the query without the values
+    themselves, like `{'id': 'int', 'ids': 'list[3]', 'name': 'str[5]'}`.
+
+    Returns empty dict if the arguments are unknown.
+    """
+    if args is None:
+        return {}
+    if isinstance(args, collections.abc.Mapping):
+        items = args.items()
+    else:
+        params_names = dict.fromkeys(query_module.parse_query(query).params_order_list)
+        items = ((name, getattr(args, name, None)) for name in params_names)
+
+    shapes = {}
+    for name, value in items:
+        shape = type(value).__name__
+        if isinstance(value, collections.abc.Sized):
+            shape = f'{shape}[{len(value)}]'
+        shapes[name] = shape
+    return shapes
@@ -17,3 +17,12 @@ async def postgres_connection():
     await connection.execute('''CREATE TABLE test (id int PRIMARY KEY, test_1 varchar (256), test_2 varchar (256))''')
     yield connection
     await connection.execute('''DROP TABLE test CASCADE;''')
+
+
+@pytest_asyncio.fixture
+async def postgres_pool():
+    """Fixture which creates the connection pool and closes it on scope
+    close."""
+    pool = await connection_module.create_pool(POSTGRES_DSN, min_size=1, max_size=2)
+    yield pool
+    await pool.close()
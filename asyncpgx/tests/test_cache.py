@@ -0,0 +1,63 @@
+"""Tests for `cache` module."""
+import pytest
+
+from asyncpgx import cache
+
+
+def test_lru_cache_eviction():
+    """Test that the least recently used entry is evicted first."""
+    lru_cache: cache.LRUCache[str, int] = cache.LRUCache(2)
+    lru_cache.put('a', 1)
+    lru_cache.put('b', 2)
+    assert lru_cache.get('a') == 1
+
+    lru_cache.put('c', 3)
+
+    assert 'b' not in lru_cache
+    assert lru_cache.get('a') == 1
+    assert lru_cache.get('c') == 3
+    assert lru_cache.info() == cache.CacheInfo(hits=3, misses=0, evictions=1, maxsize=2, currsize=2)
+
+
+def test_lru_cache_get_or_create():
+    """Test `get_or_create` counts hits and misses and calls factory once."""
+    lru_cache: cache.LRUCache[str, str] = cache.LRUCache(10)
+    calls = []
+
+    def _factory(key: str) -> str:
+        calls.append(key)
+        return key.upper()
+
+    assert lru_cache.get_or_create('a', _factory) == 'A'
+    assert lru_cache.get_or_create('a', _factory) == 'A'
+
+    assert calls == ['a']
+    assert lru_cache.info().hits == 1
+    assert lru_cache.info().misses == 1
+
+
+def test_lru_cache_resize_and_clear():
+    """Test shrinking and clearing the cache."""
+    lru_cache: cache.LRUCache[int, int] = cache.LRUCache(3)
+    for i in range(3):
+        lru_cache.put(i, i)
+
+    lru_cache.maxsize = 1
+
+    assert len(lru_cache) == 1
+    assert 2 in lru_cache
+    assert lru_cache.info().evictions == 2
+
+    lru_cache.clear()
+
+    assert lru_cache.info() == cache.CacheInfo(hits=0, misses=0, evictions=0, maxsize=1, currsize=0)
+
+
+def test_lru_cache_disabled():
+    """Test zero-sized cache stores nothing."""
+    lru_cache: cache.LRUCache[str, int] = cache.LRUCache(0)
+    lru_cache.put('a', 1)
+
+    assert lru_cache.get('a') is None
+    with pytest.raises(ValueError):
+        lru_cache.maxsize = -1
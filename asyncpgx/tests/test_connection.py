@@ -1,8 +1,16 @@
 """Test `connection` module."""
+import dataclasses
+import datetime
+import io
+import pathlib
+import typing
+
 import pytest
 
 from asyncpgx import connection as connection_module
 from asyncpgx import exceptions
+from asyncpgx import observers
+from asyncpgx import query as query_module
 
 
 @pytest.mark.asyncio
@@ -203,3 +211,510 @@ async def test_unused_arguments_list(postgres_connection: connection_module.Conn
             '''SELECT id, test_1, test_2 FROM test WHERE id=:id;''',
             [{'id': 1, 'test_1': '2'}, {'id': 2, 'test_1': '3'}],
         )
+
+
+@pytest.mark.asyncio
+async def test_trusted_arguments(postgres_connection: connection_module.ConnectionX) -> None:
+    """Test unused arguments are ignored with `trusted_arguments`."""
+    await postgres_connection.execute('''INSERT INTO test (id, test_1, test_2) VALUES (1, '2', '3')''')
+    postgres_connection.trusted_arguments = True
+
+    fetch_result = await postgres_connection.named_fetchval(
+        '''SELECT test_1 FROM test WHERE id=:id;''', {'id': 1, 'test_1': '2'}
+    )
+    prepared_statement = await postgres_connection.named_prepare('''SELECT test_2 FROM test WHERE id=:id;''')
+
+    assert fetch_result == '2'
+    assert await prepared_statement.named_fetchval({'id': 1, 'test_2': '3'}) == '3'
+    with pytest.raises(exceptions.MissingRequiredArgumentError):
+        await postgres_connection.named_execute('''SELECT test_1 FROM test WHERE id=:id;''', {'test_1': '2'})
+
+
+@pytest.mark.asyncio
+async def test_deduplicate_params(postgres_connection: connection_module.ConnectionX) -> None:
+    """Test repeated named parameters with `deduplicate_params`."""
+    await postgres_connection.execute('''INSERT INTO test (id, test_1, test_2) VALUES (1, '2', '3'), (2, '1', '1')''')
+    postgres_connection.deduplicate_params = True
+    query = '''SELECT id FROM test WHERE test_1=:value OR test_2=:value ORDER BY id;'''
+
+    fetch_result = await postgres_connection.named_fetch(query, {'value': '3'})
+    prepared_statement = await postgres_connection.named_prepare(query)
+
+    assert [row['id'] for row in fetch_result] == [1]
+    assert len(prepared_statement.get_parameters()) == 1
+    assert [row['id'] for row in await prepared_statement.named_fetch({'value': '1'})] == [2]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('list_params', ['any', 'expand'])
+async def test_list_params(postgres_connection: connection_module.ConnectionX, list_params: str) -> None:
+    """Test `IN :name` list parameters."""
+    await postgres_connection.execute(
+        '''INSERT INTO test (id, test_1, test_2) VALUES (1, '1', '1'), (2, '2', '2'), (3, '3', '3')'''
+    )
+    postgres_connection.list_params = list_params
+    query = '''SELECT id FROM test WHERE id IN :ids AND test_1 NOT IN :excluded ORDER BY id;'''
+
+    fetch_result = await postgres_connection.named_fetch(query, {'ids': [1, 2, 3], 'excluded': ['2']})
+    empty_result = await postgres_connection.named_fetch(query, {'ids': [], 'excluded': []})
+    prepared_statement = await postgres_connection.named_prepare(query)
+
+    assert [row['id'] for row in fetch_result] == [1, 3]
+    assert not empty_result
+    assert [row['id'] for row in await prepared_statement.named_fetch({'ids': [2, 3], 'excluded': []})] == [2, 3]
+
+    # `IN` of the `POSITION` call isn't the list operator
+    position_query = '''SELECT position('b' IN :s) WHERE 1 IN :ids'''
+    assert await postgres_connection.named_fetchval(position_query, {'s': 'abc', 'ids': [1]}) == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('prefetch', [True, False])
+async def test_named_iter_batches(postgres_connection: connection_module.ConnectionX, prefetch: bool) -> None:
+    """Test reading result by batches."""
+    await postgres_connection.execute(
+        '''INSERT INTO test (id, test_1, test_2) SELECT i, i::text, i::text FROM generate_series(1, 25) AS i'''
+    )
+    query = '''SELECT id, test_1 FROM test WHERE id >= :id ORDER BY id;'''
+
+    batches = [
+        batch
+        async for batch in postgres_connection.named_iter_batches(query, {'id': 1}, batch_size=10, prefetch=prefetch)
+    ]
+    columnar_batches = [
+        batch
+        async for batch in postgres_connection.named_iter_batches(
+            query, {'id': 16}, batch_size=5, prefetch=prefetch, columnar=True, use_numpy=False
+        )
+    ]
+
+    assert [len(batch) for batch in batches] == [10, 10, 5]
+    assert [row['id'] for batch in batches for row in batch] == list(range(1, 26))
+    assert columnar_batches == [
+        {'id': [16, 17, 18, 19, 20], 'test_1': ['16', '17', '18', '19', '20']},
+        {'id': [21, 22, 23, 24, 25], 'test_1': ['21', '22', '23', '24', '25']},
+    ]
+    assert not postgres_connection.is_in_transaction()
+
+
+@pytest.mark.asyncio
+async def test_named_iter_batches_early_stop(postgres_connection: connection_module.ConnectionX) -> None:
+    """Test transaction is finished when the iteration is stopped early and
+    the outer transaction is kept."""
+    await postgres_connection.execute(
+        '''INSERT INTO test (id, test_1, test_2) SELECT i, i::text, i::text FROM generate_series(1, 25) AS i'''
+    )
+    query = '''SELECT id FROM test WHERE id >= :id ORDER BY id;'''
+    batches = postgres_connection.named_iter_batches(query, {'id': 1}, batch_size=10)
+    async for _ in batches:
+        break
+    await batches.aclose()
+
+    assert not postgres_connection.is_in_transaction()
+    assert await postgres_connection.fetchval('''SELECT count(*) FROM test''') == 25
+    async with postgres_connection.transaction():
+        prepared_statement = await postgres_connection.named_prepare(query)
+        batches_sizes = [len(batch) async for batch in prepared_statement.named_iter_batches({'id': 6}, batch_size=10)]
+        assert postgres_connection.is_in_transaction()
+    assert batches_sizes == [10, 10]
+
+
+@dataclasses.dataclass
+class _TestRow:
+    id: int  # pylint: disable=invalid-name
+    test_1: str
+    test_2: typing.Optional[str] = None
+
+
+@pytest.mark.asyncio
+async def test_named_fetch_as(postgres_connection: connection_module.ConnectionX) -> None:
+    """Test rows mapping to the model."""
+    await postgres_connection.execute('''INSERT INTO test (id, test_1, test_2) VALUES (1, '1', '1'), (2, '2', '2')''')
+    query = '''SELECT test_1, id FROM test WHERE id >= :id ORDER BY id;'''
+
+    fetch_result = await postgres_connection.named_fetch_as(_TestRow, query, {'id': 1})
+    fetchrow_result = await postgres_connection.named_fetchrow_as(_TestRow, query, {'id': 2})
+    missing_result = await postgres_connection.named_fetchrow_as(_TestRow, query, {'id': 3})
+    prepared_statement = await postgres_connection.named_prepare(query)
+
+    assert fetch_result == [_TestRow(1, '1'), _TestRow(2, '2')]
+    assert fetchrow_result == _TestRow(2, '2')
+    assert missing_result is None
+    assert await prepared_statement.named_fetch_as(_TestRow, {'id': 2}) == [_TestRow(2, '2')]
+    assert await prepared_statement.named_fetchrow_as(_TestRow, {'id': 1}) == _TestRow(1, '1')
+    assert await prepared_statement.named_fetch_as(_TestRow, {'id': 3}) == []
+    with pytest.raises(exceptions.RowMappingError):
+        await postgres_connection.named_fetch_as(_TestRow, '''SELECT id FROM test;''', {})
+
+
+@pytest.mark.asyncio
+async def test_named_methods_with_objects(postgres_connection: connection_module.ConnectionX) -> None:
+    """Test named parameters are taken from the objects attributes."""
+    insert_query = '''INSERT INTO test (id, test_1, test_2) VALUES (:id, :test_1, :test_2);'''
+    await postgres_connection.named_execute(insert_query, _TestRow(1, '1', '1'))
+    await postgres_connection.named_executemany(insert_query, [_TestRow(2, '2', '2'), _TestRow(3, '3', '3')])
+    await postgres_connection.named_executemany(insert_query, [_TestRow(4, '4', '4')], use_copy=True)
+    await postgres_connection.named_copy_records('test', [_TestRow(5, '5', '5')], ['id', 'test_1', 'test_2'])
+
+    fetch_result = await postgres_connection.named_fetch_as(
+        _TestRow, '''SELECT * FROM test WHERE id >= :id ORDER BY id;''', _TestRow(2, '', '')
+    )
+
+    assert fetch_result == [_TestRow(i, str(i), str(i)) for i in range(2, 6)]
+    with pytest.raises(ValueError):
+        await postgres_connection.named_copy_records('test', [_TestRow(6, '6', '6')])
+
+
+# pylint: disable=too-few-public-methods
+class _EventsCollector(observers.QueryObserver):
+    def __init__(self) -> None:
+        self.events: typing.List[observers.QueryEvent] = []
+
+    def on_query(self, event: observers.QueryEvent) -> None:
+        self.events.append(event)
+
+
+@pytest.mark.asyncio
+async def test_observers(postgres_connection: connection_module.ConnectionX) -> None:
+    """Test observers receive events of the named queries."""
+    collector = _EventsCollector()
+    postgres_connection.observers = [collector]
+    query = '''SELECT id FROM test WHERE id > :id;'''
+    query_module.QUERY_CACHE.clear()
+
+    await postgres_connection.named_executemany(
+        '''INSERT INTO test (id, test_1, test_2) VALUES (:id, '1', '1');''', [{'id': 1}, {'id': 2}]
+    )
+    await postgres_connection.named_fetch(query, {'id': 0})
+    await postgres_connection.named_fetch(query, {'id': 1})
+    await postgres_connection.named_execute('''DELETE FROM test WHERE id = :id;''', {'id': 2})
+    with pytest.raises(exceptions.MissingRequiredArgumentError):
+        await postgres_connection.named_fetchrow(query, {})
+    prepared_statement = await postgres_connection.named_prepare(query)
+    await prepared_statement.named_fetchval({'id': 0})
+
+    assert [event.method for event in collector.events] == [
+        'executemany',
+        'fetch',
+        'fetch',
+        'execute',
+        'fetchrow',
+        'prepared_fetchval',
+    ]
+    assert [event.rows for event in collector.events] == [None, 2, 1, 1, None, None]
+    assert [event.cache_hit for event in collector.events] == [False, False, True, False, True, None]
+    assert collector.events[4].error == 'MissingRequiredArgumentError'
+    assert [event.args for event in collector.events] == [None, {'id': 0}, {'id': 1}, {'id': 2}, {}, {'id': 0}]
+    assert collector.events[1].fingerprint == query_module.get_query_fingerprint(query)
+    assert all(event.execute_time > 0 for event in collector.events if event.error is None)
+
+
+@pytest.mark.asyncio
+async def test_named_fetchval_with_literals(postgres_connection: connection_module.ConnectionX) -> None:
+    """Test named parameters inside literals, comments and function bodies
+    are left untouched."""
+    await postgres_connection.named_execute(
+        '''
+        CREATE FUNCTION test_concat(value text) RETURNS text AS $body$
+        DECLARE
+            result text;
+        BEGIN
+            result := value || ':suffix';
+            RETURN result;
+        END;
+        $body$ LANGUAGE plpgsql;
+        ''',
+        {},
+    )
+
+    fetch_result = await postgres_connection.named_fetchval(
+        '''SELECT test_concat(:value::text) /* :comment */ || ' :literal' -- :comment''', {'value': 'a'}
+    )
+
+    assert fetch_result == 'a:suffix :literal'
+    await postgres_connection.execute('''DROP FUNCTION test_concat''')
+
+
+@pytest.mark.asyncio
+async def test_named_copy_records(postgres_connection: connection_module.ConnectionX) -> None:
+    """Test `named_copy_records` method binds records by the column
+    names."""
+    copy_result = await postgres_connection.named_copy_records(
+        'test',
+        ({'test_2': str(i), 'id': i, 'test_1': str(i + 1)} for i in range(3)),
+    )
+    fetch_result = await postgres_connection.fetch('SELECT id, test_1, test_2 FROM test ORDER BY id ASC;')
+
+    assert copy_result == 'COPY 3'
+    assert [tuple(row) for row in fetch_result] == [(0, '1', '0'), (1, '2', '1'), (2, '3', '2')]
+    with pytest.raises(exceptions.UnusedArgumentsError):
+        await postgres_connection.named_copy_records('test', [{'id': 3, 'test_1': '1'}], columns=['id'])
+
+
+@pytest.mark.asyncio
+async def test_named_executemany_use_copy(postgres_connection: connection_module.ConnectionX) -> None:
+    """Test `named_executemany` method with `use_copy`."""
+    await postgres_connection.named_executemany(
+        'INSERT INTO test(id, test_1, test_2) VALUES (:id, :first, :second);',
+        [{'id': i, 'first': str(i), 'second': str(i + 1)} for i in range(3)],
+        use_copy=True,
+    )
+    fetch_result = await postgres_connection.fetch('SELECT id, test_1, test_2 FROM test ORDER BY id ASC;')
+
+    assert [tuple(row) for row in fetch_result] == [(0, '0', '1'), (1, '1', '2'), (2, '2', '3')]
+    with pytest.raises(exceptions.MissingRequiredArgumentError):
+        await postgres_connection.named_executemany(
+            'INSERT INTO test(id, test_1) VALUES (:id, :first);', [{'id': 4, 'first': '1'}, {'id': 5}], use_copy=True
+        )
+    assert await postgres_connection.fetchval('SELECT count(*) FROM test') == 3
+    with pytest.raises(exceptions.UnsupportedQueryError):
+        await postgres_connection.named_executemany(
+            'INSERT INTO test(id) VALUES (:id) ON CONFLICT DO NOTHING;', [{'id': 1}], use_copy=True
+        )
+
+
+@pytest.mark.asyncio
+async def test_named_executemany_stream(postgres_connection: connection_module.ConnectionX) -> None:
+    """Test `named_executemany_stream` method with sync and async
+    iterables."""
+
+    async def _async_records() -> typing.AsyncIterator[typing.Dict]:
+        for i in range(5, 8):
+            yield {'id': i, 'test_1': str(i), 'test_2': str(i)}
+
+    query = 'INSERT INTO test(id, test_1, test_2) VALUES (:id, :test_1, :test_2);'
+
+    sync_result = await postgres_connection.named_executemany_stream(
+        query, ({'id': i, 'test_1': str(i), 'test_2': str(i)} for i in range(5)), batch_size=2
+    )
+    async_result = await postgres_connection.named_executemany_stream(query, _async_records(), batch_size=2)
+
+    assert (sync_result, async_result) == (5, 3)
+    assert [row['id'] for row in await postgres_connection.fetch('SELECT id FROM test ORDER BY id')] == list(range(8))
+    with pytest.raises(exceptions.MissingRequiredArgumentError):
+        await postgres_connection.named_executemany_stream(
+            query, [{'id': 8, 'test_1': '1', 'test_2': '1'}, {'id': 9}, {'id': 10}], batch_size=1
+        )
+    assert await postgres_connection.fetchval('SELECT count(*) FROM test') == 8
+
+    # batches before the failed one are committed without the transaction
+    with pytest.raises(exceptions.MissingRequiredArgumentError):
+        await postgres_connection.named_executemany_stream(
+            query,
+            [{'id': 8, 'test_1': '8', 'test_2': '8'}, {'id': 9, 'test_1': '9', 'test_2': '9'}, {'id': 10}],
+            batch_size=2,
+            transaction=False,
+        )
+    assert await postgres_connection.fetchval('SELECT count(*) FROM test') == 10
+
+
+@pytest.mark.asyncio
+async def test_named_bulk_execute(postgres_connection: connection_module.ConnectionX) -> None:
+    """Test `named_bulk_execute` method with rows and columns."""
+    query = '''INSERT INTO test(id, test_1, test_2) VALUES (:id, lower(:value), :value || ':suffix')
+               ON CONFLICT (id) DO NOTHING;'''
+
+    rows_result = await postgres_connection.named_bulk_execute(
+        query, [{'id': i, 'value': f'V{i}'} for i in range(5)], chunk_size=2
+    )
+    columns_result = await postgres_connection.named_bulk_execute(
+        query, {'id': [4, 5, 6], 'value': ['X', 'Y', 'Z']}, chunk_size=2
+    )
+    fetch_result = await postgres_connection.fetch('SELECT id, test_1, test_2 FROM test ORDER BY id')
+
+    assert (rows_result, columns_result) == (5, 2)
+    assert [tuple(row) for row in fetch_result][-3:] == [
+        (4, 'v4', 'V4:suffix'),
+        (5, 'y', 'Y:suffix'),
+        (6, 'z', 'Z:suffix'),
+    ]
+    with pytest.raises(exceptions.UnusedArgumentsError):
+        await postgres_connection.named_bulk_execute(query, {'id': [7], 'value': ['7'], 'other': ['7']})
+    with pytest.raises(exceptions.UnsupportedQueryError):
+        await postgres_connection.named_bulk_execute('UPDATE test SET test_1 = :value', [{'value': '1'}])
+    with pytest.raises(exceptions.UnsupportedQueryError):
+        await postgres_connection.named_bulk_execute(
+            'INSERT INTO test(id, test_1, test_2) VALUES (:id, :value, DEFAULT)', [{'id': 7, 'value': '7'}]
+        )
+
+
+@pytest.mark.asyncio
+async def test_named_bulk_fetch(postgres_connection: connection_module.ConnectionX) -> None:
+    """Test `named_bulk_fetch` returns rows in the input order."""
+    await postgres_connection.execute('''INSERT INTO test (id, test_1, test_2) VALUES (2, 'old', 'old')''')
+
+    fetch_result = await postgres_connection.named_bulk_fetch(
+        '''INSERT INTO test(id, test_1, test_2) VALUES (:id, :test_1, :test_2)
+           ON CONFLICT (id) DO UPDATE SET test_1 = EXCLUDED.test_1 RETURNING id, test_1, test_2''',
+        [{'id': i, 'test_1': str(i), 'test_2': str(i)} for i in (3, 1, 2, 0)],
+        chunk_size=3,
+    )
+
+    assert [tuple(row) for row in fetch_result] == [(3, '3', '3'), (1, '1', '1'), (2, '2', 'old'), (0, '0', '0')]
+
+
+@pytest.mark.asyncio
+async def test_named_executemany_returning(postgres_connection: connection_module.ConnectionX) -> None:
+    """Test `named_executemany_returning` returns rows in the input order."""
+    insert_result = await postgres_connection.named_executemany_returning(
+        'INSERT INTO test(id, test_1) VALUES (:id, :test_1) RETURNING id, test_1',
+        [{'id': i, 'test_1': str(i)} for i in (3, 1, 2, 0)],
+        chunk_size=3,
+    )
+    update_result = await postgres_connection.named_executemany_returning(
+        'UPDATE test SET test_2 = :test_2 WHERE id = :id RETURNING id, test_2',
+        [{'id': 2, 'test_2': 'b'}, {'id': 5, 'test_2': 'c'}, {'id': 0, 'test_2': 'a'}],
+    )
+    array_result = await postgres_connection.named_executemany_returning(
+        'INSERT INTO test(id, test_1) VALUES (:id, (:values::text[])[1]) RETURNING test_1',
+        [{'id': 4, 'values': ['x', 'y']}],
+    )
+
+    assert [tuple(row) for row in insert_result] == [(3, '3'), (1, '1'), (2, '2'), (0, '0')]
+    assert [tuple(row) for row in update_result] == [(2, 'b'), (0, 'a')]
+    assert [tuple(row) for row in array_result] == [('x',)]
+
+    # ON CONFLICT and DEFAULT queries are executed row by row, so the repeated keys are updated one after another
+    upsert_result = await postgres_connection.named_executemany_returning(
+        '''INSERT INTO test(id, test_1) VALUES (:id, :test_1)
+           ON CONFLICT (id) DO UPDATE SET test_1 = test.test_1 || excluded.test_1 RETURNING test_1''',
+        [{'id': 10, 'test_1': 'a'}, {'id': 10, 'test_1': 'b'}],
+    )
+    default_result = await postgres_connection.named_executemany_returning(
+        'INSERT INTO test(id, test_1) VALUES (:id, DEFAULT) RETURNING id, test_1', [{'id': 11}, {'id': 12}]
+    )
+    # subqueries see the rows inserted before, like with the separate statements
+    subquery_result = await postgres_connection.named_executemany_returning(
+        'INSERT INTO test(id, test_1) VALUES ((SELECT max(id) + 1 FROM test), :test_1) RETURNING id',
+        [{'test_1': 'c'}, {'test_1': 'd'}],
+    )
+    assert [tuple(row) for row in upsert_result] == [('a',), ('ab',)]
+    assert [tuple(row) for row in default_result] == [(11, None), (12, None)]
+    assert [tuple(row) for row in subquery_result] == [(13,), (14,)]
+
+    query = 'UPDATE test SET test_2 = :test_2 WHERE id = :id RETURNING id'
+    with pytest.raises(exceptions.MissingRequiredArgumentError):
+        await postgres_connection.named_executemany_returning(query, [{'id': 1, 'test_2': 'd'}, {'id': 2}])
+    with pytest.raises(exceptions.UnusedArgumentsError):
+        await postgres_connection.named_executemany_returning(
+            'INSERT INTO test(id) VALUES (:id) RETURNING id', [{'id': 6}, {'id': 7, 'test_1': '7'}]
+        )
+    assert (
+        await postgres_connection.named_fetchval(
+            'SELECT count(*) FROM test WHERE test_2 = :test_2 OR id BETWEEN 6 AND 9', {'test_2': 'd'}
+        )
+        == 0
+    )
+
+
+@pytest.mark.asyncio
+async def test_named_copy_from_query(
+    postgres_connection: connection_module.ConnectionX, tmp_path: pathlib.Path
+) -> None:
+    """Test `named_copy_from_query` exports result of the named query."""
+    await postgres_connection.execute('''INSERT INTO test(id, test_1, test_2) VALUES (1, '1', 'a'), (2, '2', NULL)''')
+    query = 'SELECT id, test_2 FROM test WHERE id >= :id AND test_1 <> :test_1 ORDER BY id;'
+    chunks: typing.List[bytes] = []
+
+    async def _write(chunk: bytes) -> None:
+        chunks.append(chunk)
+
+    status = await postgres_connection.named_copy_from_query(
+        query, {'id': 1, 'test_1': "'"}, output=_write, format='csv', header=True
+    )
+    await postgres_connection.named_copy_from_query(query, {'id': 2, 'test_1': '1'}, output=tmp_path / 'test.txt')
+    prepared_statement = await postgres_connection.named_prepare(query)
+    output = io.BytesIO()
+    await prepared_statement.named_copy_from_query({'id': 1, 'test_1': '2'}, output=output, format='csv')
+
+    assert status == 'COPY 2'
+    assert b''.join(chunks) == b'id,test_2\n1,a\n2,\n'
+    assert (tmp_path / 'test.txt').read_bytes() == b'2\t\\N\n'
+    assert output.getvalue() == b'1,a\n'
+    with pytest.raises(exceptions.MissingRequiredArgumentError):
+        await postgres_connection.named_copy_from_query(query, {'id': 1}, output=output)
+
+    # trailing comments don't swallow the closing parenthesis
+    commented_query = 'SELECT :id::int; -- note'
+    output = io.BytesIO()
+    await postgres_connection.named_copy_from_query(commented_query, {'id': 1}, output=output)
+    prepared_statement = await postgres_connection.named_prepare(commented_query)
+    await prepared_statement.named_copy_from_query({'id': 2}, output=output)
+    assert output.getvalue() == b'1\n2\n'
+
+
+@pytest.mark.asyncio
+async def test_named_fetch_columns(postgres_connection: connection_module.ConnectionX) -> None:
+    """Test `named_fetch_columns` method returns lists of values."""
+    await postgres_connection.execute(
+        '''INSERT INTO test(id, test_1, test_2) VALUES (1, '1', NULL), (2, '2', '2'), (3, '3', '3')'''
+    )
+
+    fetch_result = await postgres_connection.named_fetch_columns(
+        'SELECT id, test_1, test_2 FROM test WHERE id >= :id ORDER BY id', {'id': 1}, batch_size=2, use_numpy=False
+    )
+    prepared_statement = await postgres_connection.named_prepare(
+        'SELECT id, test_2 FROM test WHERE id >= :id ORDER BY id'
+    )
+    async with postgres_connection.transaction():
+        prepared_result = await prepared_statement.named_fetch_columns({'id': 2}, use_numpy=False)
+
+    assert fetch_result == {'id': [1, 2, 3], 'test_1': ['1', '2', '3'], 'test_2': [None, '2', '3']}
+    assert prepared_result == {'id': [2, 3], 'test_2': ['2', '3']}
+
+
+@pytest.mark.asyncio
+async def test_named_fetch_columns_numpy(postgres_connection: connection_module.ConnectionX) -> None:
+    """Test `named_fetch_columns` method returns NumPy arrays."""
+    numpy = pytest.importorskip('numpy')
+
+    fetch_result = await postgres_connection.named_fetch_columns(
+        '''SELECT i AS id, i * 0.5 AS half, i % 2 = 0 AS even, NULLIF(i, 2) AS nullable, 'a' AS text
+           FROM generate_series(1, :count) AS i''',
+        {'count': 3},
+        use_numpy=True,
+    )
+
+    assert fetch_result['id'].dtype == numpy.int32
+    assert fetch_result['id'].tolist() == [1, 2, 3]
+    assert fetch_result['even'].tolist() == [False, True, False]
+    assert fetch_result['nullable'] == [1, None, 3]
+    assert fetch_result['text'] == ['a', 'a', 'a']
+
+    # batches are converted separately, the column is kept in the list after the first NULL
+    batches_result = await postgres_connection.named_fetch_columns(
+        '''SELECT i AS id, NULLIF(i, 3) AS nullable,
+                  '2020-01-01 03:00+03'::timestamptz + NULLIF(i, 3) * interval '1 day' AS at
+           FROM generate_series(1, :count) AS i''',
+        {'count': 4},
+        batch_size=1,
+        use_numpy=True,
+    )
+
+    assert batches_result['id'].dtype == numpy.int32
+    assert batches_result['id'].tolist() == [1, 2, 3, 4]
+    assert batches_result['nullable'] == [1, 2, None, 4]
+    assert batches_result['at'] == [
+        datetime.datetime(2020, 1, 2, tzinfo=datetime.timezone.utc),
+        datetime.datetime(2020, 1, 3, tzinfo=datetime.timezone.utc),
+        None,
+        datetime.datetime(2020, 1, 5, tzinfo=datetime.timezone.utc),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_named_prepare_use_cache(postgres_connection: connection_module.ConnectionX) -> None:
+    """Test `named_prepare` reuses cached statements and re-prepares them
+    after the schema change."""
+    await postgres_connection.execute('''INSERT INTO test (id, test_1, test_2) VALUES (1, '2', '3')''')
+    query = '''SELECT * FROM test WHERE id=:id;'''
+
+    first_statement = await postgres_connection.named_prepare(query, use_cache=True)
+    second_statement = await postgres_connection.named_prepare(query, use_cache=True)
+    assert first_statement.get_name() == second_statement.get_name()
+    assert tuple(await first_statement.named_fetchrow({'id': 1})) == (1, '2', '3')
+
+    await postgres_connection.execute('''ALTER TABLE test ADD COLUMN test_3 int DEFAULT 4''')
+
+    assert tuple(await first_statement.named_fetchrow({'id': 1})) == (1, '2', '3', 4)
+    assert tuple(await second_statement.named_fetchrow({'id': 1})) == (1, '2', '3', 4)
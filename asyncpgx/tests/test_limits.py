@@ -0,0 +1,131 @@
+"""Tests for `limits` module."""
+import asyncio
+import typing
+
+import pytest
+
+from asyncpgx import connection as connection_module
+from asyncpgx import exceptions
+from asyncpgx import limits
+from asyncpgx.tests import conftest
+
+
+REPORT_QUERY = 'SELECT pg_sleep(0.05), :id::int'
+
+
+async def _run(limiter: limits.ConcurrencyLimiter, query: str, event: asyncio.Event, log: typing.List[str]) -> None:
+    async with limiter.limit(query):
+        log.append(query)
+        await event.wait()
+
+
+@pytest.mark.asyncio
+async def test_limiter_classes():
+    """Test queries are limited by their classes."""
+    limiter = limits.ConcurrencyLimiter([limits.QueryClass('reports', max_in_flight=1)])
+    limiter.assign('SELECT * FROM reports', 'reports')
+    event = asyncio.Event()
+    log: typing.List[str] = []
+
+    tasks = [asyncio.ensure_future(_run(limiter, query, event, log)) for query in ['SELECT * FROM reports'] * 2]
+    with limiter.tagged('reports'):
+        tasks.append(asyncio.ensure_future(_run(limiter, 'SELECT 2', event, log)))
+    tasks.append(asyncio.ensure_future(_run(limiter, 'SELECT 1', event, log)))
+    await asyncio.sleep(0.01)
+
+    assert log == ['SELECT * FROM reports', 'SELECT 1']
+    assert limiter.classify('SELECT  *  FROM reports') == 'reports'
+    assert limiter.stats()['reports'].in_flight == 1
+    assert limiter.stats()['reports'].queued == 2
+
+    event.set()
+    await asyncio.gather(*tasks)
+
+    assert log == ['SELECT * FROM reports', 'SELECT 1', 'SELECT * FROM reports', 'SELECT 2']
+    reports_stats = limiter.stats()['reports']
+    assert (reports_stats.admitted, reports_stats.finished, reports_stats.in_flight, reports_stats.queued) == (
+        3,
+        3,
+        0,
+        0,
+    )
+    assert reports_stats.max_wait_time > 0
+    assert reports_stats.mean_run_time > 0
+    assert limiter.stats()[limits.DEFAULT_CLASS].max_wait_time == 0
+    with pytest.raises(ValueError):
+        limiter.assign('SELECT 1', 'other')
+
+
+@pytest.mark.asyncio
+async def test_limiter_priority():
+    """Test queries of the classes with higher priority are admitted
+    first."""
+    limiter = limits.ConcurrencyLimiter(
+        [limits.QueryClass('low', priority=-1), limits.QueryClass('high', priority=1)], max_in_flight=1
+    )
+    event = asyncio.Event()
+    log: typing.List[str] = []
+
+    tasks = [asyncio.ensure_future(_run(limiter, 'SELECT 0', event, log))]
+    for class_name in ['low', 'default', 'high']:
+        with limiter.tagged(class_name):
+            tasks.append(asyncio.ensure_future(_run(limiter, class_name, event, log)))
+    await asyncio.sleep(0.01)
+    event.set()
+    await asyncio.gather(*tasks)
+
+    assert log == ['SELECT 0', 'high', 'default', 'low']
+
+
+@pytest.mark.asyncio
+async def test_limiter_rejections():
+    """Test queue timeout and shedding of the overloaded class."""
+    limiter = limits.ConcurrencyLimiter(
+        [limits.QueryClass(limits.DEFAULT_CLASS, max_in_flight=1, queue_timeout=0.05, shed_wait=0.01)]
+    )
+    first_event, second_event = asyncio.Event(), asyncio.Event()
+    log: typing.List[str] = []
+
+    with pytest.raises(exceptions.QueueTimeoutError):
+        await asyncio.gather(_run(limiter, '1', first_event, log), _run(limiter, '2', first_event, log))
+    assert limiter.stats()[limits.DEFAULT_CLASS].timed_out == 1
+
+    first_task = asyncio.ensure_future(_run(limiter, '3', first_event, log))
+    second_task = asyncio.ensure_future(_run(limiter, '4', second_event, log))
+    cancelled_task = asyncio.ensure_future(_run(limiter, '5', second_event, log))
+    third_task = asyncio.ensure_future(_run(limiter, '6', second_event, log))
+    await asyncio.sleep(0.02)
+    cancelled_task.cancel()
+    first_event.set()
+    await first_task
+    await asyncio.sleep(0)
+
+    with pytest.raises(exceptions.QueryRejectedError):
+        await _run(limiter, '7', second_event, log)
+    second_event.set()
+    await asyncio.gather(second_task, third_task)
+    await _run(limiter, '8', second_event, log)
+
+    assert log == ['1', '3', '4', '6', '8']
+    assert limiter.stats()[limits.DEFAULT_CLASS].rejected == 1
+    assert limiter.stats()[limits.DEFAULT_CLASS].in_flight == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures('postgres_connection')
+async def test_pool_limiter() -> None:
+    """Test pool named methods are limited by the query classes."""
+    limiter = limits.ConcurrencyLimiter([limits.QueryClass('reports', max_in_flight=1)], max_in_flight=2)
+    limiter.assign(REPORT_QUERY, 'reports')
+    async with connection_module.create_pool(
+        conftest.POSTGRES_DSN, min_size=2, max_size=2, limiter=limiter
+    ) as postgres_pool:
+        results = await asyncio.gather(
+            *(postgres_pool.named_fetchval(REPORT_QUERY, {'id': i}, column=1) for i in range(2)),
+            postgres_pool.named_execute('INSERT INTO test(id) VALUES (:id)', {'id': 1}),
+        )
+
+    assert results == [0, 1, 'INSERT 0 1']
+    assert limiter.stats()['reports'].finished == 2
+    assert limiter.stats()['reports'].max_wait_time >= 0.04
+    assert limiter.stats()[limits.DEFAULT_CLASS].finished == 1
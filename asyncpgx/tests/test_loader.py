@@ -0,0 +1,107 @@
+"""Tests for `loader` module."""
+import asyncio
+import typing
+
+import asyncpg
+import pytest
+
+from asyncpgx import connection as connection_module
+from asyncpgx import exceptions
+from asyncpgx import loader as loader_module
+from asyncpgx import observers
+from asyncpgx.tests import conftest
+
+
+QUERY = 'SELECT id, test_1 FROM test WHERE id = ANY(:ids::int[]);'
+
+
+class _TestRow(typing.NamedTuple):
+    id: int  # pylint: disable=invalid-name
+    test_1: str
+
+
+@pytest.mark.asyncio
+async def test_row_loader(postgres_connection: connection_module.ConnectionX) -> None:
+    """Test keys requested concurrently are loaded by batches."""
+    await postgres_connection.named_executemany(
+        'INSERT INTO test(id, test_1) VALUES (:id, :test_1);', [{'id': i, 'test_1': str(i)} for i in range(10)]
+    )
+    histogram = observers.HistogramObserver()
+    async with connection_module.create_pool(
+        conftest.POSTGRES_DSN, min_size=1, max_size=2, observers=[histogram]
+    ) as postgres_pool:
+        loader = loader_module.RowLoader(postgres_pool, QUERY, 'id', keys_param='ids', max_batch_size=4)
+        results = await asyncio.gather(*(loader.load(key) for key in [1, 2, 2, 3, 4, 5, 100]))
+        assert [result and tuple(result) for result in results] == [
+            (1, '1'),
+            (2, '2'),
+            (2, '2'),
+            (3, '3'),
+            (4, '4'),
+            (5, '5'),
+            None,
+        ]
+        assert ',method="fetch"} 2' in histogram.render_prometheus()
+
+        assert [result and tuple(result) for result in await loader.load_many([5, 6])] == [(5, '5'), (6, '6')]
+        assert ',method="fetch"} 3' in histogram.render_prometheus()
+
+        loader.clear(5)
+        loader.prime(6, None)
+        loader.clear(6)
+        loader.prime(6, None)
+        assert await loader.load_many([5, 6]) == [(5, '5'), None]
+        assert ',method="fetch"} 4' in histogram.render_prometheus()
+
+        model_loader = loader_module.RowLoader(
+            postgres_pool, QUERY, 0, keys_param='ids', model=_TestRow, window=0.01, cache=False
+        )
+        first_result = asyncio.ensure_future(model_loader.load(1))
+        await asyncio.sleep(0)
+        assert await model_loader.load_many([1, 2]) == [_TestRow(1, '1'), _TestRow(2, '2')]
+        assert await first_result == _TestRow(1, '1')
+        assert await model_loader.load(1) == _TestRow(1, '1')
+        assert ',method="fetch"} 6' in histogram.render_prometheus()
+
+
+@pytest.mark.asyncio
+async def test_row_loader_error(postgres_connection: connection_module.ConnectionX) -> None:
+    """Test failed keys are not cached."""
+    loader = loader_module.RowLoader(postgres_connection, QUERY, 'id')
+
+    results = await asyncio.gather(loader.load(1), loader.load(2), return_exceptions=True)
+    assert [type(result) for result in results] == [exceptions.MissingRequiredArgumentError] * 2
+
+    loader = loader_module.RowLoader(postgres_connection, 'SELECT 1 AS id WHERE :keys::int[] IS NULL', 'id')
+    with pytest.raises(asyncpg.DataError):
+        await loader.load('1')
+    assert await loader.load(1) is None
+
+    with pytest.raises(ValueError):
+        loader_module.RowLoader(postgres_connection, QUERY, 'id', max_batch_size=0)
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures('postgres_connection')
+async def test_row_loader_close() -> None:
+    """Test `close` cancels the pending and the running batches."""
+    async with connection_module.create_pool(conftest.POSTGRES_DSN, min_size=1, max_size=2) as postgres_pool:
+        loader = loader_module.RowLoader(
+            postgres_pool,
+            'SELECT id, test_1 FROM test, pg_sleep(10) WHERE id = ANY(:ids::int[]);',
+            'id',
+            keys_param='ids',
+            window=10,
+        )
+        running_load = asyncio.ensure_future(loader.load_many([1, 2]))
+        await asyncio.sleep(0)
+        loader._dispatch()  # pylint: disable=protected-access
+        await asyncio.sleep(0.05)
+        pending_load = asyncio.ensure_future(loader.load(3))
+        await asyncio.sleep(0)
+
+        await loader.close()
+
+        results = await asyncio.gather(running_load, pending_load, return_exceptions=True)
+        assert all(isinstance(result, asyncio.CancelledError) for result in results)
+        assert not loader._tasks  # pylint: disable=protected-access
@@ -0,0 +1,78 @@
+"""Tests for `observers` module."""
+import typing
+
+import pytest
+
+from asyncpgx import observers
+
+
+def _make_event(
+    method: str = 'fetch', execute_time: float = 0.002, error: typing.Optional[str] = None
+) -> observers.QueryEvent:
+    return observers.QueryEvent(
+        method,
+        'SELECT 1;',
+        'abc',
+        parse_time=0.0005,
+        bind_time=0.0005,
+        execute_time=execute_time,
+        rows=2,
+        cache_hit=False,
+        error=error,
+    )
+
+
+def test_observed_query():
+    """Test observed query reports error and phases which weren't
+    reached with zero duration."""
+    histogram = observers.HistogramObserver()
+
+    with pytest.raises(KeyError):
+        with observers.ObservedQuery([histogram], 'fetch', 'SELECT 1;') as observed_query:
+            observed_query.mark()
+            raise KeyError('id')
+
+    metrics = histogram.render_prometheus()
+    assert 'phase="execute"} 0.0' in metrics
+    assert 'error="KeyError"} 1' in metrics
+    assert 'asyncpgx_query_rows_total{fingerprint=' in metrics
+
+
+@pytest.mark.parametrize(
+    'method, query_result, expected_rows',
+    [
+        ('fetch', [1, 2, 3], 3),
+        ('prepared_fetchrow', None, 0),
+        ('fetchrow', object(), 1),
+        ('execute', 'UPDATE 5', 5),
+        ('execute', 'CREATE TABLE', None),
+        ('fetchval', 1, None),
+        ('executemany', None, None),
+    ],
+)
+def test_count_rows(method, query_result, expected_rows):
+    """Test rows count is taken from the method result."""
+    assert observers.count_rows(method, query_result) == expected_rows
+
+
+def test_histogram_observer():
+    """Test histogram aggregation and Prometheus rendering."""
+    histogram = observers.HistogramObserver(buckets=(0.001, 0.01))
+    histogram.on_query(_make_event())
+    histogram.on_query(_make_event(execute_time=1.0, error='QueryCanceledError'))
+
+    metrics = histogram.render_prometheus()
+
+    assert histogram.queries == {'abc': 'SELECT 1;'}
+    assert '# TYPE asyncpgx_query_duration_seconds histogram' in metrics
+    assert 'asyncpgx_query_duration_seconds_bucket{fingerprint="abc",method="fetch",le="0.001"} 0' in metrics
+    assert 'asyncpgx_query_duration_seconds_bucket{fingerprint="abc",method="fetch",le="0.01"} 1' in metrics
+    assert 'asyncpgx_query_duration_seconds_bucket{fingerprint="abc",method="fetch",le="+Inf"} 2' in metrics
+    assert 'asyncpgx_query_duration_seconds_count{fingerprint="abc",method="fetch"} 2' in metrics
+    assert 'asyncpgx_query_rows_total{fingerprint="abc",method="fetch"} 4' in metrics
+    assert 'asyncpgx_query_cache_misses_total{fingerprint="abc",method="fetch"} 2' in metrics
+    assert 'asyncpgx_query_errors_total{fingerprint="abc",method="fetch",error="QueryCanceledError"} 1' in metrics
+    assert 'asyncpgx_query_phase_seconds_total{fingerprint="abc",method="fetch",phase="parse"} 0.001' in metrics
+
+    histogram.clear()
+    assert 'fingerprint' not in histogram.render_prometheus()
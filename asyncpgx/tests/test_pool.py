@@ -0,0 +1,130 @@
+"""Test `pool` module."""
+import asyncio
+import io
+import typing
+
+import asyncpg
+import pytest
+
+from asyncpgx import connection as connection_module
+from asyncpgx import exceptions
+from asyncpgx import observers
+from asyncpgx import pool as pool_module
+from asyncpgx.tests import conftest
+
+
+class _TestRow(typing.NamedTuple):
+    id: int  # pylint: disable=invalid-name
+    test_1: str
+    test_2: str
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures('postgres_connection')
+async def test_named_methods(postgres_pool: pool_module.PoolX) -> None:
+    """Test named methods of the pool."""
+    query = 'SELECT id, test_1, test_2 FROM test WHERE id=:id;'
+
+    await postgres_pool.named_execute(
+        'INSERT INTO test(id, test_1, test_2) VALUES (:id, :test_1, :test_2);', {'id': 1, 'test_1': '1', 'test_2': '1'}
+    )
+    await postgres_pool.named_executemany(
+        'INSERT INTO test(id, test_1, test_2) VALUES (:id, :test_1, :test_2);',
+        [{'id': 2, 'test_1': '2', 'test_2': '2'}, {'id': 3, 'test_1': '3', 'test_2': '3'}],
+    )
+
+    assert isinstance(postgres_pool, pool_module.PoolX)
+    assert [tuple(row) for row in await postgres_pool.named_fetch(query, {'id': 2})] == [(2, '2', '2')]
+    fetchrow_result = await postgres_pool.named_fetchrow(query, {'id': 3})
+    assert fetchrow_result and tuple(fetchrow_result) == (3, '3', '3')
+    assert await postgres_pool.named_fetchval(query, {'id': 1}, column=1) == '1'
+    assert [tuple(row) for row in await postgres_pool.named_fetch_as(_TestRow, query, {'id': 2})] == [(2, '2', '2')]
+    assert await postgres_pool.named_fetchrow_as(_TestRow, query, {'id': 1}) == _TestRow(1, '1', '1')
+    assert await postgres_pool.named_executemany_returning(
+        'UPDATE test SET test_2 = :test_2 WHERE id = :id RETURNING id',
+        [{'id': 3, 'test_2': '4'}, {'id': 1, 'test_2': '4'}],
+    ) == [(3,), (1,)]
+    assert await postgres_pool.named_copy_from_query(query, {'id': 3}, output=io.BytesIO()) == 'COPY 1'
+    with pytest.raises(exceptions.MissingRequiredArgumentError):
+        await postgres_pool.named_fetch(query, {})
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures('postgres_connection')
+async def test_pool_observers() -> None:
+    """Test pool observers are shared with the pool connections."""
+    histogram = observers.HistogramObserver()
+    async with connection_module.create_pool(
+        conftest.POSTGRES_DSN, min_size=1, max_size=1, observers=[histogram]
+    ) as postgres_pool:
+        await postgres_pool.named_fetch('SELECT id FROM test WHERE id=:id;', {'id': 1})
+        postgres_pool.observers.clear()
+        await postgres_pool.named_fetch('SELECT id FROM test WHERE id=:id;', {'id': 1})
+
+    assert 'asyncpgx_query_duration_seconds_count{fingerprint=' in histogram.render_prometheus()
+    assert ',method="fetch"} 1' in histogram.render_prometheus()
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures('postgres_connection')
+async def test_pool_coalesce_reads() -> None:
+    """Test identical concurrent reads share one execution."""
+    histogram = observers.HistogramObserver()
+    query = 'SELECT pg_sleep(0.05), :id::int AS id;'
+    async with connection_module.create_pool(
+        conftest.POSTGRES_DSN, min_size=1, max_size=2, observers=[histogram], coalesce_reads=True
+    ) as postgres_pool:
+        results = await asyncio.gather(
+            *(postgres_pool.named_fetchval(query, {'id': 1}, column=1) for _ in range(10)),
+            postgres_pool.named_fetchval(query, {'id': 2}, column=1),
+            *(postgres_pool.named_fetchrow_as(_IdRow, 'SELECT :id::int AS id', {'id': 1}) for _ in range(3)),
+        )
+        with pytest.raises(exceptions.MissingRequiredArgumentError):
+            await asyncio.gather(*(postgres_pool.named_fetch(query, {}) for _ in range(2)))
+
+    assert results == [1] * 10 + [2] + [_IdRow(1)] * 3
+    assert histogram.render_prometheus().count('asyncpgx_query_duration_seconds_count') == 2
+    assert ',method="fetchval"} 2' in histogram.render_prometheus()
+    assert ',method="fetchrow"} 1' in histogram.render_prometheus()
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures('postgres_connection')
+async def test_pool_coalesce_reads_writes() -> None:
+    """Test writes and calls with unused arguments are not coalesced."""
+    query = """INSERT INTO test(id, test_1, test_2) VALUES (:id, :value, :value)
+               ON CONFLICT (id) DO UPDATE SET test_1 = test.test_1 || 'x' RETURNING test_1"""
+    async with connection_module.create_pool(
+        conftest.POSTGRES_DSN, min_size=1, max_size=2, coalesce_reads=True
+    ) as postgres_pool:
+        results = await asyncio.gather(
+            *(postgres_pool.named_fetchval(query, {'id': 1, 'value': 'a'}) for _ in range(5))
+        )
+        read_query = 'SELECT pg_sleep(0.05), :id::int AS id;'
+        read_results = await asyncio.gather(
+            postgres_pool.named_fetchval(read_query, {'id': 1}, column=1),
+            postgres_pool.named_fetchval(read_query, {'id': 1, 'other': 2}, column=1),
+            return_exceptions=True,
+        )
+
+        assert sorted(results) == ['a', 'ax', 'axx', 'axxx', 'axxxx']
+        assert await postgres_pool.fetchval('SELECT test_1 FROM test WHERE id = 1') == 'axxxx'
+        assert read_results[0] == 1
+        assert isinstance(read_results[1], exceptions.UnusedArgumentsError)
+
+
+class _IdRow(typing.NamedTuple):
+    id: int  # pylint: disable=invalid-name
+
+
+class _TestRecord(asyncpg.Record):  # pylint: disable=too-few-public-methods
+    pass
+
+
+@pytest.mark.asyncio
+async def test_create_pool_record_class() -> None:
+    """Test `record_class` is passed to the pool."""
+    async with connection_module.create_pool(
+        conftest.POSTGRES_DSN, min_size=1, max_size=1, record_class=_TestRecord
+    ) as pool:
+        assert isinstance(await pool.named_fetchrow('SELECT :value::int AS value', {'value': 1}), _TestRecord)
@@ -1,4 +1,11 @@
 """Tests for `query` module."""
+import dataclasses
+import types
+import typing
+
+import pytest
+
+from asyncpgx import exceptions
 from asyncpgx import query
 
 
@@ -13,6 +20,133 @@ def test_construct_query():
     assert params_order_list == ['id', 'some_field_1', 'some_field_2']
 
 
+@pytest.mark.parametrize(
+    'original_query, expected_query, expected_params',
+    [
+        ('''SELECT :id::int, x::text''', '''SELECT $1::int, x::text''', ['id']),
+        ('''SELECT ':a', "b:c", :d''', '''SELECT ':a', "b:c", $1''', ['d']),
+        ('''SELECT 'it''s :a', E'\\' :b', :c''', '''SELECT 'it''s :a', E'\\' :b', $1''', ['c']),
+        ('''SELECT :a -- :b\n, :c''', '''SELECT $1 -- :b\n, $2''', ['a', 'c']),
+        ('''SELECT /* :a /* :b */ :c */ :d''', '''SELECT /* :a /* :b */ :c */ $1''', ['d']),
+        ('''SELECT $$ :a $$, $fn$ :b $$ $fn$, :c''', '''SELECT $$ :a $$, $fn$ :b $$ $fn$, $1''', ['c']),
+        ('''SELECT arr[1:2], a$b$ :c''', '''SELECT arr[1:2], a$b$ $1''', ['c']),
+        ('''SELECT 'unterminated :a''', '''SELECT 'unterminated :a''', []),
+    ],
+)
+def test_construct_query_skips_literals(original_query, expected_query, expected_params):
+    """Test parameters are found only in the SQL code."""
+    assert query.construct_asyncpg_query(original_query) == (expected_query, expected_params)
+
+
+def test_tokenize_query():
+    """Test tokens of the query."""
+    tokens = list(query.tokenize_query('''SELECT 'a' /* b */ FROM t WHERE c = :c'''))
+
+    assert tokens == [
+        (query.TOKEN_CODE, 'SELECT '),
+        (query.TOKEN_LITERAL, "'a'"),
+        (query.TOKEN_CODE, ' '),
+        (query.TOKEN_COMMENT, '/* b */'),
+        (query.TOKEN_CODE, ' FROM t WHERE c = '),
+        (query.TOKEN_PARAM, 'c'),
+    ]
+
+
+@pytest.mark.parametrize(
+    'original_query, expected_result',
+    [
+        (
+            '''INSERT INTO test (id, "Some Field") VALUES (:id, :some_field);''',
+            (None, 'test', ['id', 'Some Field'], ['id', 'some_field']),
+        ),
+        (
+            '''insert into Public.Test(id) /* comment */ values(:id)''',
+            ('public', 'test', ['id'], ['id']),
+        ),
+        ('''INSERT INTO test (id) VALUES (:id) RETURNING id''', None),
+        ('''INSERT INTO test (id, name) VALUES (:id, lower(:name))''', None),
+        ('''INSERT INTO test (id, name) VALUES (:id, 'name')''', None),
+        ('''INSERT INTO test (id, name) VALUES (:id)''', None),
+    ],
+)
+def test_parse_insert_query(original_query, expected_result):
+    """Test plain insert queries parsing."""
+    insert_query = query.parse_insert_query(original_query)
+
+    if expected_result is None:
+        assert insert_query is None
+    else:
+        assert insert_query is not None
+        assert (
+            insert_query.schema_name,
+            insert_query.table_name,
+            insert_query.columns,
+            insert_query.params_order_list,
+        ) == expected_result
+
+
+def test_construct_unnest_query():
+    """Test rewriting insert query with `unnest`."""
+    unnest_query = query.construct_unnest_query(
+        '''INSERT INTO test (id, name) VALUES (:id, lower(:name || ')')) ON CONFLICT DO NOTHING RETURNING id'''
+    )
+
+    assert unnest_query is not None
+    assert unnest_query.params_order_list == ['id', 'name']
+    assert unnest_query.on_conflict
+    assert not unnest_query.subquery
+    assert unnest_query.render(['int4', 'text']) == (
+        '''INSERT INTO test (id, name) SELECT _asyncpgx_rows."id", lower(_asyncpgx_rows."name" || ')') '''
+        '''FROM unnest($1::int4[], $2::text[]) WITH ORDINALITY AS _asyncpgx_rows("id", "name", _asyncpgx_ordinality) '''
+        '''ORDER BY _asyncpgx_rows._asyncpgx_ordinality ON CONFLICT DO NOTHING RETURNING id'''
+    )
+
+
+@pytest.mark.parametrize(
+    'original_query',
+    [
+        '''INSERT INTO test (id) VALUES (:id), (:other_id)''',
+        '''INSERT INTO test (id) VALUES (:id) ON CONFLICT (id) DO UPDATE SET name = :name''',
+        '''INSERT INTO test (id) VALUES (1)''',
+        '''INSERT INTO test (id, name) VALUES (:id, DEFAULT)''',
+        '''INSERT INTO test (id, name) VALUES (:id, coalesce(:name, default))''',
+        '''UPDATE test SET name = :name''',
+    ],
+)
+def test_construct_unnest_query_unsupported(original_query):
+    """Test queries which couldn't be rewritten with `unnest`."""
+    assert query.construct_unnest_query(original_query) is None
+
+
+@pytest.mark.parametrize(
+    'original_query, expected_subquery',
+    [
+        ('''INSERT INTO test (id, name) VALUES ((SELECT max(id) + 1 FROM test), :name)''', True),
+        ('''INSERT INTO test (id) VALUES (:id) RETURNING id, ( with t AS (SELECT 1) TABLE t)''', True),
+        ('''INSERT INTO test (id, name) VALUES (:id, '(SELECT 1)') RETURNING (id)''', False),
+    ],
+)
+def test_construct_unnest_query_subquery(original_query, expected_subquery):
+    """Test queries with subqueries are marked."""
+    unnest_query = query.construct_unnest_query(original_query)
+
+    assert (unnest_query and unnest_query.subquery) == expected_subquery
+
+
+def test_construct_query_repeated_params():
+    """Test converter construct query with repeated parameters."""
+    original_query = '''SELECT * FROM some_table WHERE a=:id OR b=:id OR c=:other OR d=:id;'''
+
+    assert query.construct_asyncpg_query(original_query) == (
+        '''SELECT * FROM some_table WHERE a=$1 OR b=$2 OR c=$3 OR d=$4;''',
+        ['id', 'id', 'other', 'id'],
+    )
+    assert query.construct_asyncpg_query(original_query, deduplicate_params=True) == (
+        '''SELECT * FROM some_table WHERE a=$1 OR b=$1 OR c=$2 OR d=$1;''',
+        ['id', 'other'],
+    )
+
+
 def test_list_dict_converter_prepare_asyncpg_args():
     """Test `prepare_asyncpg_args` for list dict converter."""
     converter = query.QueryParamsListDictConverter()
@@ -39,3 +173,231 @@ def test_dict_converter_prepare_asyncpg_args():
     )
 
     assert asyncpg_args == ['1', '2', '3']
+
+
+def test_parse_query_uses_cache():
+    """Test `parse_query` translates query once."""
+    query.QUERY_CACHE.clear()
+    original_query = '''SELECT * FROM some_table WHERE id=:id;'''
+
+    first_result = query.parse_query(original_query)
+    second_result = query.parse_query(original_query)
+
+    assert first_result is second_result
+    assert first_result.converted_query == '''SELECT * FROM some_table WHERE id=$1;'''
+    assert first_result.params_order_list == ['id']
+    assert query.QUERY_CACHE.info().hits == 1
+    assert query.QUERY_CACHE.info().misses == 1
+
+
+@pytest.mark.parametrize('params_order_list', [[], ['a'], ['a', 'b', 'c']])
+def test_binder_bind(params_order_list):
+    """Test `bind` for the different number of parameters."""
+    binder = query.QueryParamsBinder(params_order_list)
+
+    asyncpg_args = binder.bind({param: param.upper() for param in params_order_list})
+
+    assert asyncpg_args == tuple(param.upper() for param in params_order_list)
+
+
+def test_binder_bind_errors():
+    """Test `bind` reports missing and unused arguments."""
+    binder = query.QueryParamsBinder(['a', 'b'])
+
+    with pytest.raises(exceptions.MissingRequiredArgumentError):
+        binder.bind({'a': 1})
+    with pytest.raises(exceptions.UnusedArgumentsError):
+        binder.bind({'a': 1, 'b': 2, 'c': 3})
+
+
+def test_binder_bind_trusted():
+    """Test `bind_trusted` ignores unused arguments."""
+    binder = query.QueryParamsBinder(['a', 'b'])
+
+    assert binder.bind_trusted({'a': 1, 'b': 2, 'c': 3}) == (1, 2)
+    assert binder.bind_many([{'a': 1, 'b': 2}, {'a': 3, 'b': 4, 'c': 5}], trusted=True) == [(1, 2), (3, 4)]
+    with pytest.raises(exceptions.MissingRequiredArgumentError):
+        binder.bind_trusted({'a': 1})
+
+
+def test_find_list_params():
+    """Test list parameters are found only after the `IN` operator."""
+    list_params = query.find_list_params(
+        '''SELECT * FROM t WHERE a IN :a AND b NOT in :b AND c IN (:c) AND d = :d AND e = ANY(:a) AND f IN :a;'''
+    )
+
+    assert list_params == ['a', 'b']
+    assert query.find_list_params('''SELECT position('b' IN :s), position(:x IN (:y)) WHERE a IN :a''') == ['a']
+
+
+@pytest.mark.parametrize(
+    'list_params, expected_query, expected_params',
+    [
+        ({'a': 0, 'b': 0}, '''WHERE x = ANY($1) AND y <> ALL($2)''', ['a', 'b']),
+        ({'a': 2, 'b': 0}, '''WHERE x IN ($1, $2) AND y <> ALL($3)''', ['a[0]', 'a[1]', 'b']),
+        (
+            {'a': 1, 'b': 4},
+            '''WHERE x IN ($1) AND y NOT IN ($2, $3, $4, $5)''',
+            ['a[0]', 'b[0]', 'b[1]', 'b[2]', 'b[3]'],
+        ),
+    ],
+)
+def test_construct_query_list_params(list_params, expected_query, expected_params):
+    """Test list parameters rewriting."""
+    new_query, params_order_list = query.construct_asyncpg_query(
+        '''WHERE x IN :a AND y NOT IN :b''', list_params=list_params
+    )
+
+    assert new_query == expected_query
+    assert params_order_list == expected_params
+
+
+@pytest.mark.parametrize('length, expected_size', [(0, 0), (1, 1), (2, 2), (3, 4), (5, 8), (1024, 1024), (1025, 0)])
+def test_get_list_param_size(length, expected_size):
+    """Test lists are expanded to the power of two buckets."""
+    assert query.get_list_param_size(range(length)) == expected_size
+
+
+def test_parse_list_query_expand():
+    """Test expanded list parameters binding and caching per bucket."""
+    original_query = '''SELECT * FROM t WHERE id IN :ids AND x = :x;'''
+
+    parsed_query = query.parse_list_query(original_query, {'ids': [1, 2, 3], 'x': 0}, list_params='expand')
+
+    assert parsed_query.converted_query == '''SELECT * FROM t WHERE id IN ($1, $2, $3, $4) AND x = $5;'''
+    assert parsed_query.binder.bind({'ids': [1, 2, 3], 'x': 0}) == (1, 2, 3, 3, 0)
+    assert parsed_query.binder.bind({'ids': (5,), 'x': 0}) == (5, 5, 5, 5, 0)
+    assert query.parse_list_query(original_query, {'ids': [1, 2, 3, 4], 'x': 0}, list_params='expand') is parsed_query
+    with pytest.raises(exceptions.UnusedArgumentsError):
+        parsed_query.binder.bind({'ids': [1], 'x': 0, 'y': 0})
+    with pytest.raises(exceptions.MissingRequiredArgumentError):
+        parsed_query.binder.bind({'x': 0})
+    with pytest.raises(ValueError):
+        parsed_query.binder.bind({'ids': [1, 2, 3, 4, 5], 'x': 0})
+
+
+def test_parse_list_query_any():
+    """Test list parameters are passed as arrays in the `ANY` mode."""
+    parsed_query = query.parse_list_query('''SELECT * FROM t WHERE id IN :ids;''', {'ids': [1, 2]})
+
+    assert parsed_query.converted_query == '''SELECT * FROM t WHERE id = ANY($1);'''
+    assert parsed_query.binder.bind({'ids': [1, 2]}) == ([1, 2],)
+    with pytest.raises(ValueError):
+        query.parse_list_query('''SELECT 1;''', {}, list_params='unknown')
+
+
+@dataclasses.dataclass
+class _DataclassArgs:
+    a: int  # pylint: disable=invalid-name
+    b: int  # pylint: disable=invalid-name
+    c: typing.List[int] = dataclasses.field(default_factory=list)  # pylint: disable=invalid-name
+
+
+class _NamedTupleArgs(typing.NamedTuple):
+    b: int  # pylint: disable=invalid-name
+    a: int  # pylint: disable=invalid-name
+
+
+# pylint: disable=too-few-public-methods
+class _SlotsArgs:
+    __slots__ = ('a', 'b')
+
+    def __init__(self, a: int, b: int):  # pylint: disable=invalid-name
+        self.a = a  # pylint: disable=invalid-name
+        self.b = b  # pylint: disable=invalid-name
+
+
+@pytest.mark.parametrize(
+    'original_args',
+    [
+        _DataclassArgs(1, 2),
+        _NamedTupleArgs(b=2, a=1),
+        _SlotsArgs(1, 2),
+        types.MappingProxyType({'a': 1, 'b': 2}),
+    ],
+)
+def test_binder_bind_objects(original_args):
+    """Test binding from mappings and objects attributes."""
+    binder = query.QueryParamsBinder(['a', 'b', 'a'])
+
+    assert binder.bind(original_args) == (1, 2, 1)
+    assert binder.bind_trusted(original_args) == (1, 2, 1)
+    assert binder.bind_many([original_args, original_args]) == [(1, 2, 1), (1, 2, 1)]
+
+
+def test_binder_bind_objects_errors():
+    """Test missing attributes are reported."""
+    binder = query.QueryParamsBinder(['a', 'd'])
+
+    with pytest.raises(exceptions.MissingRequiredArgumentError, match='Missing required argument: d'):
+        binder.bind(_DataclassArgs(1, 2))
+    with pytest.raises(exceptions.MissingRequiredArgumentError, match='Missing required argument: d'):
+        binder.bind(_NamedTupleArgs(1, 2))
+
+
+def test_parse_list_query_objects():
+    """Test list parameters are taken from the objects attributes."""
+    original_query = '''SELECT * FROM t WHERE id IN :c AND x = :a;'''
+
+    parsed_query = query.parse_list_query(original_query, _DataclassArgs(1, 2, [5, 6, 7]), list_params='expand')
+
+    assert parsed_query.binder.bind(_DataclassArgs(1, 2, [5, 6, 7])) == (5, 6, 7, 7, 1)
+
+
+@pytest.mark.parametrize(
+    'query_text, expected_result',
+    [
+        ('SELECT * FROM test WHERE id = :id', True),
+        ('  (select 1) UNION (SELECT 2);  ', True),
+        ('WITH t AS (SELECT 1) SELECT * FROM t', True),
+        ("SELECT 'update', \"insert\" FROM test -- FOR UPDATE", True),
+        ('VALUES (1), (2)', True),
+        ('SHOW server_version', True),
+        ('SELECT * FROM test WHERE id = :id FOR UPDATE', False),
+        ('SELECT * FROM test FOR NO KEY UPDATE SKIP LOCKED', False),
+        ('SELECT * FROM test FOR KEY SHARE', False),
+        ('WITH t AS (DELETE FROM test RETURNING id) SELECT * FROM t', False),
+        ('SELECT * INTO test_copy FROM test', False),
+        ("SELECT nextval('test_id_seq')", False),
+        ('SELECT 1; DELETE FROM test', False),
+        ('INSERT INTO test(id) VALUES (:id)', False),
+        ('UPDATE test SET test_1 = :test_1', False),
+        ('CREATE TABLE test_copy (id int)', False),
+        ('EXPLAIN ANALYZE DELETE FROM test', False),
+    ],
+)
+def test_is_read_only_query(query_text, expected_result):
+    """Test classification of the read-only queries."""
+    assert query.is_read_only_query(query_text) is expected_result
+    assert query.parse_query(query_text).read_only is expected_result
+
+
+@pytest.mark.parametrize(
+    'query_text, expected_result',
+    [
+        ('SELECT $1::int -- note', 'SELECT $1::int'),
+        ('SELECT 1; ; -- comment\n/* comment */ ;\n', 'SELECT 1'),
+        ("SELECT ';' -- ;", "SELECT ';'"),
+        ('SELECT :id::int;', 'SELECT :id::int'),
+    ],
+)
+def test_strip_query_end(query_text, expected_result):
+    """Test trailing comments and semicolons are dropped."""
+    assert query.strip_query_end(query_text) == expected_result
+
+
+@pytest.mark.parametrize('list_params', ['any', 'expand'])
+def test_parse_list_query_position(list_params):
+    """Test `IN` of the `POSITION` call and the string values are not
+    treated as the lists."""
+    parsed_query = query.parse_list_query(
+        """SELECT position('b' IN :s) WHERE x IN :ids AND y IN :name""",
+        {'s': 'abc', 'ids': (1, 2), 'name': 'abc'},
+        list_params=list_params,
+    )
+
+    if list_params == 'any':
+        expected_query = """SELECT position('b' IN $1) WHERE x = ANY($2) AND y = ANY($3)"""
+    else:
+        expected_query = """SELECT position('b' IN $1) WHERE x IN ($2, $3) AND y = ANY($4)"""
+    assert parsed_query.converted_query == expected_query
@@ -0,0 +1,81 @@
+"""Tests for `registry` module."""
+import asyncpg
+import pytest
+
+from asyncpgx import connection as connection_module
+from asyncpgx import query as query_module
+from asyncpgx import registry as registry_module
+from asyncpgx.tests import conftest
+
+
+REGISTRY = registry_module.QueryRegistry()
+SELECT_TEST = REGISTRY.define('select_test', 'SELECT id, test_1 FROM test WHERE id = :id')
+SELECT_NUMBER = REGISTRY.define('select_number', 'SELECT :number::int + 1')
+
+
+def test_registry_define():
+    """Test queries definition."""
+    assert isinstance(SELECT_TEST, str)
+    assert SELECT_TEST == 'SELECT id, test_1 FROM test WHERE id = :id'
+    assert SELECT_TEST.name == 'select_test'
+    assert SELECT_TEST.parsed_query.converted_query == 'SELECT id, test_1 FROM test WHERE id = $1'
+    assert REGISTRY['select_test'] is SELECT_TEST
+    assert 'select_number' in REGISTRY
+    assert list(REGISTRY) == [SELECT_TEST, SELECT_NUMBER]
+    assert len(REGISTRY) == 2
+
+    with pytest.raises(ValueError):
+        REGISTRY.define('select_test', 'SELECT 1')
+    with pytest.raises(ValueError):
+        REGISTRY.define('empty', '  ')
+
+
+@pytest.mark.asyncio
+async def test_registered_query_execution(postgres_connection: connection_module.ConnectionX) -> None:
+    """Test registered queries are executed without the query cache."""
+    await postgres_connection.named_execute(
+        'INSERT INTO test(id, test_1) VALUES (:id, :test_1)', {'id': 1, 'test_1': '1'}
+    )
+    query_module.QUERY_CACHE.clear()
+
+    assert await postgres_connection.named_fetchrow(SELECT_TEST, {'id': 1}) == (1, '1')
+    assert await postgres_connection.named_fetchval(SELECT_NUMBER, {'number': 1}) == 2
+    assert not query_module.QUERY_CACHE
+
+    postgres_connection.deduplicate_params = True
+    assert await postgres_connection.named_fetchval(SELECT_NUMBER, {'number': 2}) == 3
+    assert len(query_module.QUERY_CACHE) == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures('postgres_connection')
+async def test_pool_warmup() -> None:
+    """Test registered queries are prepared on the new pool connections."""
+    async with connection_module.create_pool(
+        conftest.POSTGRES_DSN, min_size=2, max_size=2, registry=REGISTRY, warmup_timeout=10
+    ) as postgres_pool:
+        async with postgres_pool.acquire() as connection:
+            prepared_statements = await connection.fetch('SELECT statement FROM pg_prepared_statements')
+            assert {row['statement'] for row in prepared_statements} >= {
+                SELECT_TEST.parsed_query.converted_query,
+                SELECT_NUMBER.parsed_query.converted_query,
+            }
+            assert await connection.named_warmup(REGISTRY, timeout=0) == 0
+            assert await connection.named_warmup(REGISTRY) == 2
+            assert await connection.named_fetchval(SELECT_NUMBER, {'number': 1}) == 2
+
+
+@pytest.mark.asyncio
+async def test_pool_warmup_invalid_query() -> None:
+    """Test queries which couldn't be prepared are skipped."""
+    registry = registry_module.QueryRegistry()
+    registry.define('missing_table', 'SELECT * FROM missing_table WHERE id = :id')
+    select_number = registry.define('select_number', 'SELECT :number::int + 1')
+    async with connection_module.create_pool(
+        conftest.POSTGRES_DSN, min_size=1, max_size=1, registry=registry
+    ) as postgres_pool:
+        async with postgres_pool.acquire() as connection:
+            assert await connection.named_warmup(registry) == 1
+        assert await postgres_pool.named_fetchval(select_number, {'number': 1}) == 2
+        with pytest.raises(asyncpg.UndefinedTableError):
+            await postgres_pool.named_fetch(registry['missing_table'], {'id': 1})
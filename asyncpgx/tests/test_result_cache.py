@@ -0,0 +1,131 @@
+"""Tests for `result_cache` module."""
+import asyncio
+
+import pytest
+
+from asyncpgx import connection as connection_module
+from asyncpgx import exceptions
+from asyncpgx import result_cache as result_cache_module
+from asyncpgx.tests import conftest
+
+
+SELECT_QUERY = 'SELECT test_1 FROM test WHERE id = :id'
+COUNT_QUERY = 'SELECT count(*) FROM test WHERE id = ANY(:ids)'
+
+
+@pytest.mark.asyncio
+async def test_result_cache(postgres_connection):
+    """Test cached reads are served from the cache until their tables are
+    invalidated."""
+    await postgres_connection.execute('''INSERT INTO test VALUES (1, 'first', 'first')''')
+    result_cache = result_cache_module.ResultCache(maxsize=2)
+    result_cache.cache_query(SELECT_QUERY, tables=['test'])
+    result_cache.cache_query(COUNT_QUERY, tables=['test'])
+    pool = await connection_module.create_pool(conftest.POSTGRES_DSN, min_size=1, max_size=1, result_cache=result_cache)
+    try:
+        assert await pool.named_fetchval(SELECT_QUERY, {'id': 1}) == 'first'
+        await postgres_connection.execute('''UPDATE test SET test_1 = 'second' WHERE id = 1''')
+        assert await pool.named_fetchval(SELECT_QUERY, {'id': 1}) == 'first'
+        # arguments are checked on hits the same way as on misses
+        with pytest.raises(exceptions.UnusedArgumentsError):
+            await pool.named_fetchval(SELECT_QUERY, {'id': 1, 'other': 1})
+        assert (await pool.named_fetchrow(SELECT_QUERY, {'id': 1}))['test_1'] == 'second'
+        # not cached queries and unhashable arguments are not cached
+        assert await pool.named_fetchval('SELECT test_1 FROM test WHERE id = :id ', {'id': 1}) == 'second'
+        assert await pool.named_fetchval(COUNT_QUERY, {'ids': [1]}) == 1
+
+        result_cache.invalidate('other')
+        assert await pool.named_fetchval(SELECT_QUERY, {'id': 1}) == 'first'
+        result_cache.invalidate('test')
+        assert await pool.named_fetchval(SELECT_QUERY, {'id': 1}) == 'second'
+
+        info = result_cache.info()
+        assert (info.hits, info.misses, info.invalidations, info.currsize, info.maxsize) == (2, 3, 1, 2, 2)
+        assert await pool.named_fetchval(SELECT_QUERY, {'id': 2}) is None
+        assert result_cache.info().evictions == 1
+
+        result_cache.clear()
+        assert result_cache.info() == result_cache_module.ResultCacheInfo(0, 0, 0, 0, 0, 2, 0)
+    finally:
+        await pool.close()
+
+    with pytest.raises(ValueError):
+        result_cache.cache_query('DELETE FROM test')
+
+
+@pytest.mark.asyncio
+async def test_result_cache_ttl(postgres_pool):
+    """Test cached results are dropped after their TTL."""
+    result_cache = result_cache_module.ResultCache()
+    result_cache.cache_query('SELECT clock_timestamp()', ttl=0.05)
+    result_cache.cache_query('SELECT clock_timestamp() + :delta::interval')
+    calls = []
+
+    async def _call():
+        calls.append(None)
+        return await postgres_pool.named_fetchval('SELECT clock_timestamp()', {})
+
+    first_value = await result_cache.fetch(('fetchval', 0), 'SELECT clock_timestamp()', {}, _call)
+    assert await result_cache.fetch(('fetchval', 0), 'SELECT clock_timestamp()', {}, _call) == first_value
+    await asyncio.sleep(0.06)
+    assert await result_cache.fetch(('fetchval', 0), 'SELECT clock_timestamp()', {}, _call) != first_value
+    assert len(calls) == 2
+    assert result_cache.info().expirations == 1
+    assert 'SELECT clock_timestamp() + :delta::interval' in result_cache
+    assert 'SELECT 1' not in result_cache
+
+
+@pytest.mark.asyncio
+async def test_result_cache_listen(postgres_connection):
+    """Test tables are invalidated by the notifications."""
+    result_cache = result_cache_module.ResultCache()
+    result_cache.cache_query(SELECT_QUERY, tables=['test'])
+    listener = await connection_module.connect(conftest.POSTGRES_DSN)
+    await result_cache.listen(listener)
+    with pytest.raises(RuntimeError):
+        await result_cache.listen(listener)
+
+    pool = await connection_module.create_pool(conftest.POSTGRES_DSN, min_size=1, max_size=1, result_cache=result_cache)
+    try:
+        await postgres_connection.execute('''INSERT INTO test VALUES (1, 'first', 'first')''')
+        assert await pool.named_fetchval(SELECT_QUERY, {'id': 1}) == 'first'
+
+        async with postgres_connection.transaction():
+            await postgres_connection.execute('''UPDATE test SET test_1 = 'second' WHERE id = 1''')
+            await result_cache_module.notify_invalidation(postgres_connection, ['other', 'test'])
+            await asyncio.sleep(0.05)
+            # notification is delivered on commit
+            assert await pool.named_fetchval(SELECT_QUERY, {'id': 1}) == 'first'
+        await asyncio.sleep(0.05)
+        assert await pool.named_fetchval(SELECT_QUERY, {'id': 1}) == 'second'
+
+        await postgres_connection.execute('''UPDATE test SET test_1 = 'third' WHERE id = 1''')
+        await result_cache_module.notify_invalidation(postgres_connection)
+        await asyncio.sleep(0.05)
+        assert await pool.named_fetchval(SELECT_QUERY, {'id': 1}) == 'third'
+        assert result_cache.info().invalidations == 2
+
+        await result_cache.unlisten()
+        await postgres_connection.execute('''UPDATE test SET test_1 = 'fourth' WHERE id = 1''')
+        await result_cache_module.notify_invalidation(postgres_connection, ['test'])
+        await asyncio.sleep(0.05)
+        assert await pool.named_fetchval(SELECT_QUERY, {'id': 1}) == 'third'
+
+        # results are dropped and the cache is bypassed while the listener connection is lost
+        await result_cache.listen(listener)
+        await listener.close()
+        await asyncio.sleep(0)
+        assert await pool.named_fetchval(SELECT_QUERY, {'id': 1}) == 'fourth'
+        await postgres_connection.execute('''UPDATE test SET test_1 = 'fifth' WHERE id = 1''')
+        assert await pool.named_fetchval(SELECT_QUERY, {'id': 1}) == 'fifth'
+        hits = result_cache.info().hits
+
+        listener = await connection_module.connect(conftest.POSTGRES_DSN)
+        await result_cache.listen(listener)
+        assert await pool.named_fetchval(SELECT_QUERY, {'id': 1}) == 'fifth'
+        assert await pool.named_fetchval(SELECT_QUERY, {'id': 1}) == 'fifth'
+        assert result_cache.info().hits == hits + 1
+        await result_cache.unlisten()
+    finally:
+        await pool.close()
+        await listener.close()
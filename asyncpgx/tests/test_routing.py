@@ -0,0 +1,93 @@
+"""Tests for `routing` module."""
+import asyncio
+import io
+import typing
+
+import pytest
+
+from asyncpgx import connection as connection_module
+from asyncpgx import observers
+from asyncpgx import routing
+from asyncpgx.tests import conftest
+
+
+# pylint: disable=too-few-public-methods
+class _MethodsCollector(observers.QueryObserver):
+    def __init__(self) -> None:
+        self.methods: typing.List[str] = []
+
+    def on_query(self, event: observers.QueryEvent) -> None:
+        self.methods.append(event.method)
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures('postgres_connection')
+async def test_routing_pool() -> None:
+    """Test queries are routed by the statement type."""
+    async with connection_module.create_routing_pool(
+        conftest.POSTGRES_DSN, [conftest.POSTGRES_DSN] * 2, min_size=1, max_size=2
+    ) as routing_pool:
+        collectors = [_MethodsCollector() for _ in range(3)]
+        for pool, collector in zip([routing_pool.primary, *routing_pool.replicas], collectors):
+            pool.observers.append(collector)
+
+        await routing_pool.named_execute(
+            'INSERT INTO test(id, test_1) VALUES (:id, :test_1);', {'id': 1, 'test_1': '1'}
+        )
+        await routing_pool.named_executemany('INSERT INTO test(id) VALUES (:id);', [{'id': 2}])
+        assert await routing_pool.named_fetchval('SELECT test_1 FROM test WHERE id = :id', {'id': 1}) == '1'
+        assert await routing_pool.named_fetchrow('SELECT id FROM test WHERE id = :id', {'id': 2}) == (2,)
+        assert [tuple(row) for row in await routing_pool.named_fetch('SELECT id FROM test', {})] == [(1,), (2,)]
+        assert await routing_pool.named_fetchrow('SELECT id FROM test WHERE id = :id FOR UPDATE', {'id': 2}) == (2,)
+        assert await routing_pool.named_fetch('SELECT id FROM test', {}, route=routing.ROUTE_PRIMARY)
+
+        assert collectors[0].methods == ['execute', 'executemany', 'fetchrow', 'fetch']
+        assert sorted(collectors[1].methods + collectors[2].methods) == ['fetch', 'fetchrow', 'fetchval']
+        assert collectors[1].methods and collectors[2].methods
+
+        for collector in collectors:
+            collector.methods.clear()
+        await asyncio.gather(*(routing_pool.named_fetchval('SELECT pg_sleep(0.05)', {}) for _ in range(4)))
+        assert collectors[1].methods == collectors[2].methods == ['fetchval'] * 2
+
+        output = io.BytesIO()
+        assert (
+            await routing_pool.named_copy_from_query('SELECT id FROM test ORDER BY id', {}, output=output) == 'COPY 2'
+        )
+        assert output.getvalue() == b'1\n2\n'
+
+        with pytest.raises(ValueError):
+            await routing_pool.named_fetch('SELECT 1', {}, route='other')
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures('postgres_connection')
+async def test_routing_pool_read_your_writes() -> None:
+    """Test queries are routed to the primary inside the transaction and
+    `use_primary`."""
+    async with connection_module.create_routing_pool(
+        conftest.POSTGRES_DSN, [conftest.POSTGRES_DSN], min_size=1, max_size=1
+    ) as routing_pool:
+        query = 'SELECT id FROM test WHERE id = :id'
+        with routing_pool.use_primary():
+            assert routing_pool.get_route(query) == routing.ROUTE_PRIMARY
+        assert routing_pool.get_route(query) == routing.ROUTE_REPLICA
+        assert routing_pool.get_route(query, routing.ROUTE_PRIMARY) == routing.ROUTE_PRIMARY
+
+        async with routing_pool.transaction() as connection:
+            await routing_pool.named_execute('INSERT INTO test(id) VALUES (:id);', {'id': 1})
+            assert routing_pool.get_route(query, routing.ROUTE_REPLICA) == routing.ROUTE_PRIMARY
+            assert await routing_pool.named_fetchval(query, {'id': 1}) == 1
+            with pytest.raises(RuntimeError):
+                async with routing_pool.transaction() as nested_connection:
+                    assert nested_connection is connection
+                    await routing_pool.named_execute('INSERT INTO test(id) VALUES (:id);', {'id': 2})
+                    raise RuntimeError
+            assert await routing_pool.named_fetchval('SELECT count(*) FROM test', {}) == 1
+            assert await routing_pool.replicas[0].named_fetchval(query, {'id': 1}) is None
+
+        assert await routing_pool.named_fetchval(query, {'id': 1}) == 1
+
+    async with routing.RoutingPool(connection_module.create_pool(conftest.POSTGRES_DSN, min_size=1)) as routing_pool:
+        assert routing_pool.get_route(query) == routing.ROUTE_PRIMARY
+        assert await routing_pool.named_fetchval(query, {'id': 1}) == 1
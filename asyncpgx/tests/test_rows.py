@@ -0,0 +1,108 @@
+"""Tests for `rows` module."""
+import dataclasses
+import sys
+import typing
+
+import pytest
+
+from asyncpgx import exceptions
+from asyncpgx import rows
+
+
+@dataclasses.dataclass
+class _DataclassModel:
+    id: int  # pylint: disable=invalid-name
+    name: str
+    status: str = 'new'
+
+
+class _NamedTupleModel(typing.NamedTuple):
+    id: int  # pylint: disable=invalid-name
+    name: str = ''
+
+
+# pylint: disable=too-few-public-methods
+class _SlotsModel:
+    __slots__ = ('id', 'name')
+
+
+class _Record(tuple):
+    """Minimal record stand-in supporting iteration and access by index."""
+
+
+@pytest.mark.parametrize(
+    'columns, values, expected_instance',
+    [
+        (('id', 'name', 'status'), (1, 'a', 'done'), _DataclassModel(1, 'a', 'done')),
+        (('name', 'status', 'id'), ('a', 'done', 1), _DataclassModel(1, 'a', 'done')),
+        (('name', 'id'), ('a', 1), _DataclassModel(1, 'a')),
+    ],
+)
+def test_dataclass_factory(columns, values, expected_instance):
+    """Test dataclass rows mapping with different columns orders and
+    defaults."""
+    row_factory = rows.compile_row_factory(_DataclassModel, columns)
+
+    assert row_factory(_Record(values)) == expected_instance
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason='kw_only dataclasses require Python 3.10')
+@pytest.mark.parametrize(
+    'columns, values, expected_kwargs',
+    [
+        (('id', 'name'), (1, 'a'), {'id': 1, 'name': 'a'}),
+        (('name', 'id'), ('a', 1), {'id': 1, 'name': 'a'}),
+        (('id',), (1,), {'id': 1}),
+    ],
+)
+def test_keyword_only_dataclass_factory(columns, values, expected_kwargs):
+    """Test keyword-only dataclass fields are passed by keyword."""
+
+    @dataclasses.dataclass(kw_only=True)  # type: ignore[call-overload]  # pylint: disable=unexpected-keyword-arg
+    class _KeywordOnlyModel:
+        id: int  # pylint: disable=invalid-name
+        name: str = ''
+
+    row_factory = rows.compile_row_factory(_KeywordOnlyModel, columns)
+
+    assert row_factory(_Record(values)) == _KeywordOnlyModel(**expected_kwargs)
+
+
+def test_named_tuple_and_slots_factories():
+    """Test named tuple and `__slots__` rows mapping."""
+    named_tuple_factory = rows.compile_row_factory(_NamedTupleModel, ('name', 'id'))
+    default_factory = rows.compile_row_factory(_NamedTupleModel, ('id',))
+    slots_factory = rows.compile_row_factory(_SlotsModel, ('name', 'id'))
+
+    slots_instance = slots_factory(_Record(('a', 1)))
+
+    assert named_tuple_factory(_Record(('a', 1))) == _NamedTupleModel(1, 'a')
+    assert default_factory(_Record((1,))) == _NamedTupleModel(1)
+    assert (slots_instance.id, slots_instance.name) == (1, 'a')
+
+
+@pytest.mark.parametrize(
+    'model, columns',
+    [
+        (_DataclassModel, ('id',)),
+        (_DataclassModel, ('id', 'name', 'unknown')),
+        (_DataclassModel, ('id', 'name', 'name')),
+        (_SlotsModel, ('id',)),
+        (dict, ('id',)),
+    ],
+)
+def test_factory_errors(model, columns):
+    """Test columns which couldn't be mapped to the model are reported."""
+    with pytest.raises(exceptions.RowMappingError):
+        rows.compile_row_factory(model, columns)
+
+
+def test_get_row_factory_uses_cache():
+    """Test row factory is compiled once per model and columns."""
+    rows.ROW_FACTORIES.clear()
+
+    first_factory = rows.get_row_factory(_NamedTupleModel, ['id', 'name'])
+    second_factory = rows.get_row_factory(_NamedTupleModel, ('id', 'name'))
+
+    assert first_factory is second_factory
+    assert rows.ROW_FACTORIES.info().misses == 1
@@ -0,0 +1,80 @@
+"""Tests for `singleflight` module."""
+import asyncio
+import typing
+
+import pytest
+
+from asyncpgx import singleflight
+
+
+@pytest.mark.asyncio
+async def test_single_flight_shares_call():
+    """Test concurrent calls with the same key share one execution."""
+    single_flight = singleflight.SingleFlight()
+    calls: typing.List[str] = []
+
+    async def _function(key: str) -> str:
+        calls.append(key)
+        await asyncio.sleep(0.01)
+        return key.upper()
+
+    results = await asyncio.gather(
+        *(single_flight.do(key, lambda key=key: _function(key)) for key in ['a', 'a', 'b', 'a'])
+    )
+
+    assert results == ['A', 'A', 'B', 'A']
+    assert calls == ['a', 'b']
+    assert not single_flight
+    assert await single_flight.do('a', lambda: _function('a')) == 'A'
+    assert calls == ['a', 'b', 'a']
+
+
+@pytest.mark.asyncio
+async def test_single_flight_error():
+    """Test every waiter receives the error."""
+    single_flight = singleflight.SingleFlight()
+
+    async def _function() -> None:
+        await asyncio.sleep(0.01)
+        raise ValueError('error')
+
+    results = await asyncio.gather(*(single_flight.do('a', _function) for _ in range(3)), return_exceptions=True)
+
+    assert [type(result) for result in results] == [ValueError] * 3
+
+
+@pytest.mark.asyncio
+async def test_single_flight_cancellation():
+    """Test cancellation of the waiter doesn't affect the other ones and
+    the execution is cancelled with the last waiter."""
+    single_flight = singleflight.SingleFlight()
+    event = asyncio.Event()
+    cancelled = []
+
+    async def _function() -> int:
+        try:
+            await event.wait()
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+        return 1
+
+    first_waiter = asyncio.ensure_future(single_flight.do('a', _function))
+    second_waiter = asyncio.ensure_future(single_flight.do('a', _function))
+    await asyncio.sleep(0)
+    first_waiter.cancel()
+    await asyncio.sleep(0)
+    event.set()
+
+    assert await second_waiter == 1
+    assert first_waiter.cancelled()
+    assert not cancelled
+
+    event.clear()
+    waiter = asyncio.ensure_future(single_flight.do('a', _function))
+    await asyncio.sleep(0)
+    waiter.cancel()
+    await asyncio.sleep(0.01)
+
+    assert cancelled == [True]
+    assert not single_flight
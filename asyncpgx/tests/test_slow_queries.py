@@ -0,0 +1,70 @@
+"""Tests for `slow_queries` module."""
+import typing
+
+import pytest
+
+from asyncpgx import connection as connection_module
+from asyncpgx import slow_queries
+from asyncpgx.tests import conftest
+
+
+class _Arguments(typing.NamedTuple):
+    id: int  # pylint: disable=invalid-name
+    name: typing.Optional[str]
+
+
+def test_get_params_shapes():
+    """Test parameters values are described without the values."""
+    query = 'SELECT * FROM test WHERE id = :id OR id = :id AND test_1 = :name'
+
+    assert slow_queries.get_params_shapes(query, {'id': 1, 'ids': [1, 2, 3], 'name': 'name'}) == {
+        'id': 'int',
+        'ids': 'list[3]',
+        'name': 'str[4]',
+    }
+    assert slow_queries.get_params_shapes(query, _Arguments(1, None)) == {'id': 'int', 'name': 'NoneType'}
+    assert not slow_queries.get_params_shapes(query, None)
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures('postgres_connection')
+async def test_slow_queries_sampler() -> None:
+    """Test slow queries are kept with their plans."""
+    query = 'SELECT id FROM test WHERE id = :id'
+    async with connection_module.create_pool(conftest.POSTGRES_DSN, min_size=1, max_size=2) as postgres_pool:
+        sampler = slow_queries.SlowQueriesSampler(postgres_pool, threshold=0, capacity=3)
+        postgres_pool.observers.append(sampler)
+
+        await postgres_pool.named_fetch(query, {'id': 1})
+        await sampler.wait_explain()
+        await postgres_pool.named_fetch(query, {'id': 2})
+        await sampler.wait_explain()
+        await postgres_pool.named_fetchval('SHOW server_version', {})
+        await sampler.wait_explain()
+        first_sample, second_sample, third_sample = sampler.samples()
+
+        assert first_sample.query == query
+        assert first_sample.method == 'fetch'
+        assert first_sample.params == {'id': 'int'}
+        assert first_sample.duration > 0
+        assert first_sample.plan[0]['Plan']['Relation Name'] == 'test'
+        assert first_sample.explain_error is None
+        assert second_sample.plan is None
+        assert third_sample.plan is None
+        assert third_sample.explain_error and third_sample.explain_error.startswith('PostgresSyntaxError')
+        assert sampler.samples(first_sample.fingerprint) == [first_sample, second_sample]
+
+        with pytest.raises(Exception):
+            await postgres_pool.named_fetch('SELECT * FROM missing_table', {})
+        assert sampler.samples()[-1].query == 'SELECT * FROM missing_table'
+        assert sampler.samples()[0] is second_sample
+
+        sampler.clear()
+        sampler.sample_rate = 0
+        await postgres_pool.named_fetch(query, {'id': 1})
+        await sampler.wait_explain()
+        assert [sample.plan for sample in sampler.samples()] == [None]
+
+        sampler.threshold = 10
+        await postgres_pool.named_fetch(query, {'id': 1})
+        assert len(sampler.samples()) == 1
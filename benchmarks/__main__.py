@@ -0,0 +1,46 @@
+"""Run all the benchmarks.
+
+Usage: `python -m benchmarks [--output results.json] [--label 1.5.0] [--dsn DSN] [--skip-connection]`
+"""
+import argparse
+import typing
+
+from benchmarks import bench_bind
+from benchmarks import bench_connection
+from benchmarks import bench_query
+from benchmarks import common
+
+
+def print_overhead(results: typing.Iterable[common.BenchmarkResult]) -> None:
+    """Print overhead of the named methods over the raw asyncpg ones."""
+    raw_timings = {
+        result.case: result.seconds
+        for result in results
+        if result.group == 'connection' and result.implementation == 'raw asyncpg'
+    }
+    for result in results:
+        if result.group == 'connection' and result.implementation == 'named':
+            print(f'overhead {result.case:>28}: {(result.seconds / raw_timings[result.case] - 1) * 100:+7.2f} %')
+
+
+def main() -> None:
+    """Run the benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--output', help='path of the JSON file to write results to')
+    parser.add_argument('--label', help='label of the results, i.e. release version')
+    parser.add_argument('--dsn', default=bench_connection.POSTGRES_DSN, help='PostgreSQL DSN')
+    parser.add_argument('--skip-connection', action='store_true', help='skip benchmarks which require PostgreSQL')
+    arguments = parser.parse_args()
+
+    results = bench_query.collect() + bench_bind.collect()
+    if not arguments.skip_connection:
+        results += common.run(bench_connection.collect_async(arguments.dsn))
+
+    common.print_results(results)
+    print_overhead(results)
+    if arguments.output:
+        common.write_results(results, arguments.output, arguments.label)
+
+
+if __name__ == '__main__':
+    main()
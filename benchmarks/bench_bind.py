@@ -0,0 +1,50 @@
+"""Benchmark conversion of the named arguments to the positional ones.
+
+Usage: `python -m benchmarks.bench_bind`
+"""
+import typing
+
+from asyncpgx import query
+from benchmarks import common
+
+
+PARAMS_ORDER_LIST = [f'param_{i}' for i in range(10)]
+ROW = {param: index for index, param in enumerate(PARAMS_ORDER_LIST)}
+BATCH_SIZES = (1, 100, 10000)
+
+
+def collect() -> typing.List[common.BenchmarkResult]:
+    """Run the benchmark and return its results."""
+    binder = query.QueryParamsBinder(PARAMS_ORDER_LIST)
+    dict_converter = query.QueryParamsDictConverter()
+    list_dict_converter = query.QueryParamsListDictConverter()
+
+    results = []
+    for implementation_name, implementation in [
+        ('dict converter', lambda: dict_converter.prepare_asyncpg_args(ROW, PARAMS_ORDER_LIST)),
+        ('binder', lambda: binder.bind(ROW)),
+        ('binder (trusted)', lambda: binder.bind_trusted(ROW)),
+    ]:
+        seconds, number = common.measure(implementation)
+        results.append(common.BenchmarkResult('bind', 'single row', implementation_name, seconds, number))
+
+    for batch_size in BATCH_SIZES:
+        rows = [ROW] * batch_size
+        # pylint: disable=cell-var-from-loop
+        for implementation_name, implementation in [
+            ('list dict converter', lambda: list_dict_converter.prepare_asyncpg_args(rows, PARAMS_ORDER_LIST)),
+            ('binder', lambda: binder.bind_many(rows)),
+            ('binder (trusted)', lambda: binder.bind_many(rows, trusted=True)),
+        ]:
+            seconds, number = common.measure(implementation)
+            results.append(common.BenchmarkResult('bind', f'{batch_size} rows', implementation_name, seconds, number))
+    return results
+
+
+def main() -> None:
+    """Run the benchmark."""
+    common.print_results(collect())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+"""Benchmark named connection methods against the raw asyncpg ones.
+
+Requires PostgreSQL, DSN is taken from the `POSTGRES_BENCH_DSN`
+environment variable (`postgresql://127.0.0.1:5432` by default).
+
+Usage: `python -m benchmarks.bench_connection`
+"""
+import os
+import typing
+
+import asyncpgx
+from benchmarks import common
+
+
+POSTGRES_DSN = os.getenv('POSTGRES_BENCH_DSN', 'postgresql://127.0.0.1:5432')
+FETCH_SIZES = (1, 100, 1000)
+EXECUTEMANY_SIZES = (10, 1000)
+# number of calls per measurement for the every fetched (or inserted) rows number
+CALLS_NUMBERS = {1: 1000, 10: 200, 100: 200, 1000: 20}
+
+FETCH_QUERY = 'SELECT id, name, value FROM asyncpgx_bench WHERE id <= :limit AND value >= :min_value'
+RAW_FETCH_QUERY = 'SELECT id, name, value FROM asyncpgx_bench WHERE id <= $1 AND value >= $2'
+INSERT_QUERY = 'INSERT INTO asyncpgx_bench_insert (id, name, value) VALUES (:id, :name, :value)'
+RAW_INSERT_QUERY = 'INSERT INTO asyncpgx_bench_insert (id, name, value) VALUES ($1, $2, $3)'
+
+
+async def collect_async(dsn: str = POSTGRES_DSN) -> typing.List[common.BenchmarkResult]:
+    """Run the benchmark and return its results."""
+    connection: asyncpgx.ConnectionX = await asyncpgx.connect(dsn)
+    try:
+        await connection.execute(
+            '''
+            CREATE TEMPORARY TABLE asyncpgx_bench (id int PRIMARY KEY, name text, value float8);
+            CREATE TEMPORARY TABLE asyncpgx_bench_insert (id int, name text, value float8);
+            INSERT INTO asyncpgx_bench SELECT i, 'name ' || i, i FROM generate_series(1, 1000) AS i;
+            '''
+        )
+        results = []
+        for rows_number in FETCH_SIZES:
+            named_args = {'limit': rows_number, 'min_value': 0}
+            # pylint: disable=cell-var-from-loop
+            results += await _measure_implementations(
+                f'fetch {rows_number} rows',
+                CALLS_NUMBERS[rows_number],
+                raw=lambda: connection.fetch(RAW_FETCH_QUERY, rows_number, 0),
+                named=lambda: connection.named_fetch(FETCH_QUERY, named_args),
+            )
+
+        for rows_number in EXECUTEMANY_SIZES:
+            named_rows = [{'id': i, 'name': f'name {i}', 'value': i} for i in range(rows_number)]
+            raw_rows = [(i, f'name {i}', i) for i in range(rows_number)]
+            # pylint: disable=cell-var-from-loop
+            results += await _measure_implementations(
+                f'executemany {rows_number} rows',
+                CALLS_NUMBERS[rows_number],
+                raw=lambda: connection.executemany(RAW_INSERT_QUERY, raw_rows),
+                named=lambda: connection.named_executemany(INSERT_QUERY, named_rows),
+            )
+        return results
+    finally:
+        await connection.close()
+
+
+async def _measure_implementations(
+    case: str,
+    number: int,
+    raw: typing.Callable[[], typing.Awaitable[typing.Any]],
+    named: typing.Callable[[], typing.Awaitable[typing.Any]],
+) -> typing.List[common.BenchmarkResult]:
+    raw_seconds, named_seconds = await common.measure_async([raw, named], number)
+    return [
+        common.BenchmarkResult('connection', case, 'raw asyncpg', raw_seconds, number),
+        common.BenchmarkResult('connection', case, 'named', named_seconds, number),
+    ]
+
+
+def collect() -> typing.List[common.BenchmarkResult]:
+    """Run the benchmark and return its results."""
+    return common.run(collect_async())
+
+
+def main() -> None:
+    """Run the benchmark."""
+    common.print_results(collect())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+"""Benchmark named query translation against the legacy regexp-based
+one.
+
+Usage: `python -m benchmarks.bench_query`
+"""
+import re
+import typing
+
+from asyncpgx import query
+from benchmarks import common
+
+
+LEGACY_PARAMS_REGEXP = re.compile(r"(?<![:\w\x5c]):(\w+)(?!:)", re.UNICODE)
+
+SHORT_QUERY = 'SELECT id, name FROM users WHERE id = :id AND status = :status'
+LONG_QUERY = '\n'.join(
+    [
+        f"SELECT col_{i}::text, 'literal {i}' AS lit_{i} FROM table_{i} WHERE a_{i} = :param_{i} -- comment {i}"
+        for i in range(200)
+    ]
+)
+MANY_PARAMS_QUERY = f"INSERT INTO t VALUES ({', '.join(f':param_{i}' for i in range(1000))})"
+
+
+def legacy_construct_asyncpg_query(original_query: str) -> typing.Tuple[str, typing.List]:
+    """Translation implementation prior to the lexer."""
+    params_order_list = []
+
+    def _construct_replacement(match_obj: typing.Match) -> str:
+        params_order_list.append(match_obj.group(1))
+        return f'${len(params_order_list)}'
+
+    return LEGACY_PARAMS_REGEXP.sub(_construct_replacement, original_query), params_order_list
+
+
+def collect() -> typing.List[common.BenchmarkResult]:
+    """Run the benchmark and return its results."""
+    results = []
+    for name, original_query in [('short', SHORT_QUERY), ('long', LONG_QUERY), ('many params', MANY_PARAMS_QUERY)]:
+        implementations: typing.List[typing.Tuple[str, typing.Callable[[str], typing.Any]]] = [
+            ('regexp', legacy_construct_asyncpg_query),
+            ('lexer', query.construct_asyncpg_query),
+        ]
+        for implementation_name, implementation in implementations:
+            # pylint: disable=cell-var-from-loop
+            seconds, number = common.measure(lambda: implementation(original_query))
+            results.append(
+                common.BenchmarkResult(
+                    'query', f'{name} ({len(original_query)} chars)', implementation_name, seconds, number
+                )
+            )
+    return results
+
+
+def main() -> None:
+    """Run the benchmark."""
+    common.print_results(collect())
+
+
+if __name__ == '__main__':
+    main()
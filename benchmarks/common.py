@@ -0,0 +1,86 @@
+"""Common tools of the benchmarks."""
+import asyncio
+import datetime
+import json
+import platform
+import time
+import timeit
+import typing
+
+import asyncpg
+
+
+REPEAT = 5
+T = typing.TypeVar('T')
+
+
+class BenchmarkResult(typing.NamedTuple):
+    """Result of the single benchmark case."""
+
+    #: benchmark group, like `query` or `connection`
+    group: str
+    #: case name, like `short` or `fetch 100 rows`
+    case: str
+    #: implementation name, like `lexer` or `raw asyncpg`
+    implementation: str
+    #: best time of the single call in seconds
+    seconds: float
+    #: number of calls in the every measurement
+    number: int
+
+
+def measure(function: typing.Callable[[], typing.Any]) -> typing.Tuple[float, int]:
+    """Return best time of the single synchronous call in seconds and
+    number of calls per measurement."""
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=REPEAT, number=number)) / number, number
+
+
+async def measure_async(
+    functions: typing.Sequence[typing.Callable[[], typing.Awaitable[typing.Any]]], number: int
+) -> typing.List[float]:
+    """Return best time of the single asynchronous call in seconds for the
+    every function.
+
+    Functions are measured in the interleaved rounds, so the server
+    state changes affect all of them equally.
+    """
+    for function in functions:
+        await function()  # warm up the statement caches
+    timings: typing.List[typing.List[float]] = [[] for _ in functions]
+    for _ in range(REPEAT):
+        for function, function_timings in zip(functions, timings):
+            started = time.perf_counter()
+            for _ in range(number):
+                await function()
+            function_timings.append((time.perf_counter() - started) / number)
+    return [min(function_timings) for function_timings in timings]
+
+
+def print_results(results: typing.Iterable[BenchmarkResult]) -> None:
+    """Print results as a table."""
+    for result in results:
+        print(
+            f'{result.group:>10} {result.case:>28} {result.implementation:>22}: {result.seconds * 1e6:12.2f} us'
+            f' (x{result.number})'
+        )
+
+
+def write_results(results: typing.Iterable[BenchmarkResult], path: str, label: typing.Optional[str] = None) -> None:
+    """Write results with the environment description to the JSON file."""
+    report = {
+        'label': label,
+        'created_at': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'asyncpg': asyncpg.__version__,
+        'results': [result._asdict() for result in results],
+    }
+    with open(path, 'w', encoding='utf-8') as report_file:
+        json.dump(report, report_file, indent=2)
+
+
+def run(coroutine: typing.Coroutine[typing.Any, typing.Any, T]) -> T:
+    """Run the asynchronous benchmarks."""
+    return asyncio.run(coroutine)